@@ -5,21 +5,33 @@ Realistic implementation without false YouTube streaming claims
 """
 
 import os
+import atexit
+import hashlib
 import logging
 import threading
+import time
 import traceback
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify, send_file, stream_with_context
 from flask_cors import CORS
 from config import Config
+from job_storage import RedisJobStorage, get_job_storage, job_id_floor, new_job_id
 
 # Import services
+from services.analysis_context import AnalysisContext
 from services.claims import ClaimExtractor
 from services.comprehensive_factcheck import ComprehensiveFactChecker as FactChecker
+from services.deadline import Deadline
 from services.export import ExportService
+from services.caption_store import create_caption_store
+from services.job_events import TERMINAL_EVENTS, JobEventBus, RedisJobEventBus, format_sse
+from services.job_queue import InMemoryJobQueue, create_job_queue
+from services.job_recovery import JobRecovery
+from services.job_scheduler import JobScheduler, QueueFullError, SchedulerUnavailableError
 from services.youtube_service import YouTubeService  # New realistic YouTube service
 from services.transcript import TranscriptProcessor
+from worker import AnalysisWorker
 
 # Set up logging
 logging.basicConfig(
@@ -43,12 +55,53 @@ if config_warnings:
 claim_extractor = ClaimExtractor(Config)
 fact_checker = FactChecker(Config)
 export_service = ExportService()
-youtube_service = YouTubeService()  # New YouTube service
-transcript_processor = TranscriptProcessor()
+caption_store = create_caption_store(Config)
+youtube_service = YouTubeService(Config, caption_store=caption_store)  # New YouTube service
+transcript_processor = TranscriptProcessor(caption_store)
+job_scheduler = JobScheduler(
+    num_workers=Config.JOB_WORKERS,
+    max_queue_size=Config.JOB_QUEUE_SIZE,
+    retry_after=Config.JOB_RETRY_AFTER
+)
+atexit.register(fact_checker.close)
+
+# Job storage - shared by all app workers unless the in-memory backend is configured
+job_storage = get_job_storage()
 
-# In-memory job storage
-jobs = {}
-job_lock = threading.Lock()
+# In queue mode the web app only enqueues; analysis runs in separate worker processes (worker.py)
+job_queue = None
+if Config.JOB_EXECUTION_MODE == 'queue':
+    job_queue = create_job_queue(
+        Config,
+        redis_client=job_storage.client if isinstance(job_storage, RedisJobStorage) else None
+    )
+    if isinstance(job_queue, InMemoryJobQueue):
+        # No other process can read this queue, so jobs would wait forever
+        # unless this process consumes it too
+        logger.warning("Queue mode is using an in-memory job queue: jobs run in this process only and "
+                       "separate workers get nothing. Set JOB_QUEUE_TYPE=redis (with REDIS_URL) or sqlite.")
+        local_worker = AnalysisWorker(job_queue, job_scheduler, job_storage,
+                                      lambda job_id: run_queued_job(job_id))  # defined below
+        threading.Thread(target=local_worker.run, name='local-queue-worker', daemon=True).start()
+        atexit.register(local_worker.stop)
+
+# Heartbeats for this worker's jobs; jobs of a worker that died are resumed from their checkpoints
+job_recovery = JobRecovery(
+    job_storage,
+    active_jobs=job_scheduler.job_ids,
+    resume=lambda job: resume_job(job),  # defined below with the other job functions
+    interval=Config.JOB_HEARTBEAT_SECONDS,
+    orphan_after=Config.JOB_ORPHAN_SECONDS,
+    waiting_jobs=job_queue.job_ids if job_queue else None
+)
+job_recovery.start()
+atexit.register(job_recovery.stop)
+
+# Progress events for /api/stream - on Redis so any worker can serve any job's stream
+if isinstance(job_storage, RedisJobStorage):
+    job_events = RedisJobEventBus(job_storage.client)
+else:
+    job_events = JobEventBus()
 
 # [VERDICT_CATEGORIES remains the same as in your original]
 VERDICT_CATEGORIES = {
@@ -148,31 +201,196 @@ VERDICT_CATEGORIES = {
 # Job management functions
 def create_job(transcript: str, source_type: str = 'unknown') -> str:
     """Create a new analysis job"""
-    job_id = datetime.now().strftime('%Y%m%d%H%M%S') + str(threading.get_ident())
-    
-    with job_lock:
-        jobs[job_id] = {
-            'id': job_id,
-            'status': 'created',
-            'progress': 0,
-            'created_at': datetime.now().isoformat(),
-            'transcript_length': len(transcript),
-            'source_type': source_type
-        }
+    # ULID-style: unique across workers and sortable by creation time
+    job_id = new_job_id()
+    
+    job_storage.create_job(job_id, {
+        'transcript_length': len(transcript),
+        'source_type': source_type,
+        'heartbeat_at': time.time()
+    })
     
     return job_id
 
 def update_job(job_id: str, updates: Dict):
-    """Update job status"""
-    with job_lock:
-        if job_id in jobs:
-            jobs[job_id].update(updates)
-            jobs[job_id]['updated_at'] = datetime.now().isoformat()
+    """Update job status and notify stream subscribers"""
+    job_storage.update_job(job_id, updates)
+    publish_job_event(job_id, updates)
+
+def publish_job_event(job_id: str, updates: Dict):
+    """Publish the status fields of a job update as a stream event"""
+    data = {key: updates[key] for key in ('status', 'progress', 'message', 'error') if key in updates}
+    if not data:
+        return
+    
+    status = updates.get('status')
+    event_type = 'complete' if status == 'completed' else 'failed' if status == 'failed' else 'progress'
+    try:
+        job_events.publish(job_id, event_type, data)
+    except Exception as e:
+        logger.warning(f"Failed to publish {event_type} event for job {job_id}: {e}")
 
 def get_job(job_id: str) -> Optional[Dict]:
     """Get job by ID"""
-    with job_lock:
-        return jobs.get(job_id)
+    return job_storage.get_job(job_id)
+
+def load_results(job_id: str) -> Dict:
+    """Load the stored results of a completed job"""
+    results = job_storage.get_results(job_id) or {}
+    # 'claims' mirrors 'fact_checks'; it is rebuilt here rather than stored twice
+    results.setdefault('claims', results.get('fact_checks', []))
+    return results
+
+def delete_job(job_id: str):
+    """Remove a job that was never admitted"""
+    job = get_job(job_id)
+    for key in (job or {}).get('dedup_keys', []):
+        job_storage.release_dedup_key(key, job_id)
+    job_storage.delete_job(job_id)
+
+def transcript_dedup_key(transcript: str) -> str:
+    """Deduplication key for a transcript, ignoring differences in whitespace"""
+    normalized = ' '.join(transcript.split())
+    return 'text:' + hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+def find_shared_job(dedup_key: str) -> Optional[str]:
+    """ID of a queued, running or completed job for the same input, if any"""
+    job_id = job_storage.get_dedup_job(dedup_key)
+    if not job_id:
+        return None
+    job = get_job(job_id)
+    # Failed and expired jobs aren't shared; the next submission takes over the key
+    if not job or job.get('status') == 'failed':
+        return None
+    return job_id
+
+def claim_dedup_key(dedup_key: str, job_id: str) -> Optional[str]:
+    """
+    Register a new job as the one serving dedup_key.
+    
+    Returns:
+        The ID of the job that already serves it, or None if job_id now does
+    """
+    current = job_storage.get_dedup_job(dedup_key)
+    replace = current if current and not find_shared_job(dedup_key) else None
+    owner = job_storage.claim_dedup_key(dedup_key, job_id, replace=replace)
+    if owner != job_id:
+        return owner
+    
+    job = get_job(job_id) or {}
+    job_storage.update_job(job_id, {'dedup_keys': job.get('dedup_keys', []) + [dedup_key]})
+    return None
+
+def shared_job_response(job_id: str, **extra):
+    """Response for a submission that was attached to an existing job"""
+    job = get_job(job_id) or {}
+    status = job.get('status', 'created')
+    logger.info(f"Reusing job {job_id} ({status}) for a duplicate submission")
+    return jsonify({
+        'job_id': job_id,
+        'message': 'Results already available' if status == 'completed' else 'Joined an identical analysis in progress',
+        'status': status,
+        'deduplicated': True,
+        **extra
+    })
+
+def submit_job(job_id: str, transcript: str):
+    """Queue a job for analysis, or return an error response if it is not admitted"""
+    # Persisted first, so any worker can run the job or resume it if this one dies
+    job_storage.save_checkpoint(job_id, {'transcript': transcript})
+    # Marked queued before a worker can see it; written afterwards, it could
+    # overwrite the progress of a worker that has already started the job
+    update_job(job_id, {
+        'status': 'queued',
+        'message': f'Queued for analysis (position {queued_count() + 1})'
+    })
+    try:
+        enqueue_job(job_id, transcript)
+    except QueueFullError as e:
+        delete_job(job_id)
+        response = jsonify({'error': 'Server is busy. Please try again shortly.', 'retry_after': e.retry_after})
+        return response, 429, {'Retry-After': str(e.retry_after)}
+    except SchedulerUnavailableError:
+        delete_job(job_id)
+        retry_after = Config.JOB_RETRY_AFTER
+        response = jsonify({'error': 'Server is restarting. Please try again shortly.', 'retry_after': retry_after})
+        return response, 503, {'Retry-After': str(retry_after)}
+    
+    return None
+
+def enqueue_job(job_id: str, transcript: str, checkpoint: Optional[Dict] = None) -> int:
+    """
+    Hand a job to the shared queue in queue mode, otherwise to this
+    process's worker pool.
+    
+    Returns:
+        1-based queue position
+    
+    Raises:
+        QueueFullError, SchedulerUnavailableError: the job was not admitted
+    """
+    if job_queue is not None:
+        return job_queue.put(job_id)
+    return job_scheduler.submit(job_id, process_transcript, job_id, transcript, checkpoint=checkpoint)
+
+def run_queued_job(job_id: str):
+    """Run a job taken from the shared queue, starting from its checkpoint"""
+    job = get_job(job_id)
+    if not job or job.get('status') in ('completed', 'failed'):
+        logger.info(f"Skipping queued job {job_id}: it no longer needs to run")
+        return
+    
+    checkpoint = job_storage.get_checkpoint(job_id)
+    if not checkpoint or 'transcript' not in checkpoint:
+        fail_without_checkpoint(job_id)
+        return
+    
+    process_transcript(job_id, checkpoint['transcript'], checkpoint=checkpoint)
+
+def fail_without_checkpoint(job_id: str):
+    """Mark a job failed that can't be run because its transcript wasn't saved"""
+    update_job(job_id, {
+        'status': 'failed',
+        'error': 'The job has no checkpoint to run or resume from',
+        'message': 'Analysis failed'
+    })
+
+def resume_job(job: Dict) -> bool:
+    """Requeue a job whose worker died, from its last checkpoint"""
+    job_id = job['id']
+    checkpoint = job_storage.get_checkpoint(job_id)
+    if not checkpoint or 'transcript' not in checkpoint:
+        fail_without_checkpoint(job_id)
+        return True
+    
+    # As in submit_job, the job is marked queued before a worker can pick it up
+    previous = {key: job.get(key) for key in ('status', 'heartbeat_at', 'message')}
+    update_job(job_id, {
+        'status': 'queued',
+        'heartbeat_at': time.time(),
+        'message': f'Resuming interrupted analysis (position {queued_count() + 1})'
+    })
+    try:
+        enqueue_job(job_id, checkpoint['transcript'], checkpoint)
+    except (QueueFullError, SchedulerUnavailableError):
+        # Still orphaned; offered again on the next sweep
+        job_storage.update_job(job_id, previous)
+        return False
+    return True
+
+def queued_count() -> int:
+    """Number of jobs waiting for a worker"""
+    return job_queue.size() if job_queue is not None else job_scheduler.get_stats()['queued']
+
+def queue_is_full() -> bool:
+    """Whether a new job would be rejected right now"""
+    return job_queue.is_full() if job_queue is not None else job_scheduler.is_full()
+
+def busy_response():
+    """429 response used when the job queue is already full"""
+    retry_after = job_queue.retry_after if job_queue is not None else job_scheduler.retry_after()
+    response = jsonify({'error': 'Server is busy. Please try again shortly.', 'retry_after': retry_after})
+    return response, 429, {'Retry-After': str(retry_after)}
 
 # Routes
 @app.route('/')
@@ -202,18 +420,31 @@ def analyze():
         if len(transcript) < 10:
             return jsonify({'error': 'Transcript too short. Please provide more content to analyze.'}), 400
         
+        # Identical submissions share one job instead of analyzing the text again
+        dedup_key = transcript_dedup_key(transcript)
+        shared_job_id = find_shared_job(dedup_key)
+        if shared_job_id:
+            return shared_job_response(shared_job_id, source_type=source_type)
+        
         # Create job
         job_id = create_job(transcript, source_type)
         
+        # Another request may have claimed the same transcript meanwhile
+        shared_job_id = claim_dedup_key(dedup_key, job_id)
+        if shared_job_id:
+            delete_job(job_id)
+            return shared_job_response(shared_job_id, source_type=source_type)
+        
         # Add metadata
         update_job(job_id, {
             'source_type': source_type,
             'transcript_preview': transcript[:200] + '...' if len(transcript) > 200 else transcript
         })
         
-        # Start processing in background
-        thread = threading.Thread(target=process_transcript, args=(job_id, transcript))
-        thread.start()
+        # Queue for processing on the worker pool
+        rejection = submit_job(job_id, transcript)
+        if rejection:
+            return rejection
         
         return jsonify({
             'job_id': job_id,
@@ -237,6 +468,18 @@ def process_youtube():
         if not url:
             return jsonify({'error': 'No YouTube URL provided'}), 400
         
+        # A video that is already being analyzed, or has been, isn't fetched again
+        video_id = youtube_service.get_video_id(url)
+        video_key = f'youtube:{video_id}' if video_id else None
+        if video_key:
+            shared_job_id = find_shared_job(video_key)
+            if shared_job_id:
+                return shared_job_response(shared_job_id)
+        
+        # Don't spend time fetching the video if the job would be rejected anyway
+        if queue_is_full():
+            return busy_response()
+        
         # Process YouTube URL
         logger.info(f"Processing YouTube URL: {url}")
         result = youtube_service.process_youtube_url(url)
@@ -257,6 +500,15 @@ def process_youtube():
         # Create analysis job
         job_id = create_job(transcript, 'youtube')
         
+        # Concurrent requests for the same video and caption track share the first job
+        if video_key:
+            shared_job_id = claim_dedup_key(f"{video_key}:{result.get('caption_type', 'unknown')}", job_id)
+            if shared_job_id:
+                delete_job(job_id)
+                return shared_job_response(shared_job_id)
+            # The bare video key always points at the newest job, so later URLs skip the fetch
+            job_storage.claim_dedup_key(video_key, job_id, replace=job_storage.get_dedup_job(video_key))
+        
         # Add YouTube-specific metadata
         update_job(job_id, {
             'youtube_metadata': {
@@ -268,9 +520,10 @@ def process_youtube():
             }
         })
         
-        # Start processing
-        thread = threading.Thread(target=process_transcript, args=(job_id, transcript))
-        thread.start()
+        # Queue for processing on the worker pool
+        rejection = submit_job(job_id, transcript)
+        if rejection:
+            return rejection
         
         return jsonify({
             'job_id': job_id,
@@ -298,7 +551,7 @@ def get_status(job_id: str):
     if not job:
         return jsonify({'error': 'Job not found'}), 404
     
-    return jsonify({
+    status = {
         'status': job.get('status'),
         'progress': job.get('progress', 0),
         'message': job.get('message', ''),
@@ -306,19 +559,151 @@ def get_status(job_id: str):
         'source_type': job.get('source_type', 'unknown'),
         'transcript_length': job.get('transcript_length', 0),
         'youtube_metadata': job.get('youtube_metadata', {})
+    }
+    
+    if job.get('status') == 'queued':
+        if job_queue is not None:
+            position = job_queue.position(job_id)
+        else:
+            position = job_scheduler.queue_position(job_id)
+        if position:
+            status['queue_position'] = position
+            status['message'] = f'Queued for analysis (position {position})'
+    
+    return jsonify(status)
+
+@app.route('/api/jobs')
+def list_jobs():
+    """
+    List jobs newest first, optionally filtered by status and source_type.
+    
+    Paginate by passing next_cursor from the previous page as ?cursor=.
+    ?created_after= takes an ISO timestamp; without an offset it is UTC,
+    like the jobs' created_at.
+    """
+    limit = min(max(request.args.get('limit', 50, type=int), 1), 200)
+    filters = {
+        'status': request.args.get('status'),
+        'source_type': request.args.get('source_type')
+    }
+    
+    since = None
+    created_after = request.args.get('created_after')
+    if created_after:
+        try:
+            created_after = datetime.fromisoformat(created_after)
+            if created_after.tzinfo is None:
+                created_after = created_after.replace(tzinfo=timezone.utc)
+            since = job_id_floor(created_after.timestamp())
+        except ValueError:
+            return jsonify({'error': 'created_after must be an ISO timestamp'}), 400
+    
+    jobs = job_storage.list_jobs(filters, limit=limit, before=request.args.get('cursor'), since=since)
+    
+    return jsonify({
+        'jobs': [{
+            'id': job.get('id'),
+            'status': job.get('status'),
+            'progress': job.get('progress', 0),
+            'message': job.get('message', ''),
+            'source_type': job.get('source_type', 'unknown'),
+            'transcript_length': job.get('transcript_length', 0),
+            'created_at': job.get('created_at'),
+            'updated_at': job.get('updated_at')
+        } for job in jobs],
+        'next_cursor': jobs[-1].get('id') if len(jobs) == limit else None
+    })
+
+@app.route('/api/stream/<job_id>')
+def stream_status(job_id: str):
+    """Server-sent events: progress updates and per-claim verdicts as they happen"""
+    job = get_job(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    last_event_id = request.headers.get('Last-Event-ID')
+    
+    def snapshot(job: Dict) -> Dict:
+        status = job.get('status')
+        event_type = 'complete' if status == 'completed' else 'failed' if status == 'failed' else 'progress'
+        data = {key: job.get(key) for key in ('status', 'progress', 'message', 'error')}
+        return {'event': event_type, 'data': data}
+    
+    def generate():
+        # Current state first, so late or reconnecting clients don't wait for the next event
+        current = snapshot(job)
+        yield format_sse(current)
+        if current['event'] in TERMINAL_EVENTS:
+            return
+        
+        cursor = last_event_id
+        deadline = time.monotonic() + Config.SSE_MAX_STREAM_SECONDS
+        while time.monotonic() < deadline:
+            try:
+                events = job_events.wait(job_id, cursor, timeout=Config.SSE_HEARTBEAT_SECONDS)
+            except Exception as e:
+                logger.warning(f"Event stream for job {job_id} failed: {e}")
+                return
+            
+            if not events:
+                # Events may have gone to another worker's in-process bus, so re-check the store
+                latest = get_job(job_id)
+                if not latest:
+                    return
+                current = snapshot(latest)
+                if current['event'] in TERMINAL_EVENTS:
+                    yield format_sse(current)
+                    return
+                yield ': keep-alive\n\n'
+                continue
+            
+            for event in events:
+                cursor = event['id']
+                yield format_sse(event)
+                if event['event'] in TERMINAL_EVENTS:
+                    return
+        # Past the deadline the client reconnects with Last-Event-ID and resumes
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
     })
 
 @app.route('/api/results/<job_id>')
 def get_results(job_id: str):
-    """Get analysis results"""
+    """
+    Get analysis results.
+    
+    While the job is running, returns the verdicts checked so far with a
+    running credibility score. Pass ?since=<cursor> from the previous
+    response to receive only verdicts that arrived after it.
+    """
     job = get_job(job_id)
     if not job:
         return jsonify({'error': 'Job not found'}), 404
     
-    if job.get('status') != 'completed':
-        return jsonify({'error': 'Analysis not complete'}), 400
+    status = job.get('status')
+    if status == 'completed':
+        return jsonify(load_results(job_id))
+    
+    if status == 'failed':
+        return jsonify({'error': 'Analysis failed', 'details': job.get('error')}), 400
     
-    return jsonify(job.get('results', {}))
+    since = max(request.args.get('since', 0, type=int), 0)
+    entries = job_storage.get_partial_results(job_id)
+    fact_checks = [entry['result'] for entry in entries]
+    
+    return jsonify({
+        'partial': True,
+        'status': status,
+        'progress': job.get('progress', 0),
+        'total_claims': job.get('total_claims'),
+        'checked_claims': len(entries),
+        'fact_checks': fact_checks[since:],
+        'claim_indexes': [entry['index'] for entry in entries[since:]],
+        'cursor': len(entries),
+        'credibility_score': calculate_credibility_score(fact_checks)
+    })
 
 @app.route('/api/export/<job_id>/<format>')
 def export_results(job_id: str, format: str):
@@ -330,7 +715,7 @@ def export_results(job_id: str, format: str):
     if not job or job.get('status') != 'completed':
         return jsonify({'error': 'Results not available'}), 404
     
-    results = job.get('results', {})
+    results = load_results(job_id)
     
     try:
         if format == 'json':
@@ -415,6 +800,11 @@ def health():
             'live_youtube_streaming': False,  # BE HONEST!
             'export': True
         },
+        'job_storage': job_storage.get_stats(),
+        'job_queue': job_queue.get_stats() if job_queue is not None else job_scheduler.get_stats(),
+        'job_recovery': job_recovery.get_stats(),
+        'verdict_cache': fact_checker.get_cache_stats(),
+        'youtube_cache': youtube_service.get_cache_stats(),
         'limitations': {
             'youtube_live_streams': 'Not supported - process after stream ends',
             'audio_transcription': 'Maximum 30 minutes',
@@ -423,87 +813,119 @@ def health():
     })
 
 # Processing functions
-def process_transcript(job_id: str, transcript: str):
-    """Process transcript in background"""
+def process_transcript(job_id: str, transcript: str, checkpoint: Optional[Dict] = None):
+    """
+    Process transcript in background.
+    
+    Runs in checkpointed stages - extract, check each claim, summarize. The
+    extracted claims and every verdict are persisted as they are produced,
+    so a job resumed with its checkpoint skips the work already done.
+    
+    The whole run is bounded by TOTAL_ANALYSIS_TIMEOUT: claims still
+    unchecked when it runs out get a structural verdict marked as timed
+    out, and the job completes with what it has.
+    """
+    deadline = Deadline(Config.TOTAL_ANALYSIS_TIMEOUT)
     try:
-        # Update progress
-        update_job(job_id, {
-            'status': 'processing',
-            'progress': 10,
-            'message': 'Extracting claims...'
-        })
+        extraction = (checkpoint or {}).get('extraction')
+        if extraction is None:
+            update_job(job_id, {
+                'status': 'processing',
+                'stage': 'extracting',
+                'progress': 10,
+                'message': 'Extracting claims...'
+            })
+            
+            # Extract claims
+            extraction_result = claim_extractor.extract(transcript, deadline.child(Config.EXTRACTION_TIMEOUT))
+            extraction = {
+                'claims': extraction_result.get('claims', []),
+                'speakers': extraction_result.get('speakers', []),
+                'topics': extraction_result.get('topics', []),
+                'extraction_method': extraction_result.get('extraction_method', 'unknown')
+            }
+            job_storage.save_checkpoint(job_id, {'transcript': transcript, 'extraction': extraction})
+        else:
+            logger.info(f"Resuming job {job_id} after claim extraction")
         
-        # Extract claims
-        extraction_result = claim_extractor.extract(transcript)
-        claims = extraction_result.get('claims', [])
-        speakers = extraction_result.get('speakers', [])
-        topics = extraction_result.get('topics', [])
+        claims = extraction['claims']
+        speakers = extraction['speakers']
+        topics = extraction['topics']
         
         logger.info(f"Claims found: {len(claims)}")
         
         if not claims:
+            job_storage.store_results(job_id, {
+                'fact_checks': [],
+                'summary': 'No verifiable claims were found in the transcript.',
+                'credibility_score': {'score': 0, 'label': 'No claims to verify'},
+                'speakers': speakers,
+                'topics': topics,
+                'transcript_preview': transcript[:500] + '...' if len(transcript) > 500 else transcript,
+                'total_claims': 0,
+                'extraction_method': extraction['extraction_method']
+            })
             update_job(job_id, {
                 'status': 'completed',
                 'progress': 100,
-                'message': 'No verifiable claims found',
-                'results': {
-                    'claims': [],
-                    'fact_checks': [],
-                    'summary': 'No verifiable claims were found in the transcript.',
-                    'credibility_score': {'score': 0, 'label': 'No claims to verify'},
-                    'speakers': speakers,
-                    'topics': topics,
-                    'transcript_preview': transcript[:500] + '...' if len(transcript) > 500 else transcript,
-                    'total_claims': 0,
-                    'extraction_method': extraction_result.get('extraction_method', 'unknown')
-                }
+                'message': 'No verifiable claims found'
             })
             return
         
+        # Verdicts persisted before an interruption aren't checked again
+        total_claims = len(claims)
+        checked = [None] * total_claims
+        if checkpoint:
+            for entry in job_storage.get_partial_results(job_id):
+                checked[entry['index']] = entry['result']
+        remaining = [index for index, result in enumerate(checked) if result is None]
+        already_checked = total_claims - len(remaining)
+        
         # Progress update
         update_job(job_id, {
-            'progress': 30,
-            'message': f'Fact-checking {len(claims)} claims...'
+            'status': 'processing',
+            'stage': 'checking',
+            'progress': 30 + int(already_checked / total_claims * 60),
+            'message': f'Fact-checking {len(remaining)} claims...',
+            'total_claims': total_claims
         })
         
-        # Fact-check claims
-        fact_checks = []
-        total_claims = len(claims)
+        # Fact-check claims concurrently, keeping the original claim order
+        def on_claim_checked(completed: int, position: int, result: Optional[Dict]):
+            completed += already_checked
+            index = remaining[position]
+            progress = 30 + (completed / total_claims * 60)
+            update_job(job_id, {
+                'progress': int(progress),
+                'message': f'Checked {completed} of {total_claims} claims...'
+            })
+            if result:
+                logger.info(f"Fact check {index+1}/{total_claims}: {result.get('verdict', 'unknown')}")
+                job_storage.append_partial_result(job_id, {'index': index, 'result': result})
+                try:
+                    job_events.publish(job_id, 'claim', {'index': index, 'total': total_claims, 'result': result})
+                except Exception as e:
+                    logger.warning(f"Failed to publish claim event for job {job_id}: {e}")
         
-        for i, claim in enumerate(claims):
-            try:
-                # Update progress
-                progress = 30 + (i / total_claims * 60)
-                update_job(job_id, {
-                    'progress': int(progress),
-                    'message': f'Checking claim {i+1} of {total_claims}...'
-                })
-                
-                # Fact-check with context
-                context = {
-                    'transcript': transcript,
-                    'speaker': claim.get('speaker', 'Unknown'),
-                    'topics': topics
-                }
-                
-                result = fact_checker.check_claim_with_verdict(claim.get('text', ''), context)
-                
-                if result:
-                    fact_checks.append(result)
-                    logger.info(f"Fact check {i+1}/{total_claims}: {result.get('verdict', 'unknown')}")
-                    
-            except Exception as e:
-                logger.error(f"Error checking claim {i+1}: {e}")
-                fact_checks.append({
-                    'claim': claim.get('text', ''),
-                    'speaker': claim.get('speaker', 'Unknown'),
-                    'verdict': 'error',
-                    'explanation': f'Analysis failed: {str(e)}',
-                    'confidence': 0
-                })
+        context = {
+            'transcript': transcript,
+            'topics': topics,
+            'analysis': AnalysisContext(transcript, topics, job_id=job_id),
+            'deadline': deadline
+        }
+        
+        results = fact_checker.check_claims([claims[index] for index in remaining], context,
+                                            progress_callback=on_claim_checked)
+        for index, result in zip(remaining, results):
+            checked[index] = result
+        fact_checks = [result for result in checked if result]
+        timed_out = sum(1 for result in fact_checks if result.get('timed_out'))
+        if timed_out:
+            logger.warning(f"Job {job_id}: {timed_out} of {total_claims} claims timed out")
         
         # Final progress update
         update_job(job_id, {
+            'stage': 'summarizing',
             'progress': 95,
             'message': 'Generating summary...'
         })
@@ -517,22 +939,22 @@ def process_transcript(job_id: str, transcript: str):
         # Store results
         results = {
             'transcript_preview': transcript[:500] + '...' if len(transcript) > 500 else transcript,
-            'claims': fact_checks,
             'fact_checks': fact_checks,
             'speakers': speakers,
             'topics': topics,
             'credibility_score': credibility_score,
             'summary': summary,
-            'total_claims': len(claims),
-            'extraction_method': extraction_result.get('extraction_method', 'unknown'),
+            'total_claims': total_claims,
+            'extraction_method': extraction['extraction_method'],
+            'timed_out_claims': timed_out,
             'processing_time': datetime.now().isoformat()
         }
         
+        job_storage.store_results(job_id, results)
         update_job(job_id, {
             'status': 'completed',
             'progress': 100,
-            'message': 'Analysis complete',
-            'results': results
+            'message': 'Analysis complete'
         })
         
     except Exception as e:
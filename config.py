@@ -43,31 +43,90 @@ class Config:
     ENABLE_SOURCE_ANALYSIS = True
     ENABLE_COMPREHENSIVE_SUMMARY = True
     ENABLE_AGGRESSIVE_CHECKING = True  # New setting
+    AI_BATCH_SIZE = int(os.environ.get('AI_BATCH_SIZE', 8))  # claims per verdict request, 1 disables batching
+    AI_BATCH_TOKEN_BUDGET = int(os.environ.get('AI_BATCH_TOKEN_BUDGET', 6000))  # estimated prompt + response tokens per batch
+    AI_EXTRACTION_CHUNK_SIZE = int(os.environ.get('AI_EXTRACTION_CHUNK_SIZE', 8000))  # characters per extraction request
+    AI_EXTRACTION_CHUNK_OVERLAP = int(os.environ.get('AI_EXTRACTION_CHUNK_OVERLAP', 400))  # characters repeated between chunks
+    AI_EXTRACTION_MAX_WORKERS = int(os.environ.get('AI_EXTRACTION_MAX_WORKERS', 4))  # concurrent extraction requests
     FORCE_VERDICT_ON_ALL_CLAIMS = True  # New setting
     
     # Application limits - INCREASED FOR LONGER TRANSCRIPTS
     MAX_TRANSCRIPT_LENGTH = 500000  # Increased to 500k characters (~100 pages)
     MAX_CLAIMS_PER_TRANSCRIPT = 100  # Increased from 50
     MAX_CLAIM_LENGTH = 500  # characters per claim
+    MAX_CONCURRENT_CLAIM_CHECKS = int(os.environ.get('MAX_CONCURRENT_CLAIM_CHECKS', 10))  # parallel claim checks
     
     # Timeouts - INCREASED FOR THOROUGHNESS
-    FACT_CHECK_TIMEOUT = 15  # seconds per claim (increased)
-    TOTAL_ANALYSIS_TIMEOUT = 900  # 15 minutes total (increased)
+    FACT_CHECK_TIMEOUT = int(os.environ.get('FACT_CHECK_TIMEOUT', 15))  # seconds per claim (increased)
+    TOTAL_ANALYSIS_TIMEOUT = int(os.environ.get('TOTAL_ANALYSIS_TIMEOUT', 900))  # 15 minutes total (increased)
+    EXTRACTION_TIMEOUT = int(os.environ.get('EXTRACTION_TIMEOUT', 180))  # seconds of the total spent extracting claims
     API_TIMEOUT = 10  # seconds for external API calls (increased)
+    API_EARLY_EXIT_CONFIDENCE = int(os.environ.get('API_EARLY_EXIT_CONFIDENCE', 80))  # stop waiting on other sources once one is this confident
     REQUEST_TIMEOUT = 30  # seconds for HTTP requests
+    SSE_HEARTBEAT_SECONDS = int(os.environ.get('SSE_HEARTBEAT_SECONDS', 15))  # keep-alive interval on progress streams
+    SSE_MAX_STREAM_SECONDS = int(os.environ.get('SSE_MAX_STREAM_SECONDS', 300))  # clients reconnect after this
+    
+    # Shared HTTP client for external fact-check APIs
+    API_POOL_LIMIT = int(os.environ.get('API_POOL_LIMIT', 100))  # open connections in total
+    API_POOL_LIMIT_PER_HOST = int(os.environ.get('API_POOL_LIMIT_PER_HOST', 10))
+    API_DNS_CACHE_TTL = int(os.environ.get('API_DNS_CACHE_TTL', 300))  # seconds
+    API_KEEPALIVE_TIMEOUT = int(os.environ.get('API_KEEPALIVE_TIMEOUT', 30))  # seconds an idle connection stays open
+    
+    # YouTube video metadata, cached by video ID
+    YOUTUBE_INFO_CACHE_TTL = int(os.environ.get('YOUTUBE_INFO_CACHE_TTL', 3600))  # seconds
+    YOUTUBE_LIVE_INFO_CACHE_TTL = int(os.environ.get('YOUTUBE_LIVE_INFO_CACHE_TTL', 60))  # live/upcoming streams change state
+    YOUTUBE_INFO_CACHE_MAX_ENTRIES = int(os.environ.get('YOUTUBE_INFO_CACHE_MAX_ENTRIES', 1000))
+    
+    # YouTube captions, kept with their timed segments (leave CAPTION_CACHE_DB_PATH empty for memory only)
+    CAPTION_CACHE_DB_PATH = os.environ.get('CAPTION_CACHE_DB_PATH')
+    CAPTION_CACHE_MAX_ENTRIES = int(os.environ.get('CAPTION_CACHE_MAX_ENTRIES', 500))  # in memory
+    CAPTION_CACHE_DISK_MAX_ENTRIES = int(os.environ.get('CAPTION_CACHE_DISK_MAX_ENTRIES', 20000))
+    CAPTION_CACHE_RETENTION = int(os.environ.get('CAPTION_CACHE_RETENTION', 30 * 24 * 3600))  # stale captions kept as a fallback
+    CAPTION_MAX_AGE_MANUAL = int(os.environ.get('CAPTION_MAX_AGE_MANUAL', 7 * 24 * 3600))  # refetched after this
+    CAPTION_MAX_AGE_AUTO = int(os.environ.get('CAPTION_MAX_AGE_AUTO', 24 * 3600))  # manual captions may have appeared
+    CAPTION_MISSING_MAX_AGE = int(os.environ.get('CAPTION_MISSING_MAX_AGE', 3600))  # remember videos without captions
+    
+    # Audio transcription for videos without captions
+    AUDIO_TRANSCRIPTION_MAX_MINUTES = int(os.environ.get('AUDIO_TRANSCRIPTION_MAX_MINUTES', 30))
+    AUDIO_STREAMING = os.environ.get('AUDIO_STREAMING', 'True').lower() == 'true'  # decode via an ffmpeg pipe, no WAV on disk
+    FFMPEG_BINARY = os.environ.get('FFMPEG_BINARY', 'ffmpeg')
+    AUDIO_TRANSCRIPTION_WORKERS = int(os.environ.get('AUDIO_TRANSCRIPTION_WORKERS', 4))  # chunks recognized in parallel
+    AUDIO_TRANSCRIPTION_RETRIES = int(os.environ.get('AUDIO_TRANSCRIPTION_RETRIES', 2))  # per chunk, on engine errors
+    AUDIO_CHUNK_SECONDS = int(os.environ.get('AUDIO_CHUNK_SECONDS', 60))  # longest segment; Google's free tier takes up to 1 minute
+    AUDIO_SEGMENTATION = os.environ.get('AUDIO_SEGMENTATION', 'silence')  # silence (cut at pauses, skip dead air) or fixed
+    AUDIO_MIN_SILENCE_MS = int(os.environ.get('AUDIO_MIN_SILENCE_MS', 400))  # shortest pause that can end a segment
+    AUDIO_SILENCE_THRESHOLD_DB = float(os.environ.get('AUDIO_SILENCE_THRESHOLD_DB', -40))  # dBFS below which audio is silence
+    SPEECH_RECOGNITION_ENGINE = os.environ.get('SPEECH_RECOGNITION_ENGINE', 'google')  # any SpeechRecognition recognize_* engine
     
     # Caching
     CACHE_TYPE = 'simple'
     CACHE_DEFAULT_TIMEOUT = 3600  # 1 hour
     
+    # Claim verdict cache - memory tier plus optional SQLite tier (set a path to enable)
+    VERDICT_CACHE_TTL = int(os.environ.get('VERDICT_CACHE_TTL', 7 * 24 * 3600))  # 1 week
+    VERDICT_CACHE_MAX_ENTRIES = int(os.environ.get('VERDICT_CACHE_MAX_ENTRIES', 5000))
+    VERDICT_CACHE_DB_PATH = os.environ.get('VERDICT_CACHE_DB_PATH')
+    VERDICT_CACHE_DISK_MAX_ENTRIES = int(os.environ.get('VERDICT_CACHE_DISK_MAX_ENTRIES', 100000))
+    
     # File upload settings
     UPLOAD_FOLDER = 'uploads'
     ALLOWED_EXTENSIONS = {'txt', 'srt', 'vtt'}
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB
     
     # Job storage
-    JOB_STORAGE_TYPE = os.environ.get('JOB_STORAGE_TYPE', 'memory')
+    JOB_STORAGE_TYPE = os.environ.get('JOB_STORAGE_TYPE', 'memory')  # memory, redis or mongodb
     JOB_RETENTION_HOURS = 24
+    JOB_STORAGE_MAX_BYTES = int(os.environ.get('JOB_STORAGE_MAX_BYTES', 256 * 1024 * 1024))  # in-memory job table budget
+    
+    # Job scheduling - bounded worker pool and queue for analysis jobs
+    JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 4))
+    JOB_QUEUE_SIZE = int(os.environ.get('JOB_QUEUE_SIZE', 50))
+    JOB_RETRY_AFTER = int(os.environ.get('JOB_RETRY_AFTER', 30))  # seconds, used until run times are known
+    JOB_EXECUTION_MODE = os.environ.get('JOB_EXECUTION_MODE', 'inline')  # inline (web process threads) or queue (worker.py processes)
+    JOB_QUEUE_TYPE = os.environ.get('JOB_QUEUE_TYPE', 'redis')  # queue mode only: redis, sqlite or memory
+    JOB_QUEUE_DB_PATH = os.environ.get('JOB_QUEUE_DB_PATH')  # required for the sqlite queue
+    JOB_HEARTBEAT_SECONDS = int(os.environ.get('JOB_HEARTBEAT_SECONDS', 30))  # how often running jobs are marked alive
+    JOB_ORPHAN_SECONDS = int(os.environ.get('JOB_ORPHAN_SECONDS', 120))  # jobs silent this long are resumed elsewhere
     
     # Logging
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
@@ -88,8 +147,16 @@ class Config:
         if not cls.OPENAI_API_KEY:
             warnings.append("No OpenAI API key configured - AI fact-checking disabled")
         
-        if cls.USE_IN_MEMORY_STORAGE:
-            warnings.append("Using in-memory storage - data will be lost on restart")
+        if cls.JOB_STORAGE_TYPE not in ('redis', 'mongodb'):
+            warnings.append("Using in-memory storage - data will be lost on restart and can't be shared between workers")
+        
+        if cls.JOB_EXECUTION_MODE == 'queue' and cls.JOB_STORAGE_TYPE not in ('redis', 'mongodb'):
+            warnings.append("Queue mode needs redis or mongodb job storage - worker processes can't see in-memory jobs")
+        
+        if cls.JOB_EXECUTION_MODE == 'queue' and (cls.JOB_QUEUE_TYPE == 'memory'
+                                                  or (cls.JOB_QUEUE_TYPE == 'redis' and not cls.REDIS_URL)
+                                                  or (cls.JOB_QUEUE_TYPE == 'sqlite' and not cls.JOB_QUEUE_DB_PATH)):
+            warnings.append("Queue mode without a shared job queue - jobs run in the web process and worker.py can't take them")
         
         # Check for any fact-checking capability
         if not any([cls.GOOGLE_FACTCHECK_API_KEY, cls.OPENAI_API_KEY, cls.NEWS_API_KEY]):
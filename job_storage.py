@@ -1,25 +1,243 @@
 """
 Job Storage Module - Handles job tracking and results storage
-Simplified version that works with your existing config
+One interface with in-memory, Redis and MongoDB backends, selected by Config.JOB_STORAGE_TYPE
 """
+import bisect
+import gzip
+import heapq
 import json
+import logging
 import os
+import secrets
 import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from config import Config
 
-class InMemoryJobStorage:
-    """In-memory storage for jobs and results"""
+try:
+    import zstandard
+    has_zstd = True
+except ImportError:
+    has_zstd = False
+
+logger = logging.getLogger(__name__)
+
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+CROCKFORD_ALPHABET = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+
+
+def _encode_base32(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        value, index = divmod(value, 32)
+        chars.append(CROCKFORD_ALPHABET[index])
+    return ''.join(reversed(chars))
+
+
+class ULIDGenerator:
+    """
+    ULID-style identifiers: 48-bit millisecond timestamp plus 80 random bits,
+    Crockford base32 encoded. IDs sort by creation time as plain strings, and
+    IDs made in the same millisecond by one process stay strictly increasing.
+    """
     
     def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+    
+    def new(self) -> str:
+        with self._lock:
+            now_ms = int(time.time() * 1000)
+            if now_ms <= self._last_ms:
+                now_ms = self._last_ms
+                random_part = self._last_random + 1
+                if random_part >= 1 << 80:
+                    now_ms += 1
+                    random_part = secrets.randbits(80)
+            else:
+                random_part = secrets.randbits(80)
+            
+            self._last_ms, self._last_random = now_ms, random_part
+        
+        return _encode_base32(now_ms, 10) + _encode_base32(random_part, 16)
+
+
+_ulid_generator = ULIDGenerator()
+
+
+def new_job_id() -> str:
+    """Collision-free, time-sortable job ID"""
+    return _ulid_generator.new()
+
+
+def job_id_floor(timestamp: float) -> str:
+    """Smallest job ID that can be created at or after the given Unix time"""
+    return _encode_base32(int(timestamp * 1000), 10) + '0' * 16
+
+
+def pack_results(job_id: str, results: Dict[str, Any]) -> bytes:
+    """Serialize results once and compress them (zstd if installed, else gzip)"""
+    data = json.dumps({
+        'job_id': job_id,
+        'stored_at': datetime.utcnow().isoformat(),
+        **results
+    }, separators=(',', ':')).encode('utf-8')
+    
+    if has_zstd:
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def unpack_results(data: bytes) -> Dict[str, Any]:
+    """Inverse of pack_results; the format is detected from the frame header"""
+    if data[:4] == ZSTD_MAGIC:
+        data = zstandard.ZstdDecompressor().decompress(data)
+    else:
+        data = gzip.decompress(data)
+    return json.loads(data)
+
+
+def _remove_sorted(ids: List[str], job_id: str) -> None:
+    """Remove an ID from a sorted list, if present"""
+    position = bisect.bisect_left(ids, job_id)
+    if position < len(ids) and ids[position] == job_id:
+        del ids[position]
+
+
+class JobStorage:
+    """Interface shared by the job storage backends"""
+    
+    # Job fields with secondary indexes for listing
+    INDEXED_FIELDS = ('status', 'source_type')
+    
+    def create_job(self, job_id: str, initial_data: Dict[str, Any]) -> None:
+        """Create a new job"""
+        raise NotImplementedError
+    
+    def update_job(self, job_id: str, updates: Dict[str, Any]) -> None:
+        """Update fields of an existing job; unknown jobs are ignored"""
+        raise NotImplementedError
+    
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job by ID"""
+        raise NotImplementedError
+    
+    def delete_job(self, job_id: str) -> None:
+        """Remove a job and its results"""
+        raise NotImplementedError
+    
+    def store_results(self, job_id: str, results: Dict[str, Any]) -> None:
+        """Store job results, compressed and apart from the job record"""
+        raise NotImplementedError
+    
+    def get_results(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get results by job ID; only called when the results are actually needed"""
+        raise NotImplementedError
+    
+    def append_partial_result(self, job_id: str, entry: Dict[str, Any]) -> None:
+        """Record one result of a running job; dropped once the final results are stored"""
+        raise NotImplementedError
+    
+    def get_partial_results(self, job_id: str, since: int = 0) -> List[Dict[str, Any]]:
+        """Partial results of a running job in arrival order, starting at offset since"""
+        raise NotImplementedError
+    
+    def save_checkpoint(self, job_id: str, checkpoint: Dict[str, Any]) -> None:
+        """Replace the resume state of a running job; dropped once the final results are stored"""
+        raise NotImplementedError
+    
+    def get_checkpoint(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Resume state saved by save_checkpoint, if any"""
+        raise NotImplementedError
+    
+    def list_jobs(self, filters: Optional[Dict[str, str]] = None, limit: int = 50,
+                  before: Optional[str] = None, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Jobs newest first, using the status/source_type indexes.
+        
+        Args:
+            filters: exact matches on indexed fields (see INDEXED_FIELDS)
+            limit: maximum number of jobs to return
+            before: only jobs with IDs below this one (the pagination cursor)
+            since: only jobs with IDs at or above this one (see job_id_floor)
+        """
+        raise NotImplementedError
+    
+    def claim_dedup_key(self, key: str, job_id: str, replace: Optional[str] = None) -> str:
+        """
+        Point a deduplication key at job_id unless it already names another job.
+        
+        Args:
+            replace: job the key may be taken from (a failed or vanished job)
+        
+        Returns:
+            The job the key names afterwards; anything but job_id means another
+            submission got there first
+        """
+        raise NotImplementedError
+    
+    def get_dedup_job(self, key: str) -> Optional[str]:
+        """Job a deduplication key currently names"""
+        raise NotImplementedError
+    
+    def release_dedup_key(self, key: str, job_id: str) -> None:
+        """Drop a deduplication key if it still names job_id"""
+        raise NotImplementedError
+    
+    def cleanup_old_jobs(self, hours: int = 24) -> None:
+        """Remove jobs older than specified hours"""
+        raise NotImplementedError
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Backend name plus any size or eviction counters it keeps"""
+        return {'backend': type(self).__name__}
+
+
+class InMemoryJobStorage(JobStorage):
+    """
+    In-memory storage for jobs and results (single process only).
+    
+    Bounded in time and size: jobs sit in a heap ordered by creation time,
+    so expiring the oldest costs O(log n) each, and once the table exceeds
+    max_bytes, finished jobs are evicted least recently read first. Jobs
+    that are still running are never evicted.
+    
+    Job IDs are kept in sorted lists, one overall and one per value of each
+    indexed field, so listings bisect to the cursor instead of scanning.
+    """
+    
+    FINISHED_STATUSES = ('completed', 'failed')
+    
+    def __init__(self, retention_hours: float = 24, max_bytes: Optional[int] = None):
         self.jobs: Dict[str, Dict[str, Any]] = {}
-        self.results: Dict[str, Dict[str, Any]] = {}
+        self.results: Dict[str, bytes] = {}  # compressed, see pack_results
+        self.partials: Dict[str, List[Dict[str, Any]]] = {}
+        self.checkpoints: Dict[str, bytes] = {}  # compressed like results
         self.lock = threading.Lock()
+        self.retention_seconds = retention_hours * 3600
+        self.max_bytes = max_bytes
         
+        self._expiry_heap: List[Tuple[float, str]] = []  # (created, job_id)
+        self._created: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}  # estimated bytes per job, record plus results
+        self._partial_bytes: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._finished: 'OrderedDict[str, None]' = OrderedDict()  # LRU order, oldest first
+        self._order: List[str] = []  # every job ID, sorted
+        self._indexes: Dict[str, Dict[Any, List[str]]] = {field: {} for field in self.INDEXED_FIELDS}
+        self._dedup: Dict[str, str] = {}  # dedup key -> job ID
+        self._dedup_keys: Dict[str, List[str]] = {}  # job ID -> its dedup keys
+        self.stats = {'expired': 0, 'evicted': 0, 'evicted_bytes': 0}
+    
     def create_job(self, job_id: str, initial_data: Dict[str, Any]) -> None:
         """Create a new job"""
+        now = time.time()
         with self.lock:
+            self._expire_locked(now - self.retention_seconds)
+            
             self.jobs[job_id] = {
                 'id': job_id,
                 'created_at': datetime.utcnow().isoformat(),
@@ -28,57 +246,502 @@ class InMemoryJobStorage:
                 'progress': 0,
                 **initial_data
             }
+            self._created[job_id] = now
+            heapq.heappush(self._expiry_heap, (now, job_id))
+            bisect.insort(self._order, job_id)
+            self._index_locked(job_id, self.jobs[job_id])
+            self._resize_locked(job_id)
     
     def update_job(self, job_id: str, updates: Dict[str, Any]) -> None:
         """Update job status"""
         with self.lock:
             if job_id in self.jobs:
-                self.jobs[job_id].update(updates)
-                self.jobs[job_id]['updated_at'] = datetime.utcnow().isoformat()
+                job = self.jobs[job_id]
+                reindex = any(field in updates for field in self.INDEXED_FIELDS)
+                if reindex:
+                    self._unindex_locked(job_id, job)
+                job.update(updates)
+                if reindex:
+                    self._index_locked(job_id, job)
+                job['updated_at'] = datetime.utcnow().isoformat()
+                
+                if job.get('status') in self.FINISHED_STATUSES:
+                    self._finished[job_id] = None
+                    self._finished.move_to_end(job_id)
+                self._resize_locked(job_id)
     
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get job by ID"""
         with self.lock:
-            return self.jobs.get(job_id)
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            self._touch_locked(job_id)
+            return dict(job)
+    
+    def delete_job(self, job_id: str) -> None:
+        """Remove a job and its results"""
+        with self.lock:
+            self._remove_locked(job_id)
     
     def store_results(self, job_id: str, results: Dict[str, Any]) -> None:
         """Store job results"""
+        # Serialize and compress outside the lock
+        packed = pack_results(job_id, results)
         with self.lock:
-            self.results[job_id] = {
-                'job_id': job_id,
-                'stored_at': datetime.utcnow().isoformat(),
-                **results
-            }
+            if job_id in self.jobs:
+                self.results[job_id] = packed
+                self._partial_bytes.pop(job_id, None)
+                self.partials.pop(job_id, None)
+                self.checkpoints.pop(job_id, None)
+                self._resize_locked(job_id)
+    
+    def append_partial_result(self, job_id: str, entry: Dict[str, Any]) -> None:
+        """Record one result of a running job"""
+        size = len(json.dumps(entry, default=str))
+        with self.lock:
+            if job_id in self.jobs:
+                self.partials.setdefault(job_id, []).append(entry)
+                self._partial_bytes[job_id] = self._partial_bytes.get(job_id, 0) + size
+                self._resize_locked(job_id)
+    
+    def get_partial_results(self, job_id: str, since: int = 0) -> List[Dict[str, Any]]:
+        """Partial results of a running job in arrival order, starting at offset since"""
+        with self.lock:
+            return list(self.partials.get(job_id, [])[since:])
+    
+    def save_checkpoint(self, job_id: str, checkpoint: Dict[str, Any]) -> None:
+        """Replace the resume state of a running job"""
+        packed = pack_results(job_id, checkpoint)
+        with self.lock:
+            if job_id in self.jobs:
+                self.checkpoints[job_id] = packed
+                self._resize_locked(job_id)
+    
+    def get_checkpoint(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Resume state saved by save_checkpoint, if any"""
+        with self.lock:
+            packed = self.checkpoints.get(job_id)
+        return unpack_results(packed) if packed is not None else None
     
     def get_results(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get results by job ID"""
         with self.lock:
-            return self.results.get(job_id)
+            packed = self.results.get(job_id)
+            if packed is not None:
+                self._touch_locked(job_id)
+        return unpack_results(packed) if packed is not None else None
+    
+    def list_jobs(self, filters: Optional[Dict[str, str]] = None, limit: int = 50,
+                  before: Optional[str] = None, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Jobs newest first, using the status/source_type indexes"""
+        filters = {field: value for field, value in (filters or {}).items() if value is not None}
+        
+        with self.lock:
+            # Walk the smallest matching index and check any other filters per job
+            ids = self._order
+            for field, value in filters.items():
+                candidates = self._indexes[field].get(value, [])
+                if len(candidates) < len(ids):
+                    ids = candidates
+            
+            end = bisect.bisect_left(ids, before) if before else len(ids)
+            start = bisect.bisect_left(ids, since) if since else 0
+            
+            jobs = []
+            for position in range(end - 1, start - 1, -1):
+                job = self.jobs[ids[position]]
+                if all(job.get(field) == value for field, value in filters.items()):
+                    jobs.append(dict(job))
+                    if len(jobs) >= limit:
+                        break
+            return jobs
+    
+    def claim_dedup_key(self, key: str, job_id: str, replace: Optional[str] = None) -> str:
+        """Point a deduplication key at job_id unless it already names another job"""
+        with self.lock:
+            current = self._dedup.get(key)
+            if current is not None and current != replace:
+                return current
+            
+            if current is not None:
+                self._dedup_keys.get(current, []).remove(key)
+            self._dedup[key] = job_id
+            self._dedup_keys.setdefault(job_id, []).append(key)
+            return job_id
+    
+    def get_dedup_job(self, key: str) -> Optional[str]:
+        """Job a deduplication key currently names"""
+        with self.lock:
+            return self._dedup.get(key)
+    
+    def release_dedup_key(self, key: str, job_id: str) -> None:
+        """Drop a deduplication key if it still names job_id"""
+        with self.lock:
+            if self._dedup.get(key) == job_id:
+                del self._dedup[key]
+                self._dedup_keys.get(job_id, []).remove(key)
     
     def cleanup_old_jobs(self, hours: int = 24) -> None:
         """Remove jobs older than specified hours"""
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
         with self.lock:
-            # Clean up old jobs
-            old_job_ids = []
-            for job_id, job in self.jobs.items():
-                created = datetime.fromisoformat(job['created_at'])
-                if created < cutoff:
-                    old_job_ids.append(job_id)
+            self._expire_locked(time.time() - hours * 3600)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Job table size and eviction counters"""
+        with self.lock:
+            return {
+                'backend': 'memory',
+                'jobs': len(self.jobs),
+                'by_status': {status: len(ids) for status, ids in self._indexes['status'].items()},
+                'finished_jobs': len(self._finished),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                **self.stats
+            }
+    
+    def _touch_locked(self, job_id: str) -> None:
+        if job_id in self._finished:
+            self._finished.move_to_end(job_id)
+    
+    def _resize_locked(self, job_id: str) -> None:
+        size = (len(json.dumps(self.jobs[job_id], default=str)) + len(self.results.get(job_id, b''))
+                + self._partial_bytes.get(job_id, 0) + len(self.checkpoints.get(job_id, b'')))
+        self._total_bytes += size - self._sizes.get(job_id, 0)
+        self._sizes[job_id] = size
+        
+        if self.max_bytes is not None and self._total_bytes > self.max_bytes:
+            self._evict_locked()
+    
+    def _evict_locked(self) -> None:
+        while self._total_bytes > self.max_bytes and self._finished:
+            job_id = next(iter(self._finished))
+            self.stats['evicted'] += 1
+            self.stats['evicted_bytes'] += self._sizes.get(job_id, 0)
+            self._remove_locked(job_id)
+        
+        if self._total_bytes > self.max_bytes:
+            logger.warning(f"Job table holds {self._total_bytes} bytes of running jobs, over its {self.max_bytes} byte budget")
+    
+    def _expire_locked(self, cutoff: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] < cutoff:
+            created, job_id = heapq.heappop(heap)
+            # Entries for deleted or evicted jobs are dropped lazily
+            if self._created.get(job_id) == created:
+                self.stats['expired'] += 1
+                self._remove_locked(job_id)
+    
+    def _index_locked(self, job_id: str, job: Dict[str, Any]) -> None:
+        for field in self.INDEXED_FIELDS:
+            value = job.get(field)
+            if value is not None:
+                bisect.insort(self._indexes[field].setdefault(value, []), job_id)
+    
+    def _unindex_locked(self, job_id: str, job: Dict[str, Any]) -> None:
+        for field in self.INDEXED_FIELDS:
+            ids = self._indexes[field].get(job.get(field))
+            if ids is None:
+                continue
+            _remove_sorted(ids, job_id)
+            if not ids:
+                del self._indexes[field][job.get(field)]
+    
+    def _remove_locked(self, job_id: str) -> None:
+        job = self.jobs.get(job_id)
+        if job is not None:
+            self._unindex_locked(job_id, job)
+            _remove_sorted(self._order, job_id)
+        self.jobs.pop(job_id, None)
+        self.results.pop(job_id, None)
+        self.partials.pop(job_id, None)
+        self._partial_bytes.pop(job_id, None)
+        self.checkpoints.pop(job_id, None)
+        self._created.pop(job_id, None)
+        self._finished.pop(job_id, None)
+        for key in self._dedup_keys.pop(job_id, []):
+            if self._dedup.get(key) == job_id:
+                del self._dedup[key]
+        self._total_bytes -= self._sizes.pop(job_id, 0)
+
+
+# Redis storage implementation (optional, only if Redis is configured)
+try:
+    import redis
+    from redis.exceptions import WatchError
+    has_redis = True
+except ImportError:
+    has_redis = False
+    
+    class WatchError(Exception):
+        """Stands in for redis.WatchError so the compare-and-set paths still resolve"""
+
+
+class RedisJobStorage(JobStorage):
+    """
+    Redis-based storage shared by every app worker.
+    
+    Each job is a hash with one JSON-encoded field per job attribute, so
+    progress updates rewrite only the fields that changed. Results live
+    under their own key. Both keys expire after the retention period.
+    
+    Listings use sorted sets of job IDs, all scored 0 so they order
+    lexicographically, which for ULIDs means by creation time. Members of
+    expired jobs are skipped when listed and pruned by cleanup_old_jobs.
+    """
+    
+    def __init__(self, url: Optional[str] = None, client=None, retention_hours: int = 24,
+                 prefix: str = 'factchecker'):
+        if client is None:
+            if not has_redis:
+                raise ImportError("redis not installed")
+            client = redis.Redis.from_url(url)
+            client.ping()
+        
+        # Any redis-py compatible client works, e.g. fakeredis for local runs
+        self.client = client
+        self.ttl = int(retention_hours * 3600)
+        self.prefix = prefix
+    
+    def _job_key(self, job_id: str) -> str:
+        return f'{self.prefix}:job:{job_id}'
+    
+    def _results_key(self, job_id: str) -> str:
+        return f'{self.prefix}:results:{job_id}'
+    
+    def _partial_key(self, job_id: str) -> str:
+        return f'{self.prefix}:partial:{job_id}'
+    
+    def _checkpoint_key(self, job_id: str) -> str:
+        return f'{self.prefix}:checkpoint:{job_id}'
+    
+    def _dedup_key(self, key: str) -> str:
+        return f'{self.prefix}:dedup:{key}'
+    
+    def _index_key(self, field: Optional[str] = None, value: Any = None) -> str:
+        if field is None:
+            return f'{self.prefix}:index:all'
+        return f'{self.prefix}:index:{field}:{value}'
+    
+    @staticmethod
+    def _encode(data: Dict[str, Any]) -> Dict[str, str]:
+        return {field: json.dumps(value) for field, value in data.items()}
+    
+    @staticmethod
+    def _decode(data: Dict) -> Dict[str, Any]:
+        return {
+            (field.decode('utf-8') if isinstance(field, bytes) else field): json.loads(value)
+            for field, value in data.items()
+        }
+    
+    def create_job(self, job_id: str, initial_data: Dict[str, Any]) -> None:
+        """Create a new job"""
+        now = datetime.utcnow().isoformat()
+        job_data = {
+            'id': job_id,
+            'created_at': now,
+            'updated_at': now,
+            'status': 'created',
+            'progress': 0,
+            **initial_data
+        }
+        key = self._job_key(job_id)
+        pipe = self.client.pipeline()
+        pipe.hset(key, mapping=self._encode(job_data))
+        pipe.expire(key, self.ttl)
+        pipe.zadd(self._index_key(), {job_id: 0})
+        for field in self.INDEXED_FIELDS:
+            if job_data.get(field) is not None:
+                pipe.zadd(self._index_key(field, job_data[field]), {job_id: 0})
+        pipe.execute()
+    
+    def update_job(self, job_id: str, updates: Dict[str, Any]) -> None:
+        """
+        Update job status.
+        
+        The existence check and the write run in one WATCH/MULTI transaction,
+        so a job that expires in between isn't recreated without a TTL.
+        """
+        key = self._job_key(job_id)
+        indexed = [field for field in self.INDEXED_FIELDS if field in updates]
+        updates = {**updates, 'updated_at': datetime.utcnow().isoformat()}
+        
+        with self.client.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(key)
+                    if indexed:
+                        previous = pipe.hmget(key, indexed)
+                        if all(value is None for value in previous):
+                            return
+                    elif not pipe.exists(key):
+                        return
+                    
+                    pipe.multi()
+                    pipe.hset(key, mapping=self._encode(updates))
+                    for field, old_value in zip(indexed, previous if indexed else []):
+                        if old_value is not None:
+                            pipe.zrem(self._index_key(field, json.loads(old_value)), job_id)
+                        if updates[field] is not None:
+                            pipe.zadd(self._index_key(field, updates[field]), {job_id: 0})
+                    pipe.execute()
+                    return
+                except WatchError:
+                    # Changed or expired since the check; look again
+                    continue
+    
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job by ID"""
+        data = self.client.hgetall(self._job_key(job_id))
+        return self._decode(data) if data else None
+    
+    def delete_job(self, job_id: str) -> None:
+        """Remove a job and its results"""
+        values = self.client.hmget(self._job_key(job_id), list(self.INDEXED_FIELDS))
+        pipe = self.client.pipeline()
+        pipe.delete(self._job_key(job_id), self._results_key(job_id), self._partial_key(job_id),
+                    self._checkpoint_key(job_id))
+        pipe.zrem(self._index_key(), job_id)
+        for field, value in zip(self.INDEXED_FIELDS, values):
+            if value is not None:
+                pipe.zrem(self._index_key(field, json.loads(value)), job_id)
+        pipe.execute()
+    
+    def store_results(self, job_id: str, results: Dict[str, Any]) -> None:
+        """Store job results"""
+        pipe = self.client.pipeline()
+        pipe.set(self._results_key(job_id), pack_results(job_id, results), ex=self.ttl)
+        pipe.delete(self._partial_key(job_id), self._checkpoint_key(job_id))
+        pipe.execute()
+    
+    def get_results(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get results by job ID"""
+        data = self.client.get(self._results_key(job_id))
+        return unpack_results(data) if data else None
+    
+    def append_partial_result(self, job_id: str, entry: Dict[str, Any]) -> None:
+        """Record one result of a running job"""
+        key = self._partial_key(job_id)
+        pipe = self.client.pipeline()
+        pipe.rpush(key, json.dumps(entry))
+        pipe.expire(key, self.ttl)
+        pipe.execute()
+    
+    def get_partial_results(self, job_id: str, since: int = 0) -> List[Dict[str, Any]]:
+        """Partial results of a running job in arrival order, starting at offset since"""
+        return [json.loads(item) for item in self.client.lrange(self._partial_key(job_id), since, -1)]
+    
+    def save_checkpoint(self, job_id: str, checkpoint: Dict[str, Any]) -> None:
+        """Replace the resume state of a running job"""
+        self.client.set(self._checkpoint_key(job_id), pack_results(job_id, checkpoint), ex=self.ttl)
+    
+    def get_checkpoint(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Resume state saved by save_checkpoint, if any"""
+        data = self.client.get(self._checkpoint_key(job_id))
+        return unpack_results(data) if data else None
+    
+    def list_jobs(self, filters: Optional[Dict[str, str]] = None, limit: int = 50,
+                  before: Optional[str] = None, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Jobs newest first, using the status/source_type indexes"""
+        filters = {field: value for field, value in (filters or {}).items() if value is not None}
+        keys = [self._index_key(field, value) for field, value in filters.items()] or [self._index_key()]
+        
+        # Walk the smallest matching index and check any other filters per job
+        pipe = self.client.pipeline()
+        for key in keys:
+            pipe.zcard(key)
+        key = min(zip(pipe.execute(), keys))[1]
+        
+        upper = f'({before}' if before else '+'
+        lower = f'[{since}' if since else '-'
+        jobs = []
+        while len(jobs) < limit:
+            ids = self.client.zrevrangebylex(key, upper, lower, start=0, num=limit)
+            if not ids:
+                break
+            ids = [job_id.decode('utf-8') if isinstance(job_id, bytes) else job_id for job_id in ids]
+            
+            pipe = self.client.pipeline()
+            for job_id in ids:
+                pipe.hgetall(self._job_key(job_id))
+            
+            stale = []
+            for job_id, data in zip(ids, pipe.execute()):
+                if not data:
+                    stale.append(job_id)
+                    continue
+                job = self._decode(data)
+                if all(job.get(field) == value for field, value in filters.items()):
+                    jobs.append(job)
+                    if len(jobs) >= limit:
+                        break
             
-            for job_id in old_job_ids:
-                self.jobs.pop(job_id, None)
-                self.results.pop(job_id, None)
+            if stale:
+                self.client.zrem(key, *stale)
+            upper = f'({ids[-1]}'
+        
+        return jobs
+    
+    def claim_dedup_key(self, key: str, job_id: str, replace: Optional[str] = None) -> str:
+        """Point a deduplication key at job_id unless it already names another job"""
+        redis_key = self._dedup_key(key)
+        if self.client.set(redis_key, job_id, nx=True, ex=self.ttl):
+            return job_id
+        
+        # Compare-and-set so only one submission can take over a stale key
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(redis_key)
+                current = pipe.get(redis_key)
+                current = current.decode('utf-8') if isinstance(current, bytes) else current
+                if current is not None and current != replace:
+                    return current
+                
+                pipe.multi()
+                pipe.set(redis_key, job_id, ex=self.ttl)
+                pipe.execute()
+                return job_id
+            except WatchError:
+                current = self.client.get(redis_key)
+                return current.decode('utf-8') if isinstance(current, bytes) else current
+    
+    def get_dedup_job(self, key: str) -> Optional[str]:
+        """Job a deduplication key currently names"""
+        current = self.client.get(self._dedup_key(key))
+        return current.decode('utf-8') if isinstance(current, bytes) else current
+    
+    def release_dedup_key(self, key: str, job_id: str) -> None:
+        """Drop a deduplication key if it still names job_id"""
+        redis_key = self._dedup_key(key)
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(redis_key)
+                current = pipe.get(redis_key)
+                current = current.decode('utf-8') if isinstance(current, bytes) else current
+                if current != job_id:
+                    return
+                pipe.multi()
+                pipe.delete(redis_key)
+                pipe.execute()
+            except WatchError:
+                pass
+    
+    def cleanup_old_jobs(self, hours: int = 24) -> None:
+        """Prune index entries older than the retention period; Redis expires the job keys itself"""
+        floor = job_id_floor(time.time() - hours * 3600)
+        for key in self.client.scan_iter(match=f'{self.prefix}:index:*'):
+            self.client.zremrangebylex(key, '-', f'({floor}')
 
 
 # MongoDB storage implementation (optional, only if MongoDB is configured)
 try:
     from pymongo import MongoClient
+    from pymongo.errors import DuplicateKeyError
     has_mongodb = True
 except ImportError:
     has_mongodb = False
 
-class MongoJobStorage:
+class MongoJobStorage(JobStorage):
     """MongoDB-based storage for jobs and results"""
     
     def __init__(self, uri: str, db_name: str):
@@ -89,6 +752,13 @@ class MongoJobStorage:
         self.db = self.client[db_name]
         self.jobs_collection = self.db.jobs
         self.results_collection = self.db.results
+        self.partials_collection = self.db.partial_results
+        self.checkpoints_collection = self.db.checkpoints
+        self.dedup_collection = self.db.job_dedup
+        
+        # Job IDs sort by creation time, so (field, _id) indexes serve filtered listings
+        for field in self.INDEXED_FIELDS:
+            self.jobs_collection.create_index([(field, 1), ('_id', -1)])
     
     def create_job(self, job_id: str, initial_data: Dict[str, Any]) -> None:
         """Create a new job"""
@@ -104,7 +774,7 @@ class MongoJobStorage:
     
     def update_job(self, job_id: str, updates: Dict[str, Any]) -> None:
         """Update job status"""
-        updates['updated_at'] = datetime.utcnow()
+        updates = {**updates, 'updated_at': datetime.utcnow()}
         self.jobs_collection.update_one(
             {'_id': job_id},
             {'$set': updates}
@@ -122,32 +792,118 @@ class MongoJobStorage:
                 job['updated_at'] = job['updated_at'].isoformat()
         return job
     
+    def delete_job(self, job_id: str) -> None:
+        """Remove a job and its results"""
+        self.jobs_collection.delete_one({'_id': job_id})
+        self.results_collection.delete_one({'_id': job_id})
+        self.partials_collection.delete_one({'_id': job_id})
+        self.checkpoints_collection.delete_one({'_id': job_id})
+    
     def store_results(self, job_id: str, results: Dict[str, Any]) -> None:
         """Store job results"""
         results_data = {
             '_id': job_id,
             'stored_at': datetime.utcnow(),
-            **results
+            'data': pack_results(job_id, results)
         }
         self.results_collection.replace_one(
             {'_id': job_id},
             results_data,
             upsert=True
         )
+        self.partials_collection.delete_one({'_id': job_id})
+        self.checkpoints_collection.delete_one({'_id': job_id})
     
     def get_results(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get results by job ID"""
         results = self.results_collection.find_one({'_id': job_id})
+        if results and 'data' in results:
+            return unpack_results(bytes(results['data']))
+        
         if results:
+            # Stored uncompressed by an older version
             results['job_id'] = results.pop('_id')
             # Convert datetime objects to ISO format strings
             if isinstance(results.get('stored_at'), datetime):
                 results['stored_at'] = results['stored_at'].isoformat()
         return results
     
+    def append_partial_result(self, job_id: str, entry: Dict[str, Any]) -> None:
+        """Record one result of a running job"""
+        self.partials_collection.update_one(
+            {'_id': job_id},
+            {'$push': {'entries': entry}, '$setOnInsert': {'created_at': datetime.utcnow()}},
+            upsert=True
+        )
+    
+    def get_partial_results(self, job_id: str, since: int = 0) -> List[Dict[str, Any]]:
+        """Partial results of a running job in arrival order, starting at offset since"""
+        doc = self.partials_collection.find_one({'_id': job_id}, {'entries': 1})
+        return doc.get('entries', [])[since:] if doc else []
+    
+    def save_checkpoint(self, job_id: str, checkpoint: Dict[str, Any]) -> None:
+        """Replace the resume state of a running job"""
+        self.checkpoints_collection.replace_one(
+            {'_id': job_id},
+            {'_id': job_id, 'created_at': datetime.utcnow(), 'data': pack_results(job_id, checkpoint)},
+            upsert=True
+        )
+    
+    def get_checkpoint(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Resume state saved by save_checkpoint, if any"""
+        doc = self.checkpoints_collection.find_one({'_id': job_id})
+        return unpack_results(bytes(doc['data'])) if doc else None
+    
+    def list_jobs(self, filters: Optional[Dict[str, str]] = None, limit: int = 50,
+                  before: Optional[str] = None, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Jobs newest first, using the status/source_type indexes"""
+        query = {field: value for field, value in (filters or {}).items() if value is not None}
+        id_range = {}
+        if before:
+            id_range['$lt'] = before
+        if since:
+            id_range['$gte'] = since
+        if id_range:
+            query['_id'] = id_range
+        
+        jobs = []
+        for job in self.jobs_collection.find(query).sort('_id', -1).limit(limit):
+            job['id'] = job.pop('_id')
+            for field in ('created_at', 'updated_at'):
+                if isinstance(job.get(field), datetime):
+                    job[field] = job[field].isoformat()
+            jobs.append(job)
+        return jobs
+    
+    def claim_dedup_key(self, key: str, job_id: str, replace: Optional[str] = None) -> str:
+        """Point a deduplication key at job_id unless it already names another job"""
+        try:
+            self.dedup_collection.insert_one({'_id': key, 'job_id': job_id, 'created_at': datetime.utcnow()})
+            return job_id
+        except DuplicateKeyError:
+            pass
+        
+        if replace is not None:
+            self.dedup_collection.update_one(
+                {'_id': key, 'job_id': replace},
+                {'$set': {'job_id': job_id, 'created_at': datetime.utcnow()}}
+            )
+        current = self.dedup_collection.find_one({'_id': key})
+        return current['job_id'] if current else self.claim_dedup_key(key, job_id)
+    
+    def get_dedup_job(self, key: str) -> Optional[str]:
+        """Job a deduplication key currently names"""
+        current = self.dedup_collection.find_one({'_id': key})
+        return current['job_id'] if current else None
+    
+    def release_dedup_key(self, key: str, job_id: str) -> None:
+        """Drop a deduplication key if it still names job_id"""
+        self.dedup_collection.delete_one({'_id': key, 'job_id': job_id})
+    
     def cleanup_old_jobs(self, hours: int = 24) -> None:
         """Remove jobs older than specified hours"""
         cutoff = datetime.utcnow() - timedelta(hours=hours)
+        self.dedup_collection.delete_many({'created_at': {'$lt': cutoff}})
         
         # Get old job IDs
         old_jobs = self.jobs_collection.find(
@@ -160,6 +916,8 @@ class MongoJobStorage:
         if old_job_ids:
             self.jobs_collection.delete_many({'_id': {'$in': old_job_ids}})
             self.results_collection.delete_many({'_id': {'$in': old_job_ids}})
+            self.partials_collection.delete_many({'_id': {'$in': old_job_ids}})
+            self.checkpoints_collection.delete_many({'_id': {'$in': old_job_ids}})
 
 
 # Singleton instance
@@ -167,27 +925,39 @@ _storage_instance = None
 _storage_lock = threading.Lock()
 
 
-def get_job_storage():
+def get_job_storage() -> JobStorage:
     """Get the job storage instance (singleton)"""
     global _storage_instance
     
     with _storage_lock:
         if _storage_instance is None:
             # Check configuration to determine storage type
-            if Config.JOB_STORAGE_TYPE == 'mongodb' and Config.MONGODB_URI and has_mongodb:
-                try:
+            storage_type = Config.JOB_STORAGE_TYPE
+            try:
+                if storage_type == 'redis' and Config.REDIS_URL:
+                    _storage_instance = RedisJobStorage(
+                        Config.REDIS_URL,
+                        retention_hours=Config.JOB_RETENTION_HOURS
+                    )
+                    logger.info("Using Redis for job storage")
+                elif storage_type == 'mongodb' and Config.MONGODB_URI and has_mongodb:
                     _storage_instance = MongoJobStorage(
                         Config.MONGODB_URI,
                         Config.MONGODB_DB_NAME
                     )
-                    print("Using MongoDB for job storage")
-                except Exception as e:
-                    print(f"Failed to connect to MongoDB: {e}")
-                    print("Falling back to in-memory storage")
-                    _storage_instance = InMemoryJobStorage()
-            else:
-                print("Using in-memory job storage")
-                _storage_instance = InMemoryJobStorage()
+                    logger.info("Using MongoDB for job storage")
+            except Exception as e:
+                logger.error(f"Failed to connect to {storage_type} job storage: {e}")
+                logger.warning("Falling back to in-memory storage")
+            
+            if _storage_instance is None:
+                if storage_type != 'memory':
+                    logger.warning(f"Job storage '{storage_type}' is not available")
+                logger.info("Using in-memory job storage")
+                _storage_instance = InMemoryJobStorage(
+                    retention_hours=Config.JOB_RETENTION_HOURS,
+                    max_bytes=Config.JOB_STORAGE_MAX_BYTES
+                )
     
     return _storage_instance
 
@@ -203,7 +973,7 @@ def start_cleanup_task(interval_hours: int = 1):
             try:
                 storage.cleanup_old_jobs(Config.JOB_RETENTION_HOURS)
             except Exception as e:
-                print(f"Error in cleanup task: {e}")
+                logger.error(f"Error in cleanup task: {e}")
             
             # Sleep for the interval
             time.sleep(interval_hours * 3600)
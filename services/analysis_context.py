@@ -0,0 +1,58 @@
+"""
+Analysis Context Module
+Holds per-job analysis state so shared services can serve concurrent jobs
+"""
+import threading
+from collections import defaultdict, deque
+from typing import Dict, List, Optional
+
+
+class AnalysisContext:
+    """State for a single transcript analysis, shared by all of its claim checks"""
+
+    def __init__(self, transcript: str = '', topics: Optional[List[str]] = None,
+                 job_id: Optional[str] = None, max_context_size: int = 10):
+        self.job_id = job_id
+        self.transcript = transcript or ''
+        self.topics = list(topics or [])
+        self.entities = defaultdict(list)
+        self.previous_claims = deque(maxlen=max_context_size)
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_context(cls, context: Optional[Dict]) -> 'AnalysisContext':
+        """Return the AnalysisContext carried by a claim context, building one if absent"""
+        context = context or {}
+        analysis = context.get('analysis')
+        if isinstance(analysis, cls):
+            return analysis
+
+        return cls(
+            transcript=context.get('transcript', ''),
+            topics=context.get('topics')
+        )
+
+    def add_claim(self, claim: str) -> None:
+        """Remember a claim for resolving references in later claims"""
+        with self.lock:
+            self.previous_claims.append(claim)
+
+    def get_previous_claims(self) -> List[str]:
+        """Snapshot of recently seen claims, oldest first"""
+        with self.lock:
+            return list(self.previous_claims)
+
+    def add_entities(self, kind: str, values: List[str]) -> None:
+        """Record entities of the given kind found in the transcript"""
+        with self.lock:
+            self.entities[kind].extend(values)
+
+    def set_entities(self, kind: str, values: List[str]) -> None:
+        """Replace the entities recorded for the given kind"""
+        with self.lock:
+            self.entities[kind] = list(values)
+
+    def get_entities(self) -> Dict[str, List[str]]:
+        """Snapshot of all recorded entities"""
+        with self.lock:
+            return {kind: list(values) for kind, values in self.entities.items()}
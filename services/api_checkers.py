@@ -4,18 +4,21 @@ API Checker Modules - Complete implementation
 Individual API checking methods for various fact-checking sources
 """
 import re
+import asyncio
 import logging
 import aiohttp
 import json
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from .deadline import Deadline
+
 logger = logging.getLogger(__name__)
 
 class APICheckers:
     """Collection of API checking methods"""
     
-    def __init__(self, api_keys: Dict[str, str]):
+    def __init__(self, api_keys: Dict[str, str], config=None):
         self.google_api_key = api_keys.get('google')
         self.fred_api_key = api_keys.get('fred')
         self.openai_api_key = api_keys.get('openai')
@@ -39,6 +42,45 @@ class APICheckers:
             'manufacturing': 'IPMAN',
             'recession': 'USREC'
         }
+        
+        # Shared HTTP client - one pooled session per event loop, created on first use
+        self.request_timeout = getattr(config, 'API_TIMEOUT', 10)
+        self.pool_limit = getattr(config, 'API_POOL_LIMIT', 100)
+        self.pool_limit_per_host = getattr(config, 'API_POOL_LIMIT_PER_HOST', 10)
+        self.dns_cache_ttl = getattr(config, 'API_DNS_CACHE_TTL', 300)
+        self.keepalive_timeout = getattr(config, 'API_KEEPALIVE_TIMEOUT', 30)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session for the running event loop, creating it if needed"""
+        loop = asyncio.get_running_loop()
+        
+        if self._session is not None and not self._session.closed and self._session_loop is loop:
+            return self._session
+        
+        if self._session is not None and not self._session.closed:
+            # Sessions are bound to the loop that created them and can't be reused here
+            logger.warning("API client session was not closed before its event loop changed")
+        
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_limit,
+            limit_per_host=self.pool_limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+        )
+        self._session_loop = loop
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared session and its pooled connections"""
+        session, self._session, self._session_loop = self._session, None, None
+        if session is not None and not session.closed:
+            await session.close()
     
     async def check_google_factcheck(self, claim: str) -> Dict:
         """Check Google Fact Check API"""
@@ -52,34 +94,94 @@ class APICheckers:
                 'languageCode': 'en'
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    'https://factchecktools.googleapis.com/v1alpha1/claims:search',
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        if data.get('claims'):
-                            claim_data = data['claims'][0]
-                            review = claim_data.get('claimReview', [{}])[0]
-                            
-                            return {
-                                'found': True,
-                                'verdict': self._parse_google_verdict(review.get('textualRating', '')),
-                                'explanation': review.get('text', 'Fact-check available from Google Fact Check API'),
-                                'confidence': 80,
-                                'source': review.get('publisher', {}).get('name', 'Google Fact Check'),
-                                'url': review.get('url', '')
-                            }
+            session = await self._get_session()
+            async with session.get(
+                'https://factchecktools.googleapis.com/v1alpha1/claims:search',
+                params=params
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    
+                    if data.get('claims'):
+                        claim_data = data['claims'][0]
+                        review = claim_data.get('claimReview', [{}])[0]
                         
-                    return {'found': False}
+                        return {
+                            'found': True,
+                            'verdict': self._parse_google_verdict(review.get('textualRating', '')),
+                            'explanation': review.get('text', 'Fact-check available from Google Fact Check API'),
+                            'confidence': 80,
+                            'source': review.get('publisher', {}).get('name', 'Google Fact Check'),
+                            'url': review.get('url', '')
+                        }
                     
+                return {'found': False}
+                
         except Exception as e:
             logger.error(f"Google Fact Check API error: {e}")
             return {'found': False}
     
+    async def gather_evidence(self, claim: str, timeout: Optional[float] = None,
+                              stop_confidence: Optional[int] = None,
+                              deadline: Optional[Deadline] = None) -> List[Dict]:
+        """
+        Query every configured source for a claim concurrently.
+        
+        Each source gets its own timeout budget, cut short by the claim's
+        deadline; once a source returns a result at or above stop_confidence,
+        the sources still running are cancelled.
+        
+        Returns:
+            Results that found something, in completion order
+        """
+        timeout = self.request_timeout if timeout is None else timeout
+        if deadline is not None:
+            if deadline.expired():
+                return []
+            timeout = deadline.timeout(cap=timeout)
+        sources = {
+            'google': (self.google_api_key, self.check_google_factcheck),
+            'fred': (self.fred_api_key, self.check_fred_data),
+            'newsapi': (self.news_api_key, self._check_newsapi),
+            'mediastack': (self.mediastack_api_key, self._check_mediastack)
+        }
+        
+        tasks = {
+            asyncio.ensure_future(asyncio.wait_for(check(claim), timeout)): name
+            for name, (api_key, check) in sources.items() if api_key
+        }
+        
+        results = []
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        result = task.result()
+                    except asyncio.TimeoutError:
+                        logger.warning(f"{tasks[task]} check timed out after {timeout:.1f}s")
+                        continue
+                    except Exception as e:
+                        logger.warning(f"{tasks[task]} check failed: {e}")
+                        continue
+                    
+                    if result and result.get('found'):
+                        results.append(result)
+                
+                if stop_confidence is not None and pending and any(
+                    r.get('confidence', 0) >= stop_confidence for r in results
+                ):
+                    logger.debug(f"High-confidence evidence found, cancelling {len(pending)} remaining checks")
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        return results
+    
     def _parse_google_verdict(self, textual_rating: str) -> str:
         """Parse Google's textual rating to our verdict system"""
         if not textual_rating:
@@ -114,31 +216,31 @@ class APICheckers:
             for keyword, series_id in self.fred_series.items():
                 if keyword in claim_lower:
                     # Get recent data for this series
-                    async with aiohttp.ClientSession() as session:
-                        url = f"https://api.stlouisfed.org/fred/series/observations"
-                        params = {
-                            'series_id': series_id,
-                            'api_key': self.fred_api_key,
-                            'file_type': 'json',
-                            'limit': 12,  # Last 12 observations
-                            'sort_order': 'desc'
-                        }
-                        
-                        async with session.get(url, params=params) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                observations = data.get('observations', [])
-                                
-                                if observations:
-                                    latest = observations[0]
-                                    return {
-                                        'found': True,
-                                        'verdict': 'needs_context',
-                                        'explanation': f"Latest {keyword} data from FRED: {latest.get('value')} as of {latest.get('date')}",
-                                        'confidence': 75,
-                                        'source': 'Federal Reserve Economic Data (FRED)',
-                                        'data': observations
-                                    }
+                    session = await self._get_session()
+                    url = f"https://api.stlouisfed.org/fred/series/observations"
+                    params = {
+                        'series_id': series_id,
+                        'api_key': self.fred_api_key,
+                        'file_type': 'json',
+                        'limit': 12,  # Last 12 observations
+                        'sort_order': 'desc'
+                    }
+                    
+                    async with session.get(url, params=params) as response:
+                        if response.status == 200:
+                            data = await response.json()
+                            observations = data.get('observations', [])
+                            
+                            if observations:
+                                latest = observations[0]
+                                return {
+                                    'found': True,
+                                    'verdict': 'needs_context',
+                                    'explanation': f"Latest {keyword} data from FRED: {latest.get('value')} as of {latest.get('date')}",
+                                    'confidence': 75,
+                                    'source': 'Federal Reserve Economic Data (FRED)',
+                                    'data': observations
+                                }
             
             return {'found': False}
             
@@ -174,30 +276,30 @@ class APICheckers:
             
             query = ' AND '.join(key_terms[:3])  # Use top 3 terms
             
-            async with aiohttp.ClientSession() as session:
-                url = "https://newsapi.org/v2/everything"
-                params = {
-                    'q': query,
-                    'apiKey': self.news_api_key,
-                    'language': 'en',
-                    'sortBy': 'relevancy',
-                    'pageSize': 5
-                }
-                
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        articles = data.get('articles', [])
-                        
-                        if articles:
-                            return {
-                                'found': True,
-                                'verdict': 'needs_context',
-                                'explanation': f"Found {len(articles)} recent news articles related to this claim",
-                                'confidence': 60,
-                                'source': 'NewsAPI',
-                                'articles': [{'title': a['title'], 'url': a['url']} for a in articles[:3]]
-                            }
+            session = await self._get_session()
+            url = "https://newsapi.org/v2/everything"
+            params = {
+                'q': query,
+                'apiKey': self.news_api_key,
+                'language': 'en',
+                'sortBy': 'relevancy',
+                'pageSize': 5
+            }
+            
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    articles = data.get('articles', [])
+                    
+                    if articles:
+                        return {
+                            'found': True,
+                            'verdict': 'needs_context',
+                            'explanation': f"Found {len(articles)} recent news articles related to this claim",
+                            'confidence': 60,
+                            'source': 'NewsAPI',
+                            'articles': [{'title': a['title'], 'url': a['url']} for a in articles[:3]]
+                        }
             
             return {'found': False}
             
@@ -214,29 +316,29 @@ class APICheckers:
             
             query = ' '.join(key_terms[:3])
             
-            async with aiohttp.ClientSession() as session:
-                url = "http://api.mediastack.com/v1/news"
-                params = {
-                    'access_key': self.mediastack_api_key,
-                    'keywords': query,
-                    'languages': 'en',
-                    'limit': 5
-                }
-                
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        articles = data.get('data', [])
-                        
-                        if articles:
-                            return {
-                                'found': True,
-                                'verdict': 'needs_context',
-                                'explanation': f"Found {len(articles)} recent articles from MediaStack",
-                                'confidence': 60,
-                                'source': 'MediaStack',
-                                'articles': [{'title': a['title'], 'url': a['url']} for a in articles[:3]]
-                            }
+            session = await self._get_session()
+            url = "http://api.mediastack.com/v1/news"
+            params = {
+                'access_key': self.mediastack_api_key,
+                'keywords': query,
+                'languages': 'en',
+                'limit': 5
+            }
+            
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    articles = data.get('data', [])
+                    
+                    if articles:
+                        return {
+                            'found': True,
+                            'verdict': 'needs_context',
+                            'explanation': f"Found {len(articles)} recent articles from MediaStack",
+                            'confidence': 60,
+                            'source': 'MediaStack',
+                            'articles': [{'title': a['title'], 'url': a['url']} for a in articles[:3]]
+                        }
             
             return {'found': False}
             
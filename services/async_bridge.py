@@ -0,0 +1,112 @@
+"""
+Async Bridge Module
+Runs a long-lived asyncio event loop on a background thread for sync callers
+"""
+import asyncio
+import logging
+import threading
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLoopThread:
+    """
+    A single event loop running on a daemon thread.
+
+    Worker threads hand coroutines to run(), which schedules them on the loop
+    and blocks for the result, so loop-bound resources such as HTTP sessions
+    are created once and shared instead of per call.
+    """
+
+    def __init__(self, name: str = 'async-loop'):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"{self.name} has been shut down")
+
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run_loop, name=self.name, daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+                logger.info(f"Started background event loop '{self.name}'")
+
+            return self._loop
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the background loop and wait for its result.
+
+        Raises:
+            concurrent.futures.TimeoutError: the result wasn't ready in time;
+                the coroutine is cancelled
+        """
+        try:
+            loop = self._ensure_started()
+        except RuntimeError:
+            coro.close()
+            raise
+
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError('run() called from the event loop thread would deadlock')
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def shutdown(self, cleanup: Optional[Coroutine] = None, timeout: float = 5) -> None:
+        """Run an optional cleanup coroutine, cancel pending tasks and stop the loop"""
+        with self._lock:
+            if self._closed:
+                if cleanup is not None:
+                    cleanup.close()
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+
+        if loop is None:
+            if cleanup is not None:
+                cleanup.close()
+            return
+
+        async def finish():
+            if cleanup is not None:
+                try:
+                    await cleanup
+                except Exception as e:
+                    logger.warning(f"Cleanup on '{self.name}' failed: {e}")
+
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(finish(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Background event loop '{self.name}' did not drain cleanly: {e}")
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+        logger.info(f"Stopped background event loop '{self.name}'")
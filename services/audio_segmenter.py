@@ -0,0 +1,195 @@
+"""
+Audio Segmenter Module
+Splits PCM audio into speech segments at pauses, dropping silence
+"""
+import logging
+from typing import Dict, Iterable, Iterator, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Full scale of 16-bit samples, the reference for dBFS thresholds
+FULL_SCALE = 32768.0
+
+
+class AudioSegmenter:
+    """
+    Energy-based voice activity segmentation over raw 16-bit mono PCM.
+
+    Audio is scored in short frames by RMS energy. A frame is speech when
+    it is above both an absolute floor (silence_threshold_db, in dBFS) and
+    noise_ratio times the clip's noise floor, so steady background hum
+    doesn't count as speech. Speech separated by less than min_silence_ms
+    is one region; regions are padded, then packed into segments of up to
+    max_segment_seconds, split only across pauses. A region longer than
+    that is cut at its quietest frame near the limit. Silence longer than
+    max_gap_seconds always ends a segment and is never sent for
+    recognition.
+    """
+
+    def __init__(self, sample_rate: int = 16000, frame_ms: int = 30, max_segment_seconds: float = 60,
+                 min_silence_ms: int = 400, min_speech_ms: int = 250, padding_ms: int = 200,
+                 silence_threshold_db: float = -40, noise_ratio: float = 3.0, max_gap_seconds: float = 2.0):
+        self.sample_rate = sample_rate
+        self.frame_samples = max(1, sample_rate * frame_ms // 1000)
+        self.max_segment_frames = max(1, int(max_segment_seconds * sample_rate / self.frame_samples))
+        self.min_silence_frames = self._frames(min_silence_ms)
+        self.min_speech_frames = self._frames(min_speech_ms)
+        self.padding_frames = self._frames(padding_ms)
+        self.max_gap_frames = self._frames(max_gap_seconds * 1000)
+        self.silence_threshold = FULL_SCALE * 10 ** (silence_threshold_db / 20)
+        self.noise_ratio = noise_ratio
+        # Streaming keeps at most this much audio buffered; room for two
+        # full segments so one can always be finished before the window ends
+        self.window_bytes = (2 * self.max_segment_frames + self.max_gap_frames + 1) * self.frame_samples * 2
+
+    def segment(self, pcm) -> List[Dict]:
+        """
+        Speech segments of a PCM buffer.
+
+        Returns:
+            List of dicts with 'start' and 'end' in seconds and 'pcm', a
+            memoryview slice of the input; empty if there is no speech
+        """
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        energy = self.frame_energy(samples)
+        if not len(energy):
+            return []
+
+        regions = self.speech_regions(energy)
+        frame_bytes = self.frame_samples * 2
+        view = memoryview(pcm).cast('B')
+        segments = []
+        for start, end in self._pack(regions, energy):
+            start_byte = start * frame_bytes
+            end_byte = min(end * frame_bytes, len(view))
+            segments.append({
+                'start': round(start * self.frame_samples / self.sample_rate, 3),
+                'end': round(end_byte / 2 / self.sample_rate, 3),
+                'pcm': view[start_byte:end_byte]
+            })
+
+        speech_seconds = sum(segment['end'] - segment['start'] for segment in segments)
+        logger.info(f"Segmented {len(samples) / self.sample_rate:.1f}s of audio into {len(segments)} "
+                    f"segments with {speech_seconds:.1f}s of speech")
+        return segments
+
+    def stream(self, blocks: Iterable[bytes]) -> Iterator[Dict]:
+        """
+        Speech segments of PCM arriving in blocks, yielded as soon as each is complete.
+
+        The audio is segmented in windows of bounded size, so memory use
+        doesn't grow with the length of the stream. A segment is only yielded
+        once enough audio has followed it to be sure it has ended; the rest
+        of the window is carried into the next one. Segments are as from
+        segment(), with times from the start of the stream.
+        """
+        buffer = bytearray()
+        offset = 0  # bytes of the stream before the buffer
+        frame_bytes = self.frame_samples * 2
+
+        for block in blocks:
+            buffer += block
+            if len(buffer) < self.window_bytes:
+                continue
+
+            window = bytes(buffer)
+            # A segment ending this close to the window edge may go on in the next block
+            open_from = len(window) - (self.max_gap_frames + self.padding_frames + 1) * frame_bytes
+            # Audio before open_from with no unfinished segment in it is done with
+            consumed = max(0, open_from) // frame_bytes * frame_bytes
+            for segment in self.segment(window):
+                if self._byte(segment['end']) > open_from:
+                    consumed = self._byte(segment['start'])
+                    break
+                consumed = max(consumed, self._byte(segment['end']))
+                yield self._shifted(segment, offset)
+
+            del buffer[:consumed]
+            offset += consumed
+
+        if buffer:
+            for segment in self.segment(bytes(buffer)):
+                yield self._shifted(segment, offset)
+
+    def _byte(self, seconds: float) -> int:
+        """Byte offset of a segment time within its buffer"""
+        return int(round(seconds * self.sample_rate)) * 2
+
+    def _shifted(self, segment: Dict, offset: int) -> Dict:
+        """A window's segment with times from the start of the stream"""
+        seconds = offset / 2 / self.sample_rate
+        return {
+            **segment,
+            'start': round(segment['start'] + seconds, 3),
+            'end': round(segment['end'] + seconds, 3)
+        }
+
+    def frame_energy(self, samples: np.ndarray) -> np.ndarray:
+        """RMS energy of each frame; a trailing partial frame is zero-padded"""
+        frame_count = -(-len(samples) // self.frame_samples)
+        frames = np.zeros(frame_count * self.frame_samples, dtype=np.float32)
+        frames[:len(samples)] = samples
+        frames = frames.reshape(frame_count, self.frame_samples)
+        return np.sqrt(np.mean(frames * frames, axis=1))
+
+    def speech_regions(self, energy: np.ndarray) -> np.ndarray:
+        """(start, end) frame ranges of speech, end exclusive, as an (n, 2) array"""
+        noise_floor, loud = np.percentile(energy, [10, 95])
+        # Audio with no pauses at all has its noise floor at speech level;
+        # never put the threshold above a fraction of the loud frames
+        threshold = max(self.silence_threshold, min(noise_floor * self.noise_ratio, loud / 4))
+        voiced = energy > threshold
+
+        # Rising and falling edges of the voiced mask give the runs of speech
+        edges = np.diff(np.concatenate(([0], voiced.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        if not len(starts):
+            return np.empty((0, 2), dtype=np.int64)
+
+        # Bridge pauses too short to be a boundary
+        keep = (starts[1:] - ends[:-1]) >= self.min_silence_frames
+        starts = starts[np.concatenate(([True], keep))]
+        ends = ends[np.concatenate((keep, [True]))]
+
+        # Drop clicks and blips too short to be words, then pad the rest so
+        # onsets and trailing consonants aren't clipped
+        long_enough = (ends - starts) >= self.min_speech_frames
+        starts = np.maximum(starts[long_enough] - self.padding_frames, 0)
+        ends = np.minimum(ends[long_enough] + self.padding_frames, len(energy))
+        return np.stack((starts, ends), axis=1)
+
+    def _pack(self, regions: np.ndarray, energy: np.ndarray) -> List[tuple]:
+        """Merge neighbouring regions into segments no longer than the maximum"""
+        segments = []
+        current_start = current_end = None
+        for start, end in regions.tolist():
+            start = max(start, current_end or 0)  # padding can overlap the previous region
+            if current_start is not None and (end - current_start > self.max_segment_frames
+                                              or start - current_end > self.max_gap_frames):
+                segments.append((current_start, current_end))
+                current_start = None
+
+            if current_start is None:
+                current_start = start
+            current_end = end
+
+            while current_end - current_start > self.max_segment_frames:
+                cut = self._quietest_cut(energy, current_start)
+                segments.append((current_start, cut))
+                current_start = cut
+
+        if current_start is not None:
+            segments.append((current_start, current_end))
+        return segments
+
+    def _quietest_cut(self, energy: np.ndarray, start: int) -> int:
+        """Frame to cut an over-long stretch at: the quietest in the last quarter before the limit"""
+        limit = start + self.max_segment_frames
+        search_from = limit - max(1, self.max_segment_frames // 4)
+        return search_from + int(np.argmin(energy[search_from:limit])) + 1
+
+    def _frames(self, ms: float) -> int:
+        return int(ms * self.sample_rate / 1000 / self.frame_samples)
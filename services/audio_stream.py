@@ -0,0 +1,99 @@
+"""
+Audio Stream Module
+Decodes remote audio to 16 kHz mono PCM through an ffmpeg pipe, block by block
+"""
+import logging
+import shutil
+import subprocess
+import threading
+from collections import deque
+from typing import Dict, Iterator, Optional
+
+from .audio_transcription import SAMPLE_RATE, SAMPLE_WIDTH
+
+logger = logging.getLogger(__name__)
+
+
+class AudioStreamError(Exception):
+    """The audio stream couldn't be opened or decoding failed part way"""
+
+
+def find_ffmpeg(binary: str = 'ffmpeg') -> Optional[str]:
+    """Path of the ffmpeg executable, or None if it isn't installed"""
+    return shutil.which(binary)
+
+
+def select_audio_format(info: Dict) -> Optional[Dict]:
+    """
+    The best audio-only format of a yt-dlp info dict that ffmpeg can read directly.
+
+    Falls back to the best format with any audio; None if there is none.
+    """
+    formats = [
+        fmt for fmt in info.get('formats') or []
+        if fmt.get('url') and fmt.get('acodec') not in (None, 'none')
+        and fmt.get('protocol', 'https') in ('http', 'https', 'm3u8', 'm3u8_native')
+    ]
+    if not formats:
+        return None
+
+    audio_only = [fmt for fmt in formats if fmt.get('vcodec') == 'none']
+    return max(audio_only or formats, key=lambda fmt: fmt.get('abr') or fmt.get('tbr') or 0)
+
+
+def stream_pcm(url: str, headers: Optional[Dict] = None, ffmpeg: str = 'ffmpeg',
+               block_seconds: float = 1.0, read_timeout: float = 30) -> Iterator[bytes]:
+    """
+    Decode the audio at url into 16 kHz mono 16-bit PCM blocks as it downloads.
+
+    ffmpeg writes to a pipe, so nothing is written to disk and, when the
+    consumer falls behind, the pipe fills and the download pauses. Closing
+    the generator early stops ffmpeg. Its error log is drained as it is
+    written, so a stream that logs many decode errors can't stall the output.
+
+    Raises:
+        AudioStreamError: ffmpeg failed to start or exited with an error
+    """
+    command = [ffmpeg, '-nostdin', '-hide_banner', '-loglevel', 'error']
+    if url.startswith('http'):
+        command += ['-rw_timeout', str(int(read_timeout * 1_000_000))]
+    if headers:
+        command += ['-headers', ''.join(f'{name}: {value}\r\n' for name, value in headers.items())]
+    command += ['-i', url, '-vn', '-ac', '1', '-ar', str(SAMPLE_RATE), '-f', 's16le', '-']
+
+    try:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError as e:
+        raise AudioStreamError(f'Could not start ffmpeg: {e}') from e
+
+    # Only the tail of the log is kept for the error message
+    stderr_tail = deque(maxlen=20)
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_tail.extend(process.stderr),
+        name='ffmpeg-stderr',
+        daemon=True
+    )
+    stderr_reader.start()
+
+    block_bytes = int(block_seconds * SAMPLE_RATE) * SAMPLE_WIDTH
+    finished = False
+    try:
+        while True:
+            block = process.stdout.read(block_bytes)
+            if not block:
+                break
+            yield block
+
+        process.wait()
+        finished = True
+        stderr_reader.join()
+        if process.returncode != 0:
+            error = b''.join(stderr_tail).decode('utf-8', 'replace').strip()
+            raise AudioStreamError(f'ffmpeg exited with {process.returncode}: {error[-500:]}')
+    finally:
+        if not finished:
+            process.kill()
+            process.wait()
+            stderr_reader.join()
+        process.stdout.close()
+        process.stderr.close()
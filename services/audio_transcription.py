@@ -0,0 +1,256 @@
+"""
+Audio Transcription Module
+Concurrent speech recognition over in-memory PCM segments, reassembled in order
+"""
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import speech_recognition as sr
+
+from .audio_segmenter import AudioSegmenter
+
+logger = logging.getLogger(__name__)
+
+# Audio is normalized to what speech engines expect: 16 kHz, mono, 16-bit
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2
+
+
+class TranscriptionError(Exception):
+    """A chunk couldn't be transcribed for a reason worth retrying (network, quota)"""
+
+
+class SpeechRecognitionBackend:
+    """
+    Recognizer backed by one of SpeechRecognition's engines.
+
+    Any object with the same transcribe() method can replace it, e.g. a
+    local engine or a canned fake in tests.
+    """
+
+    def __init__(self, engine: str = 'google', **engine_options):
+        self.recognizer = sr.Recognizer()
+        self.engine = engine
+        self.engine_options = engine_options
+        self._recognize = getattr(self.recognizer, f'recognize_{engine}')
+
+    def transcribe(self, pcm: bytes, sample_rate: int = SAMPLE_RATE, sample_width: int = SAMPLE_WIDTH) -> str:
+        """
+        Text spoken in a chunk of raw PCM; empty if no speech was recognized.
+
+        Raises:
+            TranscriptionError: the engine failed in a way that may succeed on retry
+        """
+        audio_data = sr.AudioData(pcm, sample_rate, sample_width)
+        try:
+            return self._recognize(audio_data, **self.engine_options)
+        except sr.UnknownValueError:
+            return ''
+        except sr.RequestError as e:
+            raise TranscriptionError(str(e)) from e
+
+
+class ChunkedTranscriber:
+    """
+    Transcribes audio as chunks on a bounded worker pool.
+
+    Chunks are slices of one PCM buffer, never written to disk. With a
+    segmenter they are speech segments cut at pauses, and silence is never
+    sent for recognition; without one, fixed chunk_seconds slices. Each chunk
+    is retried with exponential backoff on TranscriptionError; a chunk that
+    still fails is left out and the rest of the transcript kept.
+    """
+
+    def __init__(self, recognizer=None, max_workers: int = 4, max_retries: int = 2,
+                 retry_backoff: float = 1.0, chunk_seconds: int = 60, segmenter: Optional[AudioSegmenter] = None):
+        self.recognizer = recognizer or SpeechRecognitionBackend()
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.chunk_seconds = chunk_seconds
+        self.segmenter = segmenter
+        self.stats = {'chunks': 0, 'failed_chunks': 0, 'retries': 0}
+        self._stats_lock = threading.Lock()
+
+    def transcribe_segment(self, audio) -> Optional[str]:
+        """
+        Transcribe a pydub AudioSegment.
+
+        Returns:
+            The chunk texts joined in order, or None if nothing was recognized
+        """
+        return join_segments(self.transcribe_segment_timed(audio))
+
+    def transcribe_segment_timed(self, audio) -> List[Dict]:
+        """Transcribe a pydub AudioSegment into timed segments; see transcribe_pcm_timed"""
+        audio = audio.set_frame_rate(SAMPLE_RATE).set_channels(1).set_sample_width(SAMPLE_WIDTH)
+        return self.transcribe_pcm_timed(audio.raw_data)
+
+    def transcribe_pcm(self, pcm: bytes) -> Optional[str]:
+        """Transcribe 16 kHz mono 16-bit PCM; see transcribe_segment"""
+        return join_segments(self.transcribe_pcm_timed(pcm))
+
+    def transcribe_pcm_timed(self, pcm: bytes) -> List[Dict]:
+        """
+        Transcribe 16 kHz mono 16-bit PCM.
+
+        Returns:
+            Dicts with 'start', 'end' (seconds) and 'text' for each chunk
+            that produced text, in order
+        """
+        chunks = self.split(pcm)
+        if not chunks:
+            return []
+
+        logger.info(f"Transcribing {len(chunks)} audio chunks with {min(self.max_workers, len(chunks))} workers")
+        texts = self.transcribe_chunks([chunk['pcm'] for chunk in chunks])
+        return [
+            {'start': chunk['start'], 'end': chunk['end'], 'text': text.strip()}
+            for chunk, text in zip(chunks, texts) if text and text.strip()
+        ]
+
+    def transcribe_stream(self, blocks: Iterable[bytes]) -> List[Dict]:
+        """
+        Transcribe 16 kHz mono 16-bit PCM arriving in blocks, e.g. from a decoder pipe.
+
+        Each chunk is handed to the pool as soon as it is complete, so
+        recognition overlaps with download. At most two chunks per worker
+        are in flight; past that, reading pauses until the oldest is done,
+        so memory use doesn't grow with the length of the audio.
+
+        Returns:
+            Timed segments as from transcribe_pcm_timed
+        """
+        chunks = self.segmenter.stream(blocks) if self.segmenter is not None else self._fixed_chunks(blocks)
+        segments = []
+        pending: 'deque[tuple]' = deque()
+
+        def collect(chunk, future):
+            text = future.result()
+            if text and text.strip():
+                segments.append({'start': chunk['start'], 'end': chunk['end'], 'text': text.strip()})
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='transcribe') as executor:
+            try:
+                for index, chunk in enumerate(chunks):
+                    pending.append((chunk, executor.submit(
+                        self._transcribe_chunk, index, chunk['pcm'], SAMPLE_RATE, SAMPLE_WIDTH
+                    )))
+                    while len(pending) > 2 * self.max_workers:
+                        collect(*pending.popleft())
+                while pending:
+                    collect(*pending.popleft())
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+        logger.info(f"Transcribed streamed audio into {len(segments)} segments")
+        return segments
+
+    def _fixed_chunks(self, blocks: Iterable[bytes]) -> Iterator[Dict]:
+        """Fixed chunk_seconds slices of a block stream"""
+        bytes_per_second = SAMPLE_RATE * SAMPLE_WIDTH
+        chunk_bytes = self.chunk_seconds * bytes_per_second
+        buffer = bytearray()
+        offset = 0
+        for block in blocks:
+            buffer += block
+            while len(buffer) >= chunk_bytes:
+                pcm = bytes(buffer[:chunk_bytes])
+                del buffer[:chunk_bytes]
+                yield {'start': offset / bytes_per_second, 'end': (offset + chunk_bytes) / bytes_per_second, 'pcm': pcm}
+                offset += chunk_bytes
+        if buffer:
+            yield {'start': offset / bytes_per_second, 'end': (offset + len(buffer)) / bytes_per_second, 'pcm': bytes(buffer)}
+
+    def split(self, pcm: bytes) -> List[Dict]:
+        """Chunks of PCM to recognize, as dicts with 'start', 'end' and 'pcm'"""
+        if self.segmenter is not None:
+            return self.segmenter.segment(pcm)
+
+        bytes_per_second = SAMPLE_RATE * SAMPLE_WIDTH
+        chunk_bytes = self.chunk_seconds * bytes_per_second
+        view = memoryview(pcm)
+        return [
+            {
+                'start': start / bytes_per_second,
+                'end': min(start + chunk_bytes, len(view)) / bytes_per_second,
+                'pcm': view[start:start + chunk_bytes]
+            }
+            for start in range(0, len(view), chunk_bytes)
+        ]
+
+    def transcribe_chunks(self, chunks: List, sample_rate: int = SAMPLE_RATE,
+                          sample_width: int = SAMPLE_WIDTH) -> List[Optional[str]]:
+        """One text per chunk in chunk order; None for chunks that failed"""
+        if len(chunks) == 1:
+            return [self._transcribe_chunk(0, chunks[0], sample_rate, sample_width)]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks)),
+                                thread_name_prefix='transcribe') as executor:
+            return list(executor.map(
+                lambda item: self._transcribe_chunk(item[0], item[1], sample_rate, sample_width),
+                enumerate(chunks)
+            ))
+
+    def _transcribe_chunk(self, index: int, chunk, sample_rate: int, sample_width: int) -> Optional[str]:
+        self._count('chunks')
+        for attempt in range(self.max_retries + 1):
+            try:
+                text = self.recognizer.transcribe(bytes(chunk), sample_rate, sample_width)
+                if not text:
+                    logger.warning(f"Chunk {index+1}: No speech detected")
+                return text
+            except TranscriptionError as e:
+                if attempt == self.max_retries:
+                    logger.error(f"Chunk {index+1}: giving up after {attempt+1} attempts: {e}")
+                    break
+                self._count('retries')
+                delay = self.retry_backoff * (2 ** attempt)
+                logger.warning(f"Chunk {index+1}: {e}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+            except Exception as e:
+                logger.error(f"Error transcribing chunk {index+1}: {e}")
+                break
+
+        self._count('failed_chunks')
+        return None
+
+    def _count(self, stat: str) -> None:
+        with self._stats_lock:
+            self.stats[stat] += 1
+
+    def get_stats(self) -> Dict:
+        with self._stats_lock:
+            return dict(self.stats)
+
+
+def join_segments(segments: List[Dict]) -> Optional[str]:
+    """Text of timed segments as one transcript, or None if there is none"""
+    transcript = ' '.join(segment['text'] for segment in segments)
+    return transcript or None
+
+
+def create_transcriber(config=None, recognizer=None) -> ChunkedTranscriber:
+    """ChunkedTranscriber configured from the AUDIO_* settings"""
+    chunk_seconds = getattr(config, 'AUDIO_CHUNK_SECONDS', 60)
+    segmenter = None
+    if getattr(config, 'AUDIO_SEGMENTATION', 'silence') == 'silence':
+        segmenter = AudioSegmenter(
+            sample_rate=SAMPLE_RATE,
+            max_segment_seconds=chunk_seconds,
+            min_silence_ms=getattr(config, 'AUDIO_MIN_SILENCE_MS', 400),
+            silence_threshold_db=getattr(config, 'AUDIO_SILENCE_THRESHOLD_DB', -40)
+        )
+
+    return ChunkedTranscriber(
+        recognizer=recognizer or SpeechRecognitionBackend(getattr(config, 'SPEECH_RECOGNITION_ENGINE', 'google')),
+        max_workers=getattr(config, 'AUDIO_TRANSCRIPTION_WORKERS', 4),
+        max_retries=getattr(config, 'AUDIO_TRANSCRIPTION_RETRIES', 2),
+        chunk_seconds=chunk_seconds,
+        segmenter=segmenter
+    )
@@ -0,0 +1,297 @@
+"""
+Caching Service
+In-process LRU/TTL cache with an optional SQLite tier that survives restarts
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_claim_text(claim: str) -> str:
+    """Normalize claim text so trivially different phrasings share a key"""
+    normalized = re.sub(r'[^\w\s]', '', claim.lower().strip())
+    return ' '.join(normalized.split())
+
+
+def claim_fingerprint(claim: str) -> str:
+    """Stable, process-independent hash of the normalized claim text"""
+    return hashlib.sha256(normalize_claim_text(claim).encode('utf-8')).hexdigest()
+
+
+def normalize_verdict_text(claim: str) -> str:
+    """
+    Normalize claim text for the verdict cache, folding only case and whitespace.
+
+    Punctuation is kept: decimal points, signs, '%' and currency symbols
+    change what a claim asserts ("4.5%" vs "45%"), so such claims must not
+    share a verdict.
+    """
+    return ' '.join(claim.lower().split())
+
+
+def verdict_fingerprint(claim: str) -> str:
+    """Stable hash of a claim for the verdict cache; see normalize_verdict_text"""
+    return hashlib.sha256(normalize_verdict_text(claim).encode('utf-8')).hexdigest()
+
+
+class TTLCache:
+    """Thread-safe in-memory cache with per-entry TTL and LRU eviction"""
+
+    def __init__(self, max_entries: int = 1000, ttl: Optional[float] = 3600):
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value, refreshing its LRU position"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                self.stats['expirations'] += 1
+                self.stats['misses'] += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting least recently used entries past max_entries"""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl else None
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def delete(self, key: str) -> None:
+        """Remove a value"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics"""
+        with self._lock:
+            return {'entries': len(self._entries), 'max_entries': self.max_entries, **self.stats}
+
+
+class SQLiteCache:
+    """
+    On-disk cache backed by a single SQLite table.
+
+    Values are stored as JSON (optionally zlib-compressed) so any process on
+    the host can read them; expired and least recently used rows are pruned
+    as new rows are written.
+    """
+
+    def __init__(self, path: str, max_entries: int = 100000, ttl: Optional[float] = None,
+                 compress: bool = False, prune_interval: int = 100):
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.compress = compress
+        self.prune_interval = max(1, prune_interval)
+        self._writes = 0
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'errors': 0}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache ('
+                'key TEXT PRIMARY KEY, value BLOB NOT NULL, '
+                'expires_at REAL, accessed_at REAL NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache (accessed_at)')
+            self._conn.commit()
+
+    def _encode(self, value: Any) -> bytes:
+        data = json.dumps(value).encode('utf-8')
+        return zlib.compress(data) if self.compress else data
+
+    def _decode(self, data: bytes) -> Any:
+        if self.compress:
+            data = zlib.decompress(data)
+        return json.loads(data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value, refreshing its LRU position"""
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT value, expires_at FROM cache WHERE key = ?', (key,)
+                ).fetchone()
+
+                if row is None:
+                    self.stats['misses'] += 1
+                    return default
+
+                value, expires_at = row
+                if expires_at is not None and expires_at <= now:
+                    self._conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+                    self._conn.commit()
+                    self.stats['expirations'] += 1
+                    self.stats['misses'] += 1
+                    return default
+
+                self._conn.execute('UPDATE cache SET accessed_at = ? WHERE key = ?', (now, key))
+                self._conn.commit()
+                self.stats['hits'] += 1
+
+            return self._decode(value)
+
+        except (sqlite3.Error, ValueError, zlib.error) as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+            self.stats['errors'] += 1
+            return default
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value"""
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+
+        try:
+            data = self._encode(value)
+            with self._lock:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)',
+                    (key, sqlite3.Binary(data), expires_at, now)
+                )
+                self._conn.commit()
+
+                self._writes += 1
+                if self._writes % self.prune_interval == 0:
+                    self._prune_locked(now)
+
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Cache write failed for {key}: {e}")
+            self.stats['errors'] += 1
+
+    def delete(self, key: str) -> None:
+        """Remove a value"""
+        with self._lock:
+            self._conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+            self._conn.commit()
+
+    def prune(self) -> None:
+        """Drop expired rows and trim to max_entries, least recently used first"""
+        with self._lock:
+            self._prune_locked(time.time())
+
+    def _prune_locked(self, now: float) -> None:
+        expired = self._conn.execute(
+            'DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?', (now,)
+        ).rowcount
+        self.stats['expirations'] += max(expired, 0)
+
+        count = self._conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+        if count > self.max_entries:
+            evicted = self._conn.execute(
+                'DELETE FROM cache WHERE key IN '
+                '(SELECT key FROM cache ORDER BY accessed_at ASC LIMIT ?)',
+                (count - self.max_entries,)
+            ).rowcount
+            self.stats['evictions'] += max(evicted, 0)
+
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics"""
+        return {'entries': len(self), 'max_entries': self.max_entries, 'path': self.path, **self.stats}
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCache:
+    """Memory cache in front of an optional persistent cache"""
+
+    def __init__(self, memory: TTLCache, disk: Optional[SQLiteCache] = None):
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Look in memory first, then on disk, promoting disk hits into memory"""
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+                return value
+
+        return default
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Write through to every tier"""
+        self.memory.set(key, value, ttl)
+        if self.disk is not None:
+            self.disk.set(key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        """Remove a value from every tier"""
+        self.memory.delete(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def get_stats(self) -> Dict:
+        """Get per-tier statistics"""
+        memory_stats = self.memory.get_stats()
+        disk_stats = self.disk.get_stats() if self.disk is not None else None
+
+        hits = memory_stats['hits'] + (disk_stats['hits'] if disk_stats else 0)
+        # Every lookup reaches memory first; it is a miss overall only if no tier had it
+        lookups = memory_stats['hits'] + memory_stats['misses']
+
+        return {
+            'hits': hits,
+            'misses': lookups - hits,
+            'hit_rate': round(hits / lookups, 3) if lookups else 0.0,
+            'memory': memory_stats,
+            'disk': disk_stats
+        }
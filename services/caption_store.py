@@ -0,0 +1,175 @@
+"""
+Caption Store Module
+Persistent cache of YouTube captions with their timed segments
+"""
+import logging
+import time
+from typing import Dict, List, Optional
+
+from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+
+from .cache import SQLiteCache, TTLCache, TieredCache
+
+logger = logging.getLogger(__name__)
+
+
+class CaptionsUnavailable(Exception):
+    """The video definitely has no usable captions (disabled or none published)"""
+
+
+def fetch_youtube_captions(video_id: str, languages: Optional[List[str]] = None) -> Dict:
+    """
+    Fetch a video's captions from YouTube, preferring manual over auto-generated.
+
+    Returns:
+        Caption entry with 'language', 'language_code', 'caption_type' and
+        'segments', the caption lines as dicts with 'text', 'start' and 'duration'
+
+    Raises:
+        CaptionsUnavailable: captions are disabled or there are none
+    """
+    languages = languages or ['en']
+    try:
+        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+    except TranscriptsDisabled:
+        raise CaptionsUnavailable('Captions are disabled for this video')
+
+    try:
+        transcript = transcript_list.find_manually_created_transcript(languages)
+        caption_type = 'manual'
+    except NoTranscriptFound:
+        try:
+            transcript = transcript_list.find_generated_transcript(languages)
+            caption_type = 'auto-generated'
+        except NoTranscriptFound:
+            # Take any available language
+            transcript = next(iter(transcript_list), None)
+            if transcript is None:
+                raise CaptionsUnavailable('No captions found for this video')
+            caption_type = 'auto-translated' if transcript.is_translatable else 'other-language'
+
+    segments = [
+        {'text': entry['text'], 'start': entry['start'], 'duration': entry['duration']}
+        for entry in transcript.fetch()
+    ]
+    if not segments:
+        raise CaptionsUnavailable('No captions found for this video')
+
+    return {
+        'video_id': video_id,
+        'language': transcript.language,
+        'language_code': transcript.language_code,
+        'caption_type': caption_type,
+        'segments': segments
+    }
+
+
+class CaptionStore:
+    """
+    Captions keyed by video ID, language and caption type.
+
+    Each video has an index entry pointing at the captions last chosen for
+    it, so a lookup by video ID alone is two cache reads. An entry is fresh
+    for max_age[caption_type] seconds after it was fetched: manual captions
+    rarely change, auto-generated ones are regenerated and may be replaced
+    by manual ones. A stale entry is refetched, but still served if YouTube
+    can't be reached. Videos without captions are remembered for
+    missing_max_age seconds.
+    """
+
+    def __init__(self, cache: TieredCache, max_age: Optional[Dict[str, float]] = None,
+                 default_max_age: float = 24 * 3600, missing_max_age: float = 3600, fetch=None):
+        self.cache = cache
+        self.max_age = max_age or {}
+        self.default_max_age = default_max_age
+        self.missing_max_age = missing_max_age
+        self.fetch = fetch or fetch_youtube_captions
+        self.stats = {'fresh': 0, 'stale_served': 0, 'fetched': 0, 'missing': 0}
+
+    def get_captions(self, video_id: str) -> Dict:
+        """
+        Captions for a video, fetched from YouTube only when there are no fresh ones.
+
+        Returns:
+            Caption entry (see fetch_youtube_captions) with 'fetched_at'
+
+        Raises:
+            CaptionsUnavailable: the video has no captions
+            Exception: fetching failed and nothing was stored for the video
+        """
+        index = self.cache.get(self._index_key(video_id))
+        if index is not None and 'missing' in index:
+            self.stats['missing'] += 1
+            raise CaptionsUnavailable(index['missing'])
+
+        entry = self.cache.get(index['key']) if index is not None else None
+        if entry is not None and self.is_fresh(entry):
+            self.stats['fresh'] += 1
+            return entry
+
+        try:
+            fetched = self.fetch(video_id)
+        except CaptionsUnavailable as e:
+            self.stats['missing'] += 1
+            self.cache.set(self._index_key(video_id), {'missing': str(e)}, ttl=self.missing_max_age)
+            raise
+        except Exception as e:
+            if entry is None:
+                raise
+            logger.warning(f"Caption refresh failed for {video_id}, serving stale captions: {e}")
+            self.stats['stale_served'] += 1
+            return entry
+
+        self.stats['fetched'] += 1
+        return self.put(fetched)
+
+    def put(self, entry: Dict) -> Dict:
+        """Store captions and make them the ones served for their video"""
+        entry = {**entry, 'fetched_at': entry.get('fetched_at') or time.time()}
+        key = self._entry_key(entry['video_id'], entry['language_code'], entry['caption_type'])
+        self.cache.set(key, entry)
+        self.cache.set(self._index_key(entry['video_id']), {'key': key})
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        max_age = self.max_age.get(entry.get('caption_type'), self.default_max_age)
+        return time.time() - entry.get('fetched_at', 0) < max_age
+
+    def get_stats(self) -> Dict:
+        """Lookup outcome counters and per-tier cache statistics"""
+        return {**self.stats, 'cache': self.cache.get_stats()}
+
+    def _index_key(self, video_id: str) -> str:
+        return f'captions:{video_id}'
+
+    def _entry_key(self, video_id: str, language_code: str, caption_type: str) -> str:
+        return f'captions:{video_id}:{language_code}:{caption_type}'
+
+
+def create_caption_store(config) -> CaptionStore:
+    """Caption store in memory, backed by compressed SQLite when CAPTION_CACHE_DB_PATH is set"""
+    retention = getattr(config, 'CAPTION_CACHE_RETENTION', 30 * 24 * 3600)
+    memory = TTLCache(max_entries=getattr(config, 'CAPTION_CACHE_MAX_ENTRIES', 500), ttl=retention)
+
+    disk = None
+    db_path = getattr(config, 'CAPTION_CACHE_DB_PATH', None)
+    if db_path:
+        try:
+            disk = SQLiteCache(
+                db_path,
+                max_entries=getattr(config, 'CAPTION_CACHE_DISK_MAX_ENTRIES', 20000),
+                ttl=retention,
+                compress=True
+            )
+            logger.info(f"Persistent caption cache enabled at {db_path}")
+        except Exception as e:
+            logger.error(f"Failed to open caption cache at {db_path}: {e}")
+
+    return CaptionStore(
+        TieredCache(memory, disk),
+        max_age={
+            'manual': getattr(config, 'CAPTION_MAX_AGE_MANUAL', 7 * 24 * 3600),
+            'auto-generated': getattr(config, 'CAPTION_MAX_AGE_AUTO', 24 * 3600)
+        },
+        missing_max_age=getattr(config, 'CAPTION_MISSING_MAX_AGE', 3600)
+    )
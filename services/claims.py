@@ -4,9 +4,13 @@ Extracts factual claims while being practical about what constitutes a verifiabl
 """
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import List, Dict, Optional, Set
 import json
 
+from .cache import normalize_claim_text
+from .deadline import Deadline
+
 logger = logging.getLogger(__name__)
 
 class ClaimExtractor:
@@ -17,6 +21,14 @@ class ClaimExtractor:
         # Get max claims from config, default to 100 (was 30)
         self.max_claims = getattr(config, 'MAX_CLAIMS_PER_TRANSCRIPT', 100)
         
+        # Chunking for AI extraction of long transcripts
+        self.extraction_chunk_size = max(1000, getattr(config, 'AI_EXTRACTION_CHUNK_SIZE', 8000))
+        self.extraction_chunk_overlap = getattr(config, 'AI_EXTRACTION_CHUNK_OVERLAP', 400)
+        self.extraction_workers = max(1, getattr(config, 'AI_EXTRACTION_MAX_WORKERS', 4))
+        self.extraction_timeout = getattr(config, 'EXTRACTION_TIMEOUT', 180)
+        self._speaker_line_pattern = re.compile(r'^(?:\[)?([A-Z][A-Za-z\s\.]{1,40})(?:\])?:')
+        self._sentence_boundary_pattern = re.compile(r'(?<=[.!?])\s+')
+        
         openai_api_key = getattr(config, 'OPENAI_API_KEY', None)
         self.openai_client = None
         
@@ -101,9 +113,110 @@ class ClaimExtractor:
             # Predictions without evidence
             r'\bwill\s+(definitely|certainly|obviously|clearly)\s+(be|become|fail|succeed)\b',
         ]
+        
+        # Statements that characterize something as good/bad without specific metrics
+        self.characterization_patterns = [
+            r'^(this|that|it)\s+is\s+(a\s+)?(disaster|catastrophe|crisis|success|failure|triumph|embarrassment)',
+            r'\bis\s+(completely|totally|absolutely)\s+(wrong|right|false|true)',
+            r'\b(cannot|can\'t)\s+manage\b.*(?!specific\s+data|evidence|numbers)',
+        ]
+        
+        # Pure conversational elements
+        self.conversational_patterns = [
+            r'^(well|so|now|then|anyway|however)\s*[,.]?\s*$',
+            r'^(you know|i mean|basically|actually|literally)\s*[,.]?\s*$',
+            r'^(um|uh|er|ah|oh)\s*[,.]?\s*$',
+        ]
+        
+        # Indicators that a sentence contains something checkable
+        self.factual_indicators = [
+            # Specific numbers and statistics
+            r'\b\d+\.?\d*\s*(%|percent|million|billion|thousand)\b',
+            r'\$\d+',
+            r'\b\d+\s*(votes?|people|jobs|cases|deaths|births)\b',
+            
+            # Dates and time periods
+            r'\b(19|20)\d{2}\b',
+            r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d+',
+            r'\bin\s+(19|20)\d{2}\b',
+            r'\bsince\s+(19|20)\d{2}\b',
+            
+            # Specific policy/legal references
+            r'\b(h\.r\.|s\.|bill|act|amendment)\s*\d+',
+            r'\b(executive\s+order|regulation|statute|code)\s+\d+',
+            r'\b(section|title|chapter)\s+\d+',
+            
+            # Specific organizations and official bodies
+            r'\b(department\s+of|office\s+of|bureau\s+of|agency\s+of)\b',
+            r'\b(congress|senate|house)\s+(passed|voted|approved|rejected)',
+            r'\b(supreme\s+court|district\s+court|appeals\s+court)\b',
+            
+            # Measurable actions and outcomes
+            r'\b(increased|decreased|rose|fell|gained|lost|dropped)\s+(by\s+)?\d+',
+            r'\b(allocated|spent|invested|cut|reduced)\s+\$?\d+',
+            r'\b(signed|vetoed|passed|failed|approved|rejected)\b.*\b(bill|law|agreement|treaty)\b',
+            
+            # Specific geographical or institutional references
+            r'\b(state\s+of|city\s+of|university\s+of|bank\s+of)\s+[A-Z][a-z]+',
+            r'\b[A-Z][a-z]+\s+(university|college|hospital|corporation|company)\b',
+        ]
+        
+        # Verbs that give a factual claim its subject-verb-object structure
+        self.claim_verbs = [
+            'is', 'are', 'was', 'were', 'has', 'have', 'had', 'will', 'would', 'can', 'could',
+            'passed', 'failed', 'signed', 'vetoed', 'announced', 'said', 'declared', 'created',
+            'increased', 'decreased', 'rose', 'fell', 'gained', 'lost', 'allocated', 'spent'
+        ]
+        
+        self._compile_filters()
+    
+    def _compile_filters(self):
+        """
+        Compile the filter lists into a few combined regexes, built once per
+        extractor, so each sentence is screened with a handful of scans
+        rather than a Python loop over every phrase and pattern.
+        """
+        def literal_alternation(phrases):
+            # Longest first so overlapping phrases don't shadow each other
+            return '|'.join(re.escape(phrase) for phrase in sorted(phrases, key=len, reverse=True))
+        
+        def pattern_alternation(patterns):
+            # Hoist the shared leading \b so the branches are only tried at word boundaries
+            bounded = [pattern[2:] for pattern in patterns if pattern.startswith(r'\b')]
+            parts = [f'(?:{pattern})' for pattern in patterns if not pattern.startswith(r'\b')]
+            if bounded:
+                parts.append(r'\b(?:' + '|'.join(f'(?:{pattern})' for pattern in bounded) + ')')
+            return '|'.join(parts)
+        
+        # Whole sentence is a non-claim phrase, or starts with one followed by a space
+        self._non_claim_prefix_re = re.compile(rf'(?:{literal_alternation(self.non_claim_phrases)})(?: |\Z)')
+        self._conversational_re = re.compile(pattern_alternation(self.conversational_patterns))
+        
+        # Anything that marks the sentence as opinion: indicator substrings,
+        # opinion patterns and bare characterizations
+        self._opinion_re = re.compile(pattern_alternation([
+            literal_alternation(self.opinion_indicators),
+            *self.opinion_patterns,
+            *self.characterization_patterns
+        ]))
+        self._shown_how_to_re = re.compile(r'\b(has\s+shown|have\s+shown).*\b(how\s+to)\b')
+        self._shown_judgment_re = re.compile(r'\b(good|bad|great|terrible|perfect|awful|excellent|poor)\b')
+        
+        self._factual_re = re.compile(pattern_alternation(self.factual_indicators))
+        self._proper_noun_re = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+        self._action_verb_re = re.compile(r'\b(said|announced|declared|signed|voted|passed|failed|won|lost|created|built|destroyed|implemented|launched|introduced|proposed)\b')
+        self._claim_verb_re = re.compile(literal_alternation(self.claim_verbs))
+        self._mere_characterization_re = re.compile(r'^[^.]*\b(is|are|was|were)\s+(just|simply|merely|only)\s+')
     
-    def extract(self, transcript: str) -> Dict:
-        """Extract factual claims from transcript"""
+    def extract(self, transcript: str, deadline: Optional[Deadline] = None) -> Dict:
+        """
+        Extract factual claims from transcript.
+        
+        AI extraction stops at the deadline (EXTRACTION_TIMEOUT from now if
+        not given), keeping whatever chunks finished; if none did, the
+        pattern-based extraction is used.
+        """
+        deadline = deadline or Deadline(self.extraction_timeout)
         try:
             # Clean transcript
             transcript = transcript.strip()
@@ -118,9 +231,9 @@ class ClaimExtractor:
             logger.info(f"Starting claim extraction from transcript ({len(transcript)} chars)")
             
             # Try AI extraction first if available
-            if self.openai_client:
+            if self.openai_client and not deadline.expired():
                 try:
-                    ai_result = self._extract_with_ai(transcript)
+                    ai_result = self._extract_with_ai(transcript, deadline)
                     if ai_result and ai_result.get('claims'):
                         # Apply strict filtering to AI results
                         filtered_claims = []
@@ -150,13 +263,147 @@ class ClaimExtractor:
                 'extraction_method': 'error'
             }
     
-    def _extract_with_ai(self, transcript: str) -> Optional[Dict]:
-        """Use AI to extract claims with enhanced filtering"""
+    def _extract_with_ai(self, transcript: str, deadline: Deadline) -> Optional[Dict]:
+        """
+        Use AI to extract claims with enhanced filtering.
+        
+        Long transcripts are split into overlapping chunks on speaker and
+        sentence boundaries; chunks are extracted concurrently and the
+        results merged in transcript order with duplicates removed.
+        """
+        chunks = self._split_into_chunks(transcript)
+        if not chunks:
+            return None
+        
+        if len(chunks) == 1:
+            chunk_results = [self._extract_chunk_with_ai(chunks[0]['text'], chunks[0]['speaker'], deadline)]
+        else:
+            logger.info(f"Extracting claims from {len(chunks)} transcript chunks")
+            workers = min(self.extraction_workers, len(chunks))
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='claim-extract')
+            try:
+                futures = [
+                    executor.submit(self._extract_chunk_with_ai, chunk['text'], chunk['speaker'], deadline)
+                    for chunk in chunks
+                ]
+                _, unfinished = wait(futures, timeout=deadline.remaining())
+                if unfinished:
+                    logger.warning(f"Claim extraction ran out of time, {len(unfinished)} of {len(chunks)} chunks skipped")
+                chunk_results = [future.result() if future.done() else None for future in futures]
+            finally:
+                # Don't wait for requests still in flight past the deadline
+                executor.shutdown(wait=False, cancel_futures=True)
+        
+        if all(result is None for result in chunk_results):
+            return None
+        
+        # Merge in transcript order; overlapping chunks can yield the same claim twice
+        processed_claims = []
+        speakers = set()
+        seen = set()
+        
+        for result in chunk_results:
+            if not result:
+                continue
+            
+            for claim in result:
+                key = normalize_claim_text(claim['text'])
+                if key in seen:
+                    continue
+                seen.add(key)
+                
+                processed_claims.append(claim)
+                if claim['speaker'] and claim['speaker'] != 'Unknown':
+                    speakers.add(claim['speaker'])
+        
+        return {
+            'claims': processed_claims[:self.max_claims],
+            'speakers': list(speakers),
+            'topics': self._extract_topics(transcript),
+            'extraction_method': 'ai_enhanced',
+            'chunks_processed': len(chunks)
+        }
+    
+    def _split_into_chunks(self, transcript: str) -> List[Dict]:
+        """
+        Split a transcript into chunks of at most ``extraction_chunk_size``
+        characters, breaking on speaker turns and sentence ends. Each chunk
+        starts with a small overlap from the previous one and records the
+        speaker active at its start.
+        """
+        if len(transcript) <= self.extraction_chunk_size:
+            return [{'text': transcript, 'speaker': None}]
+        
+        # Units: one per line (speaker turns), long lines split into sentences
+        units = []
+        current_speaker = None
+        for line in transcript.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            
+            speaker_match = self._speaker_line_pattern.match(line)
+            if speaker_match:
+                current_speaker = speaker_match.group(1).strip()
+            
+            if len(line) <= self.extraction_chunk_size // 2:
+                units.append((line, current_speaker))
+                continue
+            
+            for sentence in self._sentence_boundary_pattern.split(line):
+                # Wrap anything still too long (e.g. unpunctuated captions) at word breaks
+                limit = self.extraction_chunk_size // 2
+                while len(sentence) > limit:
+                    cut = sentence.rfind(' ', 0, limit)
+                    if cut <= 0:
+                        cut = limit
+                    units.append((sentence[:cut].strip(), current_speaker))
+                    sentence = sentence[cut:].strip()
+                if sentence:
+                    units.append((sentence, current_speaker))
+        
+        chunks = []
+        current_units: List[tuple] = []
+        current_length = 0
+        
+        for unit in units:
+            if current_units and current_length + len(unit[0]) + 1 > self.extraction_chunk_size:
+                chunks.append(current_units)
+                
+                # Carry trailing units over as overlap
+                overlap = []
+                overlap_length = 0
+                for previous in reversed(current_units):
+                    if overlap_length + len(previous[0]) > self.extraction_chunk_overlap:
+                        break
+                    overlap.insert(0, previous)
+                    overlap_length += len(previous[0]) + 1
+                
+                current_units = overlap
+                current_length = overlap_length
+            
+            current_units.append(unit)
+            current_length += len(unit[0]) + 1
+        
+        if current_units:
+            chunks.append(current_units)
+        
+        return [
+            {'text': '\n'.join(text for text, _ in chunk_units), 'speaker': chunk_units[0][1]}
+            for chunk_units in chunks
+        ]
+    
+    def _extract_chunk_with_ai(self, transcript: str, speaker_hint: Optional[str] = None,
+                               deadline: Optional[Deadline] = None) -> Optional[List[Dict]]:
+        """Extract claims from one transcript chunk; None if the request failed, timed out or didn't parse"""
+        deadline = deadline or Deadline(self.extraction_timeout)
+        if deadline.expired():
+            return None
+        
         try:
-            # Limit transcript length for API
-            max_length = 8000
-            if len(transcript) > max_length:
-                transcript = transcript[:max_length] + "..."
+            if speaker_hint and not self._speaker_line_pattern.match(transcript):
+                # Keep attribution for chunks that start mid-turn
+                transcript = f"{speaker_hint}: {transcript}"
             
             prompt = f"""Extract ONLY verifiable factual claims from this transcript. Be extremely selective.
 
@@ -206,7 +453,8 @@ Transcript:
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.1,  # Lower temperature for more consistent results
-                max_tokens=2000
+                max_tokens=2000,
+                timeout=deadline.timeout()
             )
             
             content = response.choices[0].message.content.strip()
@@ -226,12 +474,11 @@ Transcript:
                         
                 # Process claims with additional validation
                 processed_claims = []
-                speakers = set()
                 
                 for claim in claims_data:
                     if isinstance(claim, dict) and claim.get('text'):
                         text = claim['text'].strip()
-                        speaker = claim.get('speaker', 'Unknown').strip()
+                        speaker = (claim.get('speaker') or speaker_hint or 'Unknown').strip()
                         
                         # Double-check with our strict validation
                         if self._is_verifiable_factual_claim(text):
@@ -241,17 +488,10 @@ Transcript:
                                 'context': claim.get('context', ''),
                                 'reason': claim.get('reason', '')
                             })
-                            if speaker and speaker != 'Unknown':
-                                speakers.add(speaker)
                         else:
                             logger.debug(f"AI extracted but filtered: {text}")
                 
-                return {
-                    'claims': processed_claims[:self.max_claims],
-                    'speakers': list(speakers),
-                    'topics': self._extract_topics(transcript),
-                    'extraction_method': 'ai_enhanced'
-                }
+                return processed_claims
                 
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse AI response as JSON: {e}")
@@ -314,76 +554,23 @@ Transcript:
         if not self._is_valid_claim(sentence):
             return False
         
-        # Check for opinion indicators - these disqualify the claim
-        for indicator in self.opinion_indicators:
-            if indicator in sentence_clean:
-                return False
-        
-        # Check for opinion patterns
-        for pattern in self.opinion_patterns:
-            if re.search(pattern, sentence_clean):
-                logger.debug(f"Opinion pattern matched: {pattern} in '{sentence_clean[:50]}...'")
-                return False
+        # Opinion indicators, opinion patterns and pure characterizations disqualify the claim
+        opinion_match = self._opinion_re.search(sentence_clean)
+        if opinion_match:
+            logger.debug(f"Opinion marker '{opinion_match.group()}' in '{sentence_clean[:50]}...'")
+            return False
         
-        # Additional opinion checks
         # Statements that characterize something as good/bad without specific metrics
-        if re.search(r'\b(has\s+shown|have\s+shown).*\b(how\s+to)\b', sentence_clean):
-            if re.search(r'\b(good|bad|great|terrible|perfect|awful|excellent|poor)\b', sentence_clean):
-                return False
-        
-        # Reject pure characterizations without specific facts
-        characterization_patterns = [
-            r'^(this|that|it)\s+is\s+(a\s+)?(disaster|catastrophe|crisis|success|failure|triumph|embarrassment)',
-            r'\bis\s+(completely|totally|absolutely)\s+(wrong|right|false|true)',
-            r'\b(cannot|can\'t)\s+manage\b.*(?!specific\s+data|evidence|numbers)',
-        ]
-        
-        for pattern in characterization_patterns:
-            if re.search(pattern, sentence_clean):
-                return False
-        
-        # Now check for factual indicators
-        factual_indicators = [
-            # Specific numbers and statistics
-            r'\b\d+\.?\d*\s*(%|percent|million|billion|thousand)\b',
-            r'\$\d+',
-            r'\b\d+\s*(votes?|people|jobs|cases|deaths|births)\b',
-            
-            # Dates and time periods
-            r'\b(19|20)\d{2}\b',
-            r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d+',
-            r'\bin\s+(19|20)\d{2}\b',
-            r'\bsince\s+(19|20)\d{2}\b',
-            
-            # Specific policy/legal references
-            r'\b(h\.r\.|s\.|bill|act|amendment)\s*\d+',
-            r'\b(executive\s+order|regulation|statute|code)\s+\d+',
-            r'\b(section|title|chapter)\s+\d+',
-            
-            # Specific organizations and official bodies
-            r'\b(department\s+of|office\s+of|bureau\s+of|agency\s+of)\b',
-            r'\b(congress|senate|house)\s+(passed|voted|approved|rejected)',
-            r'\b(supreme\s+court|district\s+court|appeals\s+court)\b',
-            
-            # Measurable actions and outcomes
-            r'\b(increased|decreased|rose|fell|gained|lost|dropped)\s+(by\s+)?\d+',
-            r'\b(allocated|spent|invested|cut|reduced)\s+\$?\d+',
-            r'\b(signed|vetoed|passed|failed|approved|rejected)\b.*\b(bill|law|agreement|treaty)\b',
-            
-            # Specific geographical or institutional references
-            r'\b(state\s+of|city\s+of|university\s+of|bank\s+of)\s+[A-Z][a-z]+',
-            r'\b[A-Z][a-z]+\s+(university|college|hospital|corporation|company)\b',
-        ]
+        if self._shown_how_to_re.search(sentence_clean) and self._shown_judgment_re.search(sentence_clean):
+            return False
         
         # Must have at least one factual indicator
-        has_factual_indicator = any(re.search(pattern, sentence_clean) for pattern in factual_indicators)
+        has_factual_indicator = bool(self._factual_re.search(sentence_clean))
         
         if not has_factual_indicator:
             # Check for proper nouns (people, places, organizations) with action verbs
-            capitalized_words = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', sentence)
-            action_verbs = re.search(r'\b(said|announced|declared|signed|voted|passed|failed|won|lost|created|built|destroyed|implemented|launched|introduced|proposed)\b', sentence_clean)
-            
-            if len(capitalized_words) >= 2 and action_verbs:
+            capitalized_words = self._proper_noun_re.findall(sentence)
+            if len(capitalized_words) >= 2 and self._action_verb_re.search(sentence_clean):
                 has_factual_indicator = True
         
         if not has_factual_indicator:
@@ -395,17 +582,11 @@ Transcript:
             return False
         
         # Must have a clear subject-verb-object structure for factual claims
-        has_verb = any(verb in sentence_clean for verb in [
-            'is', 'are', 'was', 'were', 'has', 'have', 'had', 'will', 'would', 'can', 'could',
-            'passed', 'failed', 'signed', 'vetoed', 'announced', 'said', 'declared', 'created',
-            'increased', 'decreased', 'rose', 'fell', 'gained', 'lost', 'allocated', 'spent'
-        ])
-        
-        if not has_verb:
+        if not self._claim_verb_re.search(sentence_clean):
             return False
         
         # Final check: reject if it's just a characterization
-        if re.search(r'^[^.]*\b(is|are|was|were)\s+(just|simply|merely|only)\s+', sentence_clean):
+        if self._mere_characterization_re.search(sentence_clean):
             return False
         
         return True
@@ -425,25 +606,13 @@ Transcript:
         if sentence.strip().endswith('?'):
             return False
         
-        # Check if entire sentence is a non-claim phrase
-        if sentence_clean in self.non_claim_phrases:
+        # Check if it is, or starts with, a non-claim phrase
+        if self._non_claim_prefix_re.match(sentence_clean):
             return False
         
-        # Check if it starts with non-claim phrases
-        for phrase in self.non_claim_phrases:
-            if sentence_clean.startswith(phrase + ' ') or sentence_clean == phrase:
-                return False
-        
         # Skip pure conversational elements
-        conversational_only = [
-            r'^(well|so|now|then|anyway|however)\s*[,.]?\s*$',
-            r'^(you know|i mean|basically|actually|literally)\s*[,.]?\s*$',
-            r'^(um|uh|er|ah|oh)\s*[,.]?\s*$',
-        ]
-        
-        for pattern in conversational_only:
-            if re.match(pattern, sentence_clean):
-                return False
+        if self._conversational_re.match(sentence_clean):
+            return False
         
         return True
     
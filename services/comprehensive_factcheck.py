@@ -6,17 +6,21 @@ import re
 import logging
 import requests
 import json
-import asyncio
 import aiohttp
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from datetime import datetime
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from urllib.parse import quote
 
 # Import all our services
+from .analysis_context import AnalysisContext
 from .api_checkers import APICheckers
+from .async_bridge import AsyncLoopThread
+from .cache import SQLiteCache, TTLCache, TieredCache, verdict_fingerprint
 from .context_resolver import ContextResolver
+from .deadline import Deadline
 from .factcheck_history import FactCheckHistory
 
 logger = logging.getLogger(__name__)
@@ -114,8 +118,6 @@ class ComprehensiveFactChecker:
     
     def __init__(self, config):
         self.config = config
-        self.current_speaker = None
-        self.full_transcript = None  # Store full transcript for better context
         
         # Initialize all API keys
         self.api_keys = {
@@ -130,7 +132,11 @@ class ComprehensiveFactChecker:
         }
         
         # Initialize services
-        self.api_checkers = APICheckers(self.api_keys)
+        self.api_checkers = APICheckers(self.api_keys, config)
+        self.api_timeout = getattr(config, 'API_TIMEOUT', 10)
+        self.fact_check_timeout = getattr(config, 'FACT_CHECK_TIMEOUT', 15)
+        self.api_stop_confidence = getattr(config, 'API_EARLY_EXIT_CONFIDENCE', 80)
+        self.api_loop = AsyncLoopThread(name='api-checks')
         self.context_resolver = ContextResolver()
         self.fact_history = FactCheckHistory()
         
@@ -144,73 +150,355 @@ class ComprehensiveFactChecker:
             except Exception as e:
                 logger.error(f"Failed to initialize OpenAI: {e}")
         
-        # Thread pool for parallel API calls
-        self.executor = ThreadPoolExecutor(max_workers=10)
+        # Verdict cache keyed on normalized claim text
+        self.verdict_cache = self._create_verdict_cache(config)
+        
+        # Batched AI verdicts - several claims per chat completion (1 disables)
+        self.ai_batch_size = max(1, getattr(config, 'AI_BATCH_SIZE', 8))
+        self.ai_batch_token_budget = getattr(config, 'AI_BATCH_TOKEN_BUDGET', 6000)
+        self._batch_overhead_tokens = 300  # instructions and system prompt
+        self._batch_tokens_per_claim = 250  # expected verdict + explanation
+        
+        # Thread pool for parallel claim checks
+        self.max_concurrent_checks = max(1, getattr(config, 'MAX_CONCURRENT_CLAIM_CHECKS', 10))
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_checks,
+            thread_name_prefix='claim-check'
+        )
         
         # Enhanced settings
         self.force_verdict = getattr(config, 'FORCE_VERDICT_ON_ALL_CLAIMS', True)
         self.confidence_threshold = getattr(config, 'CONFIDENCE_THRESHOLD_FOR_VERDICT', 50)
         self.enable_aggressive_checking = getattr(config, 'ENABLE_AGGRESSIVE_CHECKING', True)
     
-    def check_claim_with_verdict(self, claim: str, context: Optional[Dict] = None) -> Dict:
-        """Main entry point - check claim using ALL available resources"""
-        try:
-            # Clean claim
-            claim = claim.strip()
-            
-            # Store transcript context for better analysis
-            if context and context.get('transcript'):
-                self.full_transcript = context['transcript']
-            
-            # Set current speaker for pattern analysis
-            self.current_speaker = context.get('speaker', 'Unknown') if context else 'Unknown'
+    def _create_verdict_cache(self, config) -> TieredCache:
+        """Build the in-process verdict cache, backed by SQLite when a path is configured"""
+        ttl = getattr(config, 'VERDICT_CACHE_TTL', 7 * 24 * 3600)
+        memory = TTLCache(
+            max_entries=getattr(config, 'VERDICT_CACHE_MAX_ENTRIES', 5000),
+            ttl=ttl
+        )
+        
+        disk = None
+        db_path = getattr(config, 'VERDICT_CACHE_DB_PATH', None)
+        if db_path:
+            try:
+                disk = SQLiteCache(
+                    db_path,
+                    max_entries=getattr(config, 'VERDICT_CACHE_DISK_MAX_ENTRIES', 100000),
+                    ttl=ttl
+                )
+                logger.info(f"Persistent verdict cache enabled at {db_path}")
+            except Exception as e:
+                logger.error(f"Failed to open verdict cache at {db_path}: {e}")
+        
+        return TieredCache(memory, disk)
+    
+    def close(self):
+        """Stop the claim-check pool and the API event loop, closing pooled connections"""
+        self.executor.shutdown(wait=False)
+        self.api_loop.shutdown(cleanup=self.api_checkers.close())
+    
+    def get_cache_stats(self) -> Dict:
+        """Verdict cache hit/miss counters"""
+        return self.verdict_cache.get_stats()
+    
+    def check_claims(self, claims: List[Dict], context: Optional[Dict] = None,
+                     progress_callback: Optional[Callable[[int, int, Optional[Dict]], None]] = None) -> List[Optional[Dict]]:
+        """
+        Check many claims concurrently on the checker's worker pool.
+        
+        Args:
+            claims: Extracted claims, each a dict with 'text' and 'speaker'
+            context: Context shared by every claim (transcript, topics and
+                optionally the job's AnalysisContext under 'analysis' and
+                its Deadline under 'deadline')
+            progress_callback: Called as (completed_count, claim_index, result)
+                each time a claim finishes, in completion order
+        
+        Returns:
+            One result per claim in the original claim order; None for
+            claims skipped as trivial. Claims still unchecked at the
+            deadline get a structural verdict marked 'timed_out'.
+        """
+        results: List[Optional[Dict]] = [None] * len(claims)
+        if not claims:
+            return results
+        
+        # Every claim of this batch shares one per-job analysis context and deadline
+        context = dict(context or {})
+        context['analysis'] = AnalysisContext.from_context(context)
+        deadline = context['deadline'] = Deadline.from_context(context)
+        
+        claim_contexts = []
+        for claim in claims:
+            claim_context = dict(context)
+            claim_context['speaker'] = claim.get('speaker', 'Unknown')
+            claim_contexts.append(claim_context)
+        
+        completed = 0
+        reported = set()
+        
+        def report(index: int, result: Optional[Dict]):
+            nonlocal completed
+            results[index] = result
+            reported.add(index)
+            completed += 1
+            if progress_callback:
+                try:
+                    progress_callback(completed, index, result)
+                except Exception as e:
+                    logger.warning(f"Progress callback failed: {e}")
+        
+        # Prepared in claim order on this thread, so context resolution sees
+        # earlier claims first; only verification goes to the pool
+        resolved_claims = self._prepare_claims(claims, claim_contexts, report)
+        
+        if self.openai_client and self.ai_batch_size > 1:
+            self._check_claims_batched(resolved_claims, claim_contexts, report, deadline)
+        else:
+            futures = {}
+            for index, resolved_claim in resolved_claims.items():
+                future = self.executor.submit(self._verify_claim, resolved_claim, claim_contexts[index])
+                futures[future] = index
             
-            # Check if this is trivial content
-            if self._is_trivial_claim(claim):
-                return None  # Skip trivial claims entirely
+            try:
+                for future in as_completed(futures, timeout=deadline.remaining()):
+                    index = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Error checking claim {index+1}: {e}")
+                        result = self._error_result(resolved_claims[index], claim_contexts[index]['speaker'], e)
+                    report(index, result)
+            except FuturesTimeoutError:
+                for future in futures:
+                    future.cancel()
+        
+        # Whatever is left when the job's time runs out gets a structural verdict
+        unchecked = [index for index in range(len(claims)) if index not in reported]
+        if unchecked:
+            logger.warning(f"Deadline reached with {len(unchecked)} of {len(claims)} claims unchecked")
+        for index in unchecked:
+            report(index, self._timed_out_result(claims[index].get('text', '').strip(), claim_contexts[index]))
+        
+        return results
+    
+    def _prepare_claims(self, claims: List[Dict], claim_contexts: List[Dict],
+                        report: Callable[[int, Optional[Dict]], None]) -> Dict[int, str]:
+        """
+        Run _prepare_claim over the claims in order, reporting those it decides.
+        
+        Returns:
+            Resolved claim text by claim index, for the claims still to verify
+        """
+        resolved_claims: Dict[int, str] = {}
+        for index, claim in enumerate(claims):
+            claim_context = claim_contexts[index]
+            try:
+                prepared = self._prepare_claim(claim.get('text', ''), claim_context)
+            except Exception as e:
+                logger.error(f"Error preparing claim {index+1}: {e}")
+                report(index, self._error_result(claim.get('text', ''), claim_context['speaker'], e))
+                continue
             
-            # Enhanced context resolution with full transcript
-            resolved_claim, context_info = self._resolve_claim_with_context(claim, context)
-            if resolved_claim != claim:
-                logger.info(f"Enhanced context resolution: {claim} -> {resolved_claim}")
-                claim = resolved_claim
+            if prepared is None:
+                report(index, None)
+                continue
             
-            # Check for empty rhetoric patterns first
-            rhetoric_check = self._check_empty_rhetoric(claim)
-            if rhetoric_check:
-                return self._create_final_result(claim, rhetoric_check, context)
+            resolved_claim, early_result = prepared
+            if early_result:
+                report(index, early_result)
+                continue
             
-            # Check for unsubstantiated predictions
-            prediction_check = self._check_unsubstantiated_prediction(claim)
-            if prediction_check:
-                return self._create_final_result(claim, prediction_check, context)
+            resolved_claims[index] = resolved_claim
+        return resolved_claims
+    
+    def _check_claims_batched(self, resolved_claims: Dict[int, str], claim_contexts: List[Dict],
+                              report: Callable[[int, Optional[Dict]], None], deadline: Deadline) -> None:
+        """
+        Batched variant of check_claims for prepared claims: claims that need
+        an AI verdict are packed several to a chat completion, then finished
+        (API fallback, structural analysis) individually on the pool. Returns
+        at the deadline with the unfinished claims unreported.
+        """
+        ai_results: Dict[int, Optional[Dict]] = {}
+        needs_ai = []
+        
+        for index, resolved_claim in resolved_claims.items():
+            cached = self.verdict_cache.get(self._verdict_cache_key(resolved_claim))
+            if cached is not None:
+                ai_results[index] = dict(cached)
+            else:
+                needs_ai.append(index)
+        
+        def finish_claim(index: int, ai_result: Optional[Dict], ai_timed_out: bool = False) -> Dict:
+            # The claim's own budget starts when it reaches a worker, not while it queues
+            claim_context = dict(claim_contexts[index])
+            claim_context['deadline'] = deadline.child(self.fact_check_timeout)
+            return self._finish_claim(resolved_claims[index], ai_result, claim_context, ai_timed_out)
+        
+        pending = {}
+        for index in ai_results:
+            future = self.executor.submit(finish_claim, index, ai_results[index])
+            pending[future] = ('claim', index)
+        
+        for batch in self._plan_ai_batches(needs_ai, resolved_claims):
+            items = [(index, resolved_claims[index], claim_contexts[index]) for index in batch]
+            # One request answers for every claim in the batch, so it gets their combined budget
+            batch_deadline = deadline.child(self.fact_check_timeout * len(batch))
+            future = self.executor.submit(self._ai_batch_analysis_with_fallback, items, batch_deadline)
+            pending[future] = ('batch', (batch, batch_deadline))
+        
+        while pending:
+            done, _ = wait(pending, timeout=deadline.remaining(), return_when=FIRST_COMPLETED)
+            if not done:
+                for future in pending:
+                    future.cancel()
+                return
             
-            # Use AI for comprehensive analysis if available
-            if self.openai_client:
-                ai_result = self._ai_comprehensive_analysis(claim, context)
-                if ai_result and ai_result.get('verdict') != 'needs_context':
-                    return self._create_final_result(claim, ai_result, context)
+            for future in done:
+                kind, payload = pending.pop(future)
+                
+                if kind == 'batch':
+                    batch, batch_deadline = payload
+                    try:
+                        batch_results = future.result()
+                    except Exception as e:
+                        logger.error(f"AI batch failed: {e}")
+                        batch_results = {}
+                    
+                    for index in batch:
+                        ai_result = batch_results.get(index)
+                        timed_out = ai_result is None and batch_deadline.expired()
+                        finish = self.executor.submit(finish_claim, index, ai_result, timed_out)
+                        pending[finish] = ('claim', index)
+                    continue
+                
+                index = payload
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Error checking claim {index+1}: {e}")
+                    result = self._error_result(resolved_claims[index], claim_contexts[index]['speaker'], e)
+                report(index, result)
+    
+    def check_claim_with_verdict(self, claim: str, context: Optional[Dict] = None) -> Dict:
+        """
+        Main entry point - check claim using ALL available resources.
+        
+        All per-request state (speaker, transcript, previous claims) travels
+        in ``context`` and its AnalysisContext, never on the checker, so one
+        instance can serve concurrent jobs.
+        """
+        speaker = context.get('speaker', 'Unknown') if context else 'Unknown'
+        context = dict(context or {})
+        
+        try:
+            prepared = self._prepare_claim(claim, context)
+            if prepared is None:
+                return None  # Skip trivial claims entirely
             
-            # Fallback to API checking
-            api_result = self._check_with_all_apis(claim)
-            if api_result and api_result.get('verdict') != 'needs_context':
-                return self._create_final_result(claim, api_result, context)
+            claim, early_result = prepared
+            if early_result:
+                return early_result
             
-            # Last resort: analyze claim structure for a verdict
-            structural_analysis = self._analyze_claim_structure(claim)
-            return self._create_final_result(claim, structural_analysis, context)
+            return self._verify_claim(claim, context)
             
         except Exception as e:
             logger.error(f"Error checking claim '{claim}': {e}")
-            return {
-                'claim': claim,
-                'speaker': self.current_speaker,
-                'verdict': 'error',
-                'explanation': f'Analysis failed: {str(e)}',
-                'confidence': 0,
-                'sources': [],
-                'timestamp': datetime.now().isoformat()
-            }
+            return self._error_result(claim, speaker, e)
+    
+    def _verify_claim(self, claim: str, context: Dict) -> Dict:
+        """Verify a prepared claim with the AI (if available) and the external APIs"""
+        # The claim's budget starts now and never runs past the job's deadline
+        deadline = Deadline.from_context(context).child(self.fact_check_timeout)
+        context = {**context, 'deadline': deadline}
+        
+        # Use AI for comprehensive analysis if available
+        ai_result = None
+        if self.openai_client:
+            ai_result = self._cached_ai_analysis(claim, context)
+        
+        return self._finish_claim(claim, ai_result, context, ai_result is None and deadline.expired())
+    
+    def _prepare_claim(self, claim: str, context: Optional[Dict]) -> Optional[Tuple[str, Optional[Dict]]]:
+        """
+        Run the cheap, local stages of a check.
+        
+        Returns:
+            None for trivial claims, otherwise (resolved_claim, result) where
+            result is set when rhetoric/prediction patterns already decide it
+        """
+        # Clean claim
+        claim = claim.strip()
+        
+        # Check if this is trivial content
+        if self._is_trivial_claim(claim):
+            return None
+        
+        # Enhanced context resolution with full transcript
+        resolved_claim, context_info = self._resolve_claim_with_context(claim, context)
+        if resolved_claim != claim:
+            logger.info(f"Enhanced context resolution: {claim} -> {resolved_claim}")
+            claim = resolved_claim
+        
+        # Check for empty rhetoric patterns first
+        rhetoric_check = self._check_empty_rhetoric(claim)
+        if rhetoric_check:
+            return claim, self._create_final_result(claim, rhetoric_check, context)
+        
+        # Check for unsubstantiated predictions
+        prediction_check = self._check_unsubstantiated_prediction(claim)
+        if prediction_check:
+            return claim, self._create_final_result(claim, prediction_check, context)
+        
+        return claim, None
+    
+    def _finish_claim(self, claim: str, ai_result: Optional[Dict], context: Optional[Dict],
+                      ai_timed_out: bool = False) -> Dict:
+        """
+        Turn an AI verdict into a final result, falling back to APIs and
+        structure analysis. A claim whose AI stage timed out, or whose
+        deadline passes before the APIs answer, is marked 'timed_out'.
+        """
+        if ai_result and ai_result.get('verdict') != 'needs_context':
+            return self._create_final_result(claim, ai_result, context)
+        
+        if ai_timed_out:
+            return self._timed_out_result(claim, context)
+        
+        # Fallback to API checking
+        deadline = Deadline.from_context(context)
+        api_result = self._check_with_all_apis(claim, deadline)
+        if api_result and api_result.get('verdict') != 'needs_context':
+            return self._create_final_result(claim, api_result, context)
+        
+        if deadline.expired():
+            return self._timed_out_result(claim, context)
+        
+        # Last resort: analyze claim structure for a verdict
+        structural_analysis = self._analyze_claim_structure(claim)
+        return self._create_final_result(claim, structural_analysis, context)
+    
+    def _timed_out_result(self, claim: str, context: Optional[Dict]) -> Dict:
+        """Structural verdict for a claim whose time budget ran out"""
+        result = self._create_final_result(claim, self._analyze_claim_structure(claim), context)
+        result['explanation'] = f"Verification timed out, so this is based on the claim's wording only. {result['explanation']}"
+        result['timed_out'] = True
+        return result
+    
+    def _error_result(self, claim: str, speaker: str, error: Exception) -> Dict:
+        """Result recorded for a claim whose check raised"""
+        return {
+            'claim': claim,
+            'speaker': speaker,
+            'verdict': 'error',
+            'explanation': f'Analysis failed: {str(error)}',
+            'confidence': 0,
+            'sources': [],
+            'timestamp': datetime.now().isoformat()
+        }
     
     def _is_trivial_claim(self, claim: str) -> bool:
         """Check if claim is too trivial to fact-check"""
@@ -236,13 +524,16 @@ class ComprehensiveFactChecker:
         if not context:
             return claim, {}
         
+        analysis_context = AnalysisContext.from_context(context)
+        
         # Use context resolver
-        resolved, info = self.context_resolver.resolve_with_context(claim, context)
+        resolved, info = self.context_resolver.resolve_with_context(claim, context, analysis_context)
         
         # Additional enhancements based on full transcript
-        if self.full_transcript and len(self.full_transcript) > 1000:
+        transcript = analysis_context.transcript
+        if transcript and len(transcript) > 1000:
             # Find topic context from transcript
-            topic_context = self._extract_topic_context(claim, self.full_transcript)
+            topic_context = self._extract_topic_context(claim, transcript)
             if topic_context:
                 info['topic_context'] = topic_context
         
@@ -329,11 +620,34 @@ class ComprehensiveFactChecker:
         
         return None
     
+    def _verdict_cache_key(self, claim: str) -> str:
+        """Cache key for a claim's AI verdict; the model is part of the key"""
+        model = getattr(self.config, 'OPENAI_MODEL', 'gpt-4')
+        return f"{model}:{verdict_fingerprint(claim)}"
+    
+    def _cached_ai_analysis(self, claim: str, context: Optional[Dict]) -> Optional[Dict]:
+        """AI analysis served from the verdict cache when the claim has been seen before"""
+        key = self._verdict_cache_key(claim)
+        cached = self.verdict_cache.get(key)
+        if cached is not None:
+            logger.info(f"Verdict cache hit: {claim[:80]}")
+            return dict(cached)
+        
+        ai_result = self._ai_comprehensive_analysis(claim, context)
+        if ai_result:
+            self.verdict_cache.set(key, ai_result)
+        
+        return ai_result
+    
     def _ai_comprehensive_analysis(self, claim: str, context: Optional[Dict]) -> Optional[Dict]:
         """Use AI for comprehensive claim analysis"""
         if not self.openai_client:
             return None
         
+        deadline = Deadline.from_context(context).child(self.fact_check_timeout)
+        if deadline.expired():
+            return None
+        
         try:
             # Build comprehensive prompt
             prompt = self._build_ai_analysis_prompt(claim, context)
@@ -345,7 +659,8 @@ class ComprehensiveFactChecker:
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.1,
-                max_tokens=1000
+                max_tokens=1000,
+                timeout=deadline.timeout()
             )
             
             return self._parse_ai_response(response.choices[0].message.content)
@@ -415,19 +730,177 @@ class ComprehensiveFactChecker:
             logger.error(f"Failed to parse AI response: {e}")
             return None
     
-    def _check_with_all_apis(self, claim: str) -> Optional[Dict]:
-        """Check claim against all available APIs"""
-        results = []
+    def _estimate_tokens(self, text: str) -> int:
+        """Rough token estimate (about four characters per token)"""
+        return len(text) // 4 + 1
+    
+    def _plan_ai_batches(self, indices: List[int], claims: Dict[int, str]) -> List[List[int]]:
+        """Group claims into batches bounded by AI_BATCH_SIZE and the token budget"""
+        batches = []
+        current: List[int] = []
+        current_tokens = self._batch_overhead_tokens
+        
+        for index in indices:
+            claim_tokens = self._estimate_tokens(claims[index]) + self._batch_tokens_per_claim
+            if current and (len(current) >= self.ai_batch_size or
+                            current_tokens + claim_tokens > self.ai_batch_token_budget):
+                batches.append(current)
+                current = []
+                current_tokens = self._batch_overhead_tokens
+            
+            current.append(index)
+            current_tokens += claim_tokens
+        
+        if current:
+            batches.append(current)
+        
+        return batches
+    
+    def _ai_batch_analysis_with_fallback(self, items: List[Tuple[int, str, Dict]],
+                                         deadline: Deadline) -> Dict[int, Optional[Dict]]:
+        """
+        Analyze a batch of (index, claim, context) in one request; claims the
+        batch response did not cover are retried one at a time while the
+        batch's deadline allows.
+        """
+        results = {}
+        if len(items) > 1:
+            results = self._ai_batch_analysis(items, deadline)
+        
+        for index, claim, context in items:
+            result = results.get(index)
+            if result is None and not deadline.expired():
+                if len(items) > 1:
+                    logger.info(f"No batched verdict for claim {index+1}, analyzing individually")
+                result = self._ai_comprehensive_analysis(claim, {**context, 'deadline': deadline})
+            
+            if result:
+                self.verdict_cache.set(self._verdict_cache_key(claim), result)
+            results[index] = result
+        
+        return results
+    
+    def _ai_batch_analysis(self, items: List[Tuple[int, str, Dict]], deadline: Deadline) -> Dict[int, Dict]:
+        """Use AI to analyze several claims with one chat completion"""
+        if not self.openai_client or deadline.expired():
+            return {}
         
-        # Check Google Fact Check API
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            google_result = loop.run_until_complete(self.api_checkers.check_google_factcheck(claim))
-            if google_result.get('found'):
-                results.append(google_result)
+            prompt = self._build_ai_batch_prompt(items)
+            
+            response = self.openai_client.chat.completions.create(
+                model=getattr(self.config, 'OPENAI_MODEL', 'gpt-4'),
+                messages=[
+                    {"role": "system", "content": "You are an expert fact-checker. Analyze claims thoroughly and always provide a definitive verdict with high confidence."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.1,
+                max_tokens=min(4000, self._batch_tokens_per_claim * len(items) + 200),
+                timeout=deadline.timeout()
+            )
+            
+            return self._parse_ai_batch_response(response.choices[0].message.content, [index for index, _, _ in items])
+            
         except Exception as e:
-            logger.warning(f"Google fact check failed: {e}")
+            logger.warning(f"Batched AI analysis failed: {e}")
+            return {}
+    
+    def _build_ai_batch_prompt(self, items: List[Tuple[int, str, Dict]]) -> str:
+        """Build a prompt that asks for one verdict per claim as a JSON array"""
+        claims_payload = []
+        for index, claim, context in items:
+            entry = {'id': index, 'claim': claim}
+            if context and context.get('speaker'):
+                entry['speaker'] = context['speaker']
+            if context and context.get('topic_context'):
+                entry['context'] = context['topic_context']
+            claims_payload.append(entry)
+        
+        prompt_parts = [
+            "Analyze each of these claims for factual accuracy:",
+            json.dumps(claims_payload, ensure_ascii=False),
+            "",
+            "For each claim consider:",
+            "1. Is this a verifiable factual claim or opinion/rhetoric?",
+            "2. Can this be checked against known data or evidence?",
+            "3. Are there any logical inconsistencies or red flags?",
+            "4. What is the most appropriate verdict?",
+            "",
+            "Respond with ONLY a JSON array containing one object per claim, in this format:",
+            '[{"id": <claim id>, "verdict": "true|mostly_true|nearly_true|exaggeration|misleading|mostly_false|false|empty_rhetoric|unsubstantiated_prediction|opinion", "confidence": <50-95>, "explanation": "<detailed explanation>"}]',
+            "",
+            "Always provide a definitive verdict. Avoid 'needs_context' unless absolutely impossible to analyze."
+        ]
+        
+        return "\n".join(prompt_parts)
+    
+    def _parse_ai_batch_response(self, response: str, expected_ids: List[int]) -> Dict[int, Dict]:
+        """Parse a batched AI response; entries that are missing or malformed are left out"""
+        try:
+            content = response.strip()
+            if not content.startswith('['):
+                json_match = re.search(r'\[.*\]', content, re.DOTALL)
+                if not json_match:
+                    logger.warning("No JSON array found in batched AI response")
+                    return {}
+                content = json_match.group()
+            
+            entries = json.loads(content)
+        except (json.JSONDecodeError, AttributeError) as e:
+            logger.warning(f"Failed to parse batched AI response: {e}")
+            return {}
+        
+        if not isinstance(entries, list):
+            return {}
+        
+        expected = set(expected_ids)
+        results = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            
+            try:
+                index = int(entry.get('id'))
+            except (TypeError, ValueError):
+                continue
+            
+            if index not in expected or not entry.get('verdict'):
+                continue
+            
+            try:
+                confidence = int(re.findall(r'\d+', str(entry.get('confidence', 60)))[0])
+            except IndexError:
+                confidence = 60
+            
+            results[index] = {
+                'verdict': self._normalize_verdict(str(entry['verdict'])),
+                'confidence': confidence,
+                'explanation': entry.get('explanation') or 'AI analysis completed but detailed explanation not available.',
+                'sources': ['AI Analysis']
+            }
+        
+        return results
+    
+    def _check_with_all_apis(self, claim: str, deadline: Optional[Deadline] = None) -> Optional[Dict]:
+        """Check claim against all available APIs concurrently, within the claim's deadline"""
+        deadline = deadline or Deadline()
+        if deadline.expired():
+            return None
+        
+        try:
+            results = self.api_loop.run(
+                self.api_checkers.gather_evidence(
+                    claim,
+                    timeout=self.api_timeout,
+                    stop_confidence=self.api_stop_confidence,
+                    deadline=deadline
+                ),
+                # Sources run side by side, so the whole stage gets one source's budget plus slack
+                timeout=deadline.timeout(cap=self.api_timeout) + 5
+            )
+        except Exception as e:
+            logger.warning(f"API evidence gathering failed: {e}")
+            return None
         
         # If we have API results, use them
         if results:
@@ -436,18 +909,33 @@ class ComprehensiveFactChecker:
         return None
     
     def _synthesize_api_results(self, results: List[Dict]) -> Dict:
-        """Synthesize multiple API results into single verdict"""
+        """
+        Synthesize multiple API results into single verdict.
+        
+        Evidence-only sources (news, economic data) answer 'needs_context';
+        if no result reaches a known verdict, the synthesis stays
+        'needs_context' so the caller falls back to structure analysis.
+        """
         if not results:
             return None
         
-        # Simple approach: use the first result with highest confidence
-        best_result = max(results, key=lambda r: r.get('confidence', 0))
+        # Prefer results that reach a verdict, then the most confident one
+        best_result = max(
+            results,
+            key=lambda r: (self._known_verdict(r.get('verdict')) is not None, r.get('confidence', 0))
+        )
+        
+        sources = []
+        for result in [best_result] + results:
+            source = result.get('source', 'External API')
+            if source not in sources:
+                sources.append(source)
         
         return {
-            'verdict': self._normalize_verdict(best_result.get('verdict', 'opinion')),
+            'verdict': self._known_verdict(best_result.get('verdict')) or 'needs_context',
             'explanation': best_result.get('explanation', 'Based on external fact-checking sources.'),
             'confidence': max(best_result.get('confidence', 60), 60),
-            'sources': [best_result.get('source', 'External API')]
+            'sources': sources
         }
     
     def _analyze_claim_structure(self, claim: str) -> Dict:
@@ -496,8 +984,12 @@ class ComprehensiveFactChecker:
     
     def _normalize_verdict(self, verdict: str) -> str:
         """Normalize verdict strings"""
+        return self._known_verdict(verdict) or 'opinion'
+    
+    def _known_verdict(self, verdict: Optional[str]) -> Optional[str]:
+        """Final verdict a verdict string maps to, or None if it isn't one"""
         if not verdict:
-            return 'opinion'
+            return None
             
         verdict = verdict.lower().strip().replace(' ', '_')
         
@@ -517,7 +1009,7 @@ class ComprehensiveFactChecker:
             'mixed': 'exaggeration'  # Treat mixed as exaggeration
         }
         
-        return verdict_map.get(verdict, 'opinion')
+        return verdict_map.get(verdict)
     
     def _create_verdict(self, verdict: str, explanation: str, confidence: int = 60, sources: List[str] = None) -> Dict:
         """Create standardized verdict"""
@@ -4,45 +4,48 @@ Enhanced Context Resolution Service - Less Restrictive
 import re
 import logging
 from typing import Dict, List, Tuple, Optional
-from collections import defaultdict
+
+from .analysis_context import AnalysisContext
 
 logger = logging.getLogger(__name__)
 
 class ContextResolver:
-    """Resolve contextual references in claims - LESS RESTRICTIVE VERSION"""
+    """
+    Resolve contextual references in claims - LESS RESTRICTIVE VERSION
+    
+    The resolver itself is stateless; per-job entities and claim history
+    live on the AnalysisContext passed to each call, so one resolver can
+    serve concurrent jobs.
+    """
     
     def __init__(self):
-        self.entities = defaultdict(list)
-        self.previous_claims = []
         self.name_map = {}
-        self.max_context_size = 10
     
-    def analyze_full_transcript(self, transcript: str):
+    def analyze_full_transcript(self, transcript: str, analysis_context: AnalysisContext):
         """Extract entities from full transcript"""
         # Extract names (proper nouns)
         name_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'
         names = re.findall(name_pattern, transcript)
         
-        for name in names:
-            if len(name.split()) <= 3:  # Reasonable name length
-                self.entities['people'].append(name)
+        # Reasonable name length
+        analysis_context.add_entities('people', [name for name in names if len(name.split()) <= 3])
         
         # Extract organizations
         org_indicators = ['Company', 'Corporation', 'Inc', 'LLC', 'Organization', 'Department', 'Agency']
         for indicator in org_indicators:
             pattern = rf'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+{indicator})'
             orgs = re.findall(pattern, transcript)
-            self.entities['organizations'].extend(orgs)
+            analysis_context.add_entities('organizations', orgs)
         
         # Extract locations
         location_pattern = r'\b(?:in|at|from|to)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'
         locations = re.findall(location_pattern, transcript)
-        self.entities['locations'].extend(locations)
+        analysis_context.add_entities('locations', locations)
         
         # Extract topics
-        self._extract_topics(transcript)
+        self._extract_topics(transcript, analysis_context)
     
-    def _extract_topics(self, transcript: str):
+    def _extract_topics(self, transcript: str, analysis_context: AnalysisContext):
         """Extract main topics from transcript"""
         topic_keywords = {
             'economy': ['economy', 'economic', 'gdp', 'growth', 'recession', 'inflation', 'jobs'],
@@ -57,20 +60,28 @@ class ContextResolver:
         }
         
         transcript_lower = transcript.lower()
-        self.entities['topics'] = []
+        topics = []
         
         for topic, keywords in topic_keywords.items():
             count = sum(1 for keyword in keywords if keyword in transcript_lower)
             if count >= 2:  # Topic mentioned at least twice
-                self.entities['topics'].append(topic)
+                topics.append(topic)
+        
+        analysis_context.set_entities('topics', topics)
     
-    def add_claim_to_context(self, claim: str):
-        """Add a claim to the context history"""
-        self.previous_claims.append(claim)
-        if len(self.previous_claims) > self.max_context_size:
-            self.previous_claims.pop(0)
+    def add_claim_to_context(self, claim: str, analysis_context: AnalysisContext):
+        """Add a claim to the job's context history"""
+        analysis_context.add_claim(claim)
+    
+    def resolve_with_context(self, claim: str, context: Optional[Dict] = None,
+                             analysis_context: Optional[AnalysisContext] = None) -> Tuple[str, Dict]:
+        """Resolve a claim using the per-job analysis context carried by a claim context"""
+        if analysis_context is None:
+            analysis_context = AnalysisContext.from_context(context)
+        
+        return self.resolve_context(claim, analysis_context)
     
-    def resolve_context(self, claim: str) -> Tuple[str, Dict]:
+    def resolve_context(self, claim: str, analysis_context: AnalysisContext) -> Tuple[str, Dict]:
         """Resolve contextual references in claims"""
         original_claim = claim
         context_info = {'original': original_claim, 'resolved': False, 'resolutions': []}
@@ -80,7 +91,7 @@ class ContextResolver:
         
         # Resolve pronouns
         if any(pronoun in claim.lower().split() for pronoun in ['they', 'it', 'this', 'that', 'he', 'she', 'his', 'her', 'their']):
-            resolved_claim = self._resolve_pronouns(claim)
+            resolved_claim = self._resolve_pronouns(claim, analysis_context)
             if resolved_claim != claim:
                 claim = resolved_claim
                 context_info['resolved'] = True
@@ -90,7 +101,7 @@ class ContextResolver:
         claim = self._apply_contextual_knowledge(claim, context_info)
         
         # Add to context for future claims
-        self.add_claim_to_context(original_claim)
+        self.add_claim_to_context(original_claim, analysis_context)
         
         return claim, context_info
     
@@ -114,12 +125,13 @@ class ContextResolver:
         
         return claim
     
-    def _resolve_pronouns(self, claim: str) -> str:
+    def _resolve_pronouns(self, claim: str, analysis_context: AnalysisContext) -> str:
         """Resolve pronoun references"""
         # Look for the most recent entity mentioned
-        if self.previous_claims:
+        previous_claims = analysis_context.get_previous_claims()
+        if previous_claims:
             # Simple heuristic: use the last mentioned person
-            for prev_claim in reversed(self.previous_claims):
+            for prev_claim in reversed(previous_claims):
                 # Find proper nouns in previous claims
                 names = re.findall(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b', prev_claim)
                 if names:
@@ -194,14 +206,15 @@ class ContextResolver:
         
         return None
     
-    def get_context_summary(self) -> Dict:
+    def get_context_summary(self, analysis_context: AnalysisContext) -> Dict:
         """Get a summary of the extracted context"""
+        entities = analysis_context.get_entities()
         return {
-            'people': len(self.entities.get('people', [])),
-            'organizations': len(self.entities.get('organizations', [])),
-            'locations': len(self.entities.get('locations', [])),
-            'events': len(self.entities.get('events', [])),
-            'topics': self.entities.get('topics', []),
+            'people': len(entities.get('people', [])),
+            'organizations': len(entities.get('organizations', [])),
+            'locations': len(entities.get('locations', [])),
+            'events': len(entities.get('events', [])),
+            'topics': entities.get('topics', []),
             'name_mappings': len(self.name_map),
-            'total_entities': sum(len(v) for v in self.entities.values())
+            'total_entities': sum(len(v) for v in entities.values())
         }
@@ -0,0 +1,53 @@
+"""
+Deadline Module
+Time budgets handed down through the stages of an analysis job
+"""
+import time
+from typing import Dict, Optional
+
+
+class Deadline:
+    """
+    A point on the monotonic clock that a piece of work has to finish by.
+
+    A job starts one from its total budget and each stage narrows it with
+    child() to its own budget, so no stage can outlive the job. Blocking
+    calls take their timeout from timeout(), which never exceeds what is
+    left. Deadline() with no budget never expires.
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        self.expires_at = None if seconds is None else time.monotonic() + seconds
+
+    @classmethod
+    def from_context(cls, context: Optional[Dict]) -> 'Deadline':
+        """The deadline carried in a claim context under 'deadline', or an unbounded one"""
+        deadline = context.get('deadline') if context else None
+        return deadline if isinstance(deadline, cls) else cls()
+
+    def child(self, seconds: Optional[float]) -> 'Deadline':
+        """A deadline seconds from now, or this one if it comes sooner"""
+        child = Deadline(seconds)
+        if self.expires_at is not None and (child.expires_at is None or self.expires_at < child.expires_at):
+            child.expires_at = self.expires_at
+        return child
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, never negative; None if unbounded"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def timeout(self, cap: Optional[float] = None) -> Optional[float]:
+        """Timeout for a blocking call: the time left, at most cap"""
+        remaining = self.remaining()
+        if remaining is None:
+            return cap
+        return remaining if cap is None else min(remaining, cap)
+
+    def __repr__(self) -> str:
+        remaining = self.remaining()
+        return 'Deadline(unbounded)' if remaining is None else f'Deadline({remaining:.1f}s left)'
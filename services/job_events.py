@@ -0,0 +1,143 @@
+"""
+Job Events Module
+Per-job pub/sub channels that feed the progress stream endpoint
+"""
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Events after which a job publishes nothing more
+TERMINAL_EVENTS = ('complete', 'failed')
+
+
+class JobEventBus:
+    """
+    In-process event channels, one per job.
+
+    Each channel keeps a short replay log so subscribers that connect late,
+    or reconnect with Last-Event-ID, catch up on what they missed. A publish
+    only wakes that job's subscribers. Channels are dropped once they have
+    been idle for channel_ttl seconds with nobody waiting on them.
+    """
+
+    def __init__(self, history_size: int = 500, channel_ttl: float = 600):
+        self.history_size = history_size
+        self.channel_ttl = channel_ttl
+        self._channels: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _channel_locked(self, job_id: str) -> Dict:
+        channel = self._channels.get(job_id)
+        if channel is None:
+            channel = {
+                'events': deque(maxlen=self.history_size),
+                'seq': 0,
+                'waiters': 0,
+                'touched': time.time(),
+                'condition': threading.Condition(self._lock)
+            }
+            self._channels[job_id] = channel
+        return channel
+
+    def publish(self, job_id: str, event_type: str, data: Dict) -> None:
+        """Append an event to the job's channel and wake its subscribers"""
+        with self._lock:
+            self._prune_locked()
+            channel = self._channel_locked(job_id)
+            channel['seq'] += 1
+            channel['events'].append({'id': str(channel['seq']), 'event': event_type, 'data': data})
+            channel['touched'] = time.time()
+            channel['condition'].notify_all()
+
+    def wait(self, job_id: str, last_id: Optional[str] = None, timeout: float = 15) -> List[Dict]:
+        """
+        Events published after last_id, blocking up to timeout for new ones.
+
+        Returns:
+            List of {'id', 'event', 'data'} dicts, empty on timeout
+        """
+        after = int(last_id) if last_id and last_id.isdigit() else 0
+        deadline = time.monotonic() + timeout
+
+        with self._lock:
+            channel = self._channel_locked(job_id)
+            channel['waiters'] += 1
+            try:
+                while channel['seq'] <= after:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return []
+                    channel['condition'].wait(remaining)
+
+                return [event for event in channel['events'] if int(event['id']) > after]
+            finally:
+                channel['waiters'] -= 1
+                channel['touched'] = time.time()
+
+    def _prune_locked(self) -> None:
+        cutoff = time.time() - self.channel_ttl
+        idle = [
+            job_id for job_id, channel in self._channels.items()
+            if channel['touched'] < cutoff and not channel['waiters']
+        ]
+        for job_id in idle:
+            del self._channels[job_id]
+
+
+class RedisJobEventBus:
+    """
+    Event channels on Redis streams, shared by every app worker.
+
+    A job's events are appended to a capped stream that expires with the
+    channel TTL, so any worker can serve the progress stream for any job.
+    """
+
+    def __init__(self, client, history_size: int = 500, channel_ttl: float = 600,
+                 prefix: str = 'factchecker'):
+        self.client = client
+        self.history_size = history_size
+        self.channel_ttl = int(channel_ttl)
+        self.prefix = prefix
+
+    def _key(self, job_id: str) -> str:
+        return f'{self.prefix}:events:{job_id}'
+
+    def publish(self, job_id: str, event_type: str, data: Dict) -> None:
+        """Append an event to the job's stream"""
+        key = self._key(job_id)
+        pipe = self.client.pipeline()
+        pipe.xadd(key, {'event': event_type, 'data': json.dumps(data)},
+                  maxlen=self.history_size, approximate=True)
+        pipe.expire(key, self.channel_ttl)
+        pipe.execute()
+
+    def wait(self, job_id: str, last_id: Optional[str] = None, timeout: float = 15) -> List[Dict]:
+        """Events published after last_id, blocking up to timeout for new ones"""
+        response = self.client.xread({self._key(job_id): last_id or '0-0'}, block=int(timeout * 1000))
+
+        events = []
+        for _, entries in response or []:
+            for entry_id, fields in entries:
+                fields = {
+                    (k.decode('utf-8') if isinstance(k, bytes) else k): (v.decode('utf-8') if isinstance(v, bytes) else v)
+                    for k, v in fields.items()
+                }
+                events.append({
+                    'id': entry_id.decode('utf-8') if isinstance(entry_id, bytes) else entry_id,
+                    'event': fields.get('event', 'message'),
+                    'data': json.loads(fields.get('data', '{}'))
+                })
+        return events
+
+
+def format_sse(event: Dict) -> str:
+    """Encode an event in the text/event-stream wire format"""
+    lines = [f"id: {event['id']}"] if event.get('id') else []
+    lines.append(f"event: {event['event']}")
+    lines.append(f"data: {json.dumps(event['data'])}")
+    return '\n'.join(lines) + '\n\n'
@@ -0,0 +1,252 @@
+"""
+Job Queue Service
+Shared queue of analysis job IDs between the web app and worker processes
+"""
+import collections
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+from .job_scheduler import QueueFullError
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueue:
+    """
+    FIFO of job IDs waiting for a worker.
+
+    Only IDs are queued; workers load the transcript from the job's
+    checkpoint in job storage. Delivery is at most once: a job taken by a
+    worker that then dies is picked up again by heartbeat recovery, not by
+    the queue.
+    """
+
+    def __init__(self, max_size: int = 50, retry_after: int = 30):
+        self.max_size = max(1, max_size)
+        self.retry_after = retry_after
+        self.stats = {'enqueued': 0, 'rejected': 0, 'dequeued': 0}
+
+    def put(self, job_id: str) -> int:
+        """
+        Append a job.
+
+        Returns:
+            1-based queue position of the job
+
+        Raises:
+            QueueFullError: the queue is at capacity
+        """
+        raise NotImplementedError
+
+    def get(self, timeout: float = 5) -> Optional[str]:
+        """Take the oldest job, waiting up to timeout; None if the queue stayed empty"""
+        raise NotImplementedError
+
+    def job_ids(self) -> List[str]:
+        """IDs of the queued jobs, oldest first"""
+        raise NotImplementedError
+
+    def position(self, job_id: str) -> Optional[int]:
+        """1-based position of a queued job, or None if it is not waiting"""
+        ids = self.job_ids()
+        return ids.index(job_id) + 1 if job_id in ids else None
+
+    def size(self) -> int:
+        return len(self.job_ids())
+
+    def is_full(self) -> bool:
+        """Whether a put right now would be rejected"""
+        return self.size() >= self.max_size
+
+    def get_stats(self):
+        """Queue statistics"""
+        return {
+            'backend': self.__class__.__name__,
+            'queued': self.size(),
+            'max_queue_size': self.max_size,
+            **self.stats
+        }
+
+    def _rejected(self) -> QueueFullError:
+        self.stats['rejected'] += 1
+        return QueueFullError(self.retry_after)
+
+
+class InMemoryJobQueue(JobQueue):
+    """Queue inside one process, for tests and single-process runs"""
+
+    def __init__(self, max_size: int = 50, retry_after: int = 30):
+        super().__init__(max_size, retry_after)
+        self._items: 'collections.deque[str]' = collections.deque()
+        self._condition = threading.Condition()
+
+    def put(self, job_id: str) -> int:
+        with self._condition:
+            if len(self._items) >= self.max_size:
+                raise self._rejected()
+            self._items.append(job_id)
+            self.stats['enqueued'] += 1
+            self._condition.notify()
+            return len(self._items)
+
+    def get(self, timeout: float = 5) -> Optional[str]:
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._items, timeout):
+                return None
+            self.stats['dequeued'] += 1
+            return self._items.popleft()
+
+    def job_ids(self) -> List[str]:
+        with self._condition:
+            return list(self._items)
+
+
+class SQLiteJobQueue(JobQueue):
+    """
+    Queue in a SQLite table, shared by the processes on one host.
+
+    Rows are taken inside an immediate transaction, so two workers never
+    get the same job. Waiting workers poll every poll_interval seconds.
+    """
+
+    def __init__(self, path: str, max_size: int = 50, retry_after: int = 30, poll_interval: float = 0.5):
+        super().__init__(max_size, retry_after)
+        self.path = path
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Autocommit mode; transactions are opened explicitly with BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10, isolation_level=None)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS job_queue ('
+                'seq INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT NOT NULL UNIQUE, '
+                'enqueued_at REAL NOT NULL)'
+            )
+
+    def put(self, job_id: str) -> int:
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                (queued,) = self._conn.execute('SELECT COUNT(*) FROM job_queue').fetchone()
+                if queued >= self.max_size:
+                    raise self._rejected()
+                self._conn.execute(
+                    'INSERT OR IGNORE INTO job_queue (job_id, enqueued_at) VALUES (?, ?)',
+                    (job_id, time.time())
+                )
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self.stats['enqueued'] += 1
+        return self.position(job_id) or queued + 1
+
+    def get(self, timeout: float = 5) -> Optional[str]:
+        give_up = time.monotonic() + timeout
+        while True:
+            job_id = self._take()
+            if job_id is not None:
+                self.stats['dequeued'] += 1
+                return job_id
+
+            remaining = give_up - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(self.poll_interval, remaining))
+
+    def _take(self) -> Optional[str]:
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute('SELECT seq, job_id FROM job_queue ORDER BY seq LIMIT 1').fetchone()
+                if row is not None:
+                    self._conn.execute('DELETE FROM job_queue WHERE seq = ?', (row[0],))
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return row[1] if row else None
+
+    def job_ids(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute('SELECT job_id FROM job_queue ORDER BY seq')]
+
+    def size(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM job_queue').fetchone()[0]
+
+
+class RedisJobQueue(JobQueue):
+    """Queue in a Redis list, shared by every web and worker process"""
+
+    def __init__(self, client, max_size: int = 50, retry_after: int = 30, prefix: str = 'factchecker'):
+        super().__init__(max_size, retry_after)
+        self.client = client
+        self.key = f'{prefix}:queue'
+
+    def put(self, job_id: str) -> int:
+        length = self.client.rpush(self.key, job_id)
+        if length > self.max_size:
+            # Lost the race for the last slot; take the entry back out
+            self.client.lrem(self.key, -1, job_id)
+            raise self._rejected()
+        self.stats['enqueued'] += 1
+        return length
+
+    def get(self, timeout: float = 5) -> Optional[str]:
+        item = self.client.blpop([self.key], timeout=max(1, int(timeout)))
+        if item is None:
+            return None
+        self.stats['dequeued'] += 1
+        job_id = item[1]
+        return job_id.decode('utf-8') if isinstance(job_id, bytes) else job_id
+
+    def job_ids(self) -> List[str]:
+        return [
+            job_id.decode('utf-8') if isinstance(job_id, bytes) else job_id
+            for job_id in self.client.lrange(self.key, 0, -1)
+        ]
+
+    def size(self) -> int:
+        return self.client.llen(self.key)
+
+
+def create_job_queue(config, redis_client=None) -> JobQueue:
+    """Job queue selected by JOB_QUEUE_TYPE (redis, sqlite or memory)"""
+    queue_type = getattr(config, 'JOB_QUEUE_TYPE', 'redis')
+    max_size = getattr(config, 'JOB_QUEUE_SIZE', 50)
+    retry_after = getattr(config, 'JOB_RETRY_AFTER', 30)
+
+    if queue_type == 'redis':
+        redis_url = getattr(config, 'REDIS_URL', None)
+        if redis_client is None and not redis_url:
+            logger.error("JOB_QUEUE_TYPE is redis but REDIS_URL is not set - FALLING BACK TO AN IN-MEMORY "
+                         "JOB QUEUE that only this process can read")
+            return InMemoryJobQueue(max_size, retry_after)
+        if redis_client is None:
+            import redis
+            redis_client = redis.Redis.from_url(redis_url)
+        logger.info("Using Redis job queue")
+        return RedisJobQueue(redis_client, max_size, retry_after)
+
+    if queue_type == 'sqlite':
+        path = getattr(config, 'JOB_QUEUE_DB_PATH', None)
+        if not path:
+            logger.error("JOB_QUEUE_TYPE is sqlite but JOB_QUEUE_DB_PATH is not set - FALLING BACK TO AN IN-MEMORY "
+                         "JOB QUEUE that only this process can read")
+            return InMemoryJobQueue(max_size, retry_after)
+        logger.info(f"Using SQLite job queue at {path}")
+        return SQLiteJobQueue(path, max_size, retry_after)
+
+    logger.info("Using in-memory job queue")
+    return InMemoryJobQueue(max_size, retry_after)
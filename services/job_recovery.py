@@ -0,0 +1,138 @@
+"""
+Job Recovery Module
+Heartbeats for running jobs and adoption of jobs whose worker died
+"""
+import logging
+import os
+import secrets
+import socket
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Statuses of jobs that a live worker is responsible for
+ACTIVE_STATUSES = ('queued', 'processing')
+
+
+class JobRecovery:
+    """
+    Keeps this process's jobs alive in shared storage and resumes abandoned ones.
+
+    Every interval seconds, the jobs held by the local scheduler get a fresh
+    'heartbeat_at'. Active jobs whose heartbeat is older than orphan_after
+    belonged to a worker that died; each is claimed through a storage key
+    tied to its last heartbeat, so exactly one process adopts it, and handed
+    to resume(job); the key is released once resume returns. resume
+    returns False if it couldn't take the job yet,
+    e.g. because the queue is full, and the job is offered again next sweep.
+    Jobs listed by waiting_jobs sit in a shared queue with no worker yet
+    and are never treated as orphans.
+    """
+
+    def __init__(self, storage, active_jobs: Callable[[], List[str]], resume: Callable[[Dict], bool],
+                 interval: float = 30, orphan_after: float = 120, batch_size: int = 100,
+                 waiting_jobs: Optional[Callable[[], List[str]]] = None):
+        self.storage = storage
+        self.active_jobs = active_jobs
+        self.waiting_jobs = waiting_jobs
+        self.resume = resume
+        self.interval = interval
+        self.orphan_after = orphan_after
+        self.batch_size = batch_size
+        self.owner = f'{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(4)}'
+        self.stats = {'adopted': 0}
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the heartbeat and sweep loop on a daemon thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='job-recovery', daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the loop; jobs still running here stop getting heartbeats"""
+        self._stop.set()
+
+    def beat(self) -> None:
+        """Refresh the heartbeat of every job the local scheduler holds"""
+        now = time.time()
+        for job_id in self.active_jobs():
+            self.storage.update_job(job_id, {'heartbeat_at': now})
+
+    def sweep(self) -> int:
+        """
+        Adopt orphaned jobs.
+
+        Returns:
+            Number of jobs handed to resume
+        """
+        cutoff = time.time() - self.orphan_after
+        local = set(self.active_jobs())
+        if self.waiting_jobs is not None:
+            local.update(self.waiting_jobs())
+        resumed = 0
+
+        for status in ACTIVE_STATUSES:
+            for job in self._stale_jobs(status, cutoff):
+                heartbeat = job['heartbeat_at']
+                if job['id'] in local:
+                    continue
+
+                # The key changes with every heartbeat, so a job that is adopted,
+                # beats and is orphaned again can be claimed again
+                key = f"resume:{job['id']}:{heartbeat}"
+                claim = self.storage.claim_dedup_key(key, self.owner)
+                if claim != self.owner:
+                    continue
+
+                try:
+                    # Another process may have resumed it and released the key since it was listed
+                    current = self.storage.get_job(job['id'])
+                    if not current or current.get('status') not in ACTIVE_STATUSES \
+                            or current.get('heartbeat_at') != heartbeat:
+                        continue
+
+                    logger.warning(f"Job {job['id']} has had no heartbeat for {int(time.time() - heartbeat)}s, resuming it")
+                    if self.resume(current):
+                        resumed += 1
+                except Exception as e:
+                    logger.error(f"Failed to resume job {job['id']}: {e}")
+                finally:
+                    self.storage.release_dedup_key(key, self.owner)
+
+        self.stats['adopted'] += resumed
+        return resumed
+
+    def _stale_jobs(self, status: str, cutoff: float) -> Iterator[Dict]:
+        """
+        Jobs with the given status whose heartbeat is older than cutoff.
+
+        Pages through every job with that status, batch_size at a time, so
+        orphans older than a page of healthy jobs are still found.
+        """
+        before = None
+        while True:
+            page = self.storage.list_jobs(filters={'status': status}, limit=self.batch_size, before=before)
+            for job in page:
+                heartbeat = job.get('heartbeat_at')
+                if heartbeat is not None and heartbeat < cutoff:
+                    yield job
+            if len(page) < self.batch_size:
+                return
+            before = page[-1]['id']
+
+    def get_stats(self) -> Dict:
+        """Recovery statistics for this process"""
+        return {'owner': self.owner, 'orphan_after': self.orphan_after, **self.stats}
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.beat()
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Error in job recovery loop: {e}")
@@ -0,0 +1,177 @@
+"""
+Job Scheduler Service
+Runs analysis jobs on a fixed worker pool fed by a bounded priority queue
+"""
+import bisect
+import itertools
+import logging
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue is at capacity"""
+
+    def __init__(self, retry_after: int):
+        super().__init__('Job queue is full')
+        self.retry_after = retry_after
+
+
+class SchedulerUnavailableError(Exception):
+    """Raised when the scheduler is shutting down and accepts no new jobs"""
+
+
+class JobScheduler:
+    """
+    Fixed-size worker pool with admission control.
+
+    Jobs wait in a bounded queue ordered by (priority, arrival); lower
+    priority values run first and equal priorities run FIFO. When the queue
+    is full, submit() raises QueueFullError with a Retry-After estimate
+    instead of starting another thread.
+    """
+
+    def __init__(self, num_workers: int = 4, max_queue_size: int = 50, retry_after: int = 30):
+        self.num_workers = max(1, num_workers)
+        self.max_queue_size = max(1, max_queue_size)
+        self.default_retry_after = retry_after
+
+        # Sorted list of (priority, sequence, job_id); small and bounded, so
+        # positions can be read with a linear scan
+        self._queue: List[Tuple[int, int, str]] = []
+        self._tasks: Dict[str, Tuple[Callable, tuple, dict]] = {}
+        self._running: Dict[str, float] = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._accepting = True
+
+        # Moving average of job run time, for wait estimates
+        self._avg_duration: Optional[float] = None
+        self.stats = {'submitted': 0, 'rejected': 0, 'completed': 0, 'failed': 0}
+
+        self._workers = []
+        for i in range(self.num_workers):
+            worker = threading.Thread(target=self._worker_loop, name=f'job-worker-{i}', daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+        logger.info(f"Job scheduler started: {self.num_workers} workers, queue size {self.max_queue_size}")
+
+    def submit(self, job_id: str, func: Callable, *args: Any, priority: int = 0, **kwargs: Any) -> int:
+        """
+        Queue a job for execution.
+
+        Returns:
+            1-based queue position of the job
+
+        Raises:
+            QueueFullError: the queue is at capacity
+            SchedulerUnavailableError: the scheduler is shutting down
+        """
+        with self._condition:
+            if not self._accepting:
+                raise SchedulerUnavailableError('Job scheduler is shutting down')
+
+            if len(self._queue) >= self.max_queue_size:
+                self.stats['rejected'] += 1
+                raise QueueFullError(self._retry_after_locked())
+
+            entry = (priority, next(self._sequence), job_id)
+            bisect.insort(self._queue, entry)
+            self._tasks[job_id] = (func, args, kwargs)
+            self.stats['submitted'] += 1
+            self._condition.notify()
+
+            return self._queue.index(entry) + 1
+
+    def is_full(self) -> bool:
+        """Whether a submit right now would be rejected"""
+        with self._condition:
+            return not self._accepting or len(self._queue) >= self.max_queue_size
+
+    def available_slots(self) -> int:
+        """Workers that would be idle if nothing more were queued"""
+        with self._condition:
+            return max(0, self.num_workers - len(self._running) - len(self._queue))
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        """1-based position of a queued job, or None if it is not waiting"""
+        with self._condition:
+            for position, (_, _, queued_id) in enumerate(self._queue, 1):
+                if queued_id == job_id:
+                    return position
+        return None
+
+    def job_ids(self) -> List[str]:
+        """IDs of the jobs this scheduler holds, running first and then in queue order"""
+        with self._condition:
+            return list(self._running) + [job_id for _, _, job_id in self._queue]
+
+    def retry_after(self) -> int:
+        """Seconds a rejected client should wait before retrying"""
+        with self._condition:
+            return self._retry_after_locked()
+
+    def _retry_after_locked(self) -> int:
+        if not self._avg_duration:
+            return self.default_retry_after
+
+        # Time for the workers to drain one queue slot
+        estimate = self._avg_duration / self.num_workers
+        return max(1, int(math.ceil(estimate)))
+
+    def get_stats(self) -> Dict:
+        """Get scheduler statistics"""
+        with self._condition:
+            return {
+                'workers': self.num_workers,
+                'running': len(self._running),
+                'queued': len(self._queue),
+                'max_queue_size': self.max_queue_size,
+                'avg_job_seconds': round(self._avg_duration, 1) if self._avg_duration else None,
+                **self.stats
+            }
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """Stop accepting jobs; queued jobs still run before the workers exit"""
+        with self._condition:
+            self._accepting = False
+            self._condition.notify_all()
+
+        if wait:
+            for worker in self._workers:
+                worker.join(timeout)
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and self._accepting:
+                    self._condition.wait()
+
+                if not self._queue:
+                    return
+
+                _, _, job_id = self._queue.pop(0)
+                func, args, kwargs = self._tasks.pop(job_id)
+                started = time.monotonic()
+                self._running[job_id] = started
+
+            succeeded = True
+            try:
+                func(*args, **kwargs)
+            except Exception as e:
+                succeeded = False
+                logger.error(f"Job {job_id} raised: {e}")
+
+            duration = time.monotonic() - started
+            with self._condition:
+                self._running.pop(job_id, None)
+                self.stats['completed' if succeeded else 'failed'] += 1
+                if self._avg_duration is None:
+                    self._avg_duration = duration
+                else:
+                    self._avg_duration = 0.8 * self._avg_duration + 0.2 * duration
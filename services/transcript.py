@@ -8,15 +8,16 @@ import os
 from typing import List, Dict, Optional
 import PyPDF2
 import docx
-from youtube_transcript_api import YouTubeTranscriptApi
+
+from .caption_store import CaptionStore, fetch_youtube_captions
 
 logger = logging.getLogger(__name__)
 
 class TranscriptProcessor:
     """Process and clean transcripts from various sources"""
     
-    def __init__(self):
-        pass
+    def __init__(self, caption_store: Optional[CaptionStore] = None):
+        self.caption_store = caption_store
     
     def process(self, input_text: str) -> str:
         """Process input text and return clean transcript"""
@@ -58,15 +59,14 @@ class TranscriptProcessor:
             if not video_id:
                 raise ValueError("Invalid YouTube URL")
             
-            # Get transcript
-            transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
+            # Get transcript, shared with the YouTube service's caption store
+            if self.caption_store is not None:
+                segments = self.caption_store.get_captions(video_id)['segments']
+            else:
+                segments = fetch_youtube_captions(video_id)['segments']
             
             # Combine transcript entries
-            text_parts = []
-            for entry in transcript_list:
-                text_parts.append(entry['text'])
-            
-            full_text = ' '.join(text_parts)
+            full_text = ' '.join(entry['text'] for entry in segments)
             return self.clean_transcript(full_text)
             
         except Exception as e:
@@ -7,17 +7,19 @@ import tempfile
 import logging
 from typing import Dict, Optional
 import yt_dlp
-import speech_recognition as sr
 from pydub import AudioSegment
 
+from .audio_transcription import create_transcriber
+
 logger = logging.getLogger(__name__)
 
 class YouTubeAudioTranscriber:
     """Transcribe audio from YouTube videos"""
     
-    def __init__(self):
+    def __init__(self, config=None, recognizer=None):
         """Initialize speech recognizer"""
-        self.recognizer = sr.Recognizer()
+        self.transcriber = create_transcriber(config, recognizer)
+        self.max_audio_minutes = getattr(config, 'AUDIO_TRANSCRIPTION_MAX_MINUTES', 30)
         logger.info("Initialized YouTube audio transcriber")
     
     def transcribe_youtube_video(self, url: str) -> Dict:
@@ -44,12 +46,12 @@ class YouTubeAudioTranscriber:
                     'error': 'Failed to download audio from video'
                 }
             
-            # Check video duration (limit to 30 minutes for free tier)
+            # Check video duration (limit to 30 minutes by default for free tier)
             duration = video_info.get('duration', 0)
-            if duration > 1800:  # 30 minutes
+            if duration > self.max_audio_minutes * 60:
                 return {
                     'success': False,
-                    'error': 'Video is too long. Maximum 30 minutes for audio transcription.'
+                    'error': f'Video is too long. Maximum {self.max_audio_minutes} minutes for audio transcription.'
                 }
             
             # Step 2: Transcribe the audio
@@ -136,60 +138,11 @@ class YouTubeAudioTranscriber:
             return None, {}
     
     def _transcribe_audio(self, audio_file: str) -> Optional[str]:
-        """Transcribe audio file using Google Speech Recognition"""
+        """Transcribe audio file using Google Speech Recognition, chunks in parallel"""
         try:
-            # Load audio
             audio = AudioSegment.from_wav(audio_file)
-            
-            # Convert to proper format (16kHz, mono)
-            audio = audio.set_frame_rate(16000).set_channels(1)
-            
-            # Split into 1-minute chunks (Google's free tier limit)
-            chunk_length_ms = 60000  # 1 minute
-            chunks = [audio[i:i+chunk_length_ms] for i in range(0, len(audio), chunk_length_ms)]
-            
-            logger.info(f"Split audio into {len(chunks)} chunks")
-            
-            full_transcript = []
-            
-            for i, chunk in enumerate(chunks):
-                logger.info(f"Transcribing chunk {i+1}/{len(chunks)}")
-                
-                # Export chunk to temporary file
-                chunk_file = f"{audio_file}_chunk_{i}.wav"
-                chunk.export(chunk_file, format="wav")
-                
-                try:
-                    # Transcribe chunk
-                    with sr.AudioFile(chunk_file) as source:
-                        audio_data = self.recognizer.record(source)
-                        
-                        # Try Google Speech Recognition (free)
-                        try:
-                            text = self.recognizer.recognize_google(audio_data)
-                            full_transcript.append(text)
-                            logger.info(f"Chunk {i+1} transcribed successfully")
-                        except sr.UnknownValueError:
-                            logger.warning(f"Chunk {i+1}: Speech not recognized")
-                        except sr.RequestError as e:
-                            logger.error(f"Chunk {i+1}: Google Speech API error: {e}")
-                            
-                except Exception as e:
-                    logger.error(f"Error transcribing chunk {i+1}: {str(e)}")
-                finally:
-                    # Clean up chunk file
-                    if os.path.exists(chunk_file):
-                        os.remove(chunk_file)
-            
-            # Join all chunks
-            final_transcript = ' '.join(full_transcript)
-            
-            if not final_transcript.strip():
-                return None
-                
-            return final_transcript.strip()
+            return self.transcriber.transcribe_segment(audio)
             
         except Exception as e:
             logger.error(f"Transcription error: {str(e)}")
             return None
-          
@@ -10,11 +10,14 @@ from typing import Dict, Optional, List
 from datetime import datetime
 
 # Only import what we actually have
-from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
 import yt_dlp
-import speech_recognition as sr
 from pydub import AudioSegment
 
+from .audio_stream import AudioStreamError, find_ffmpeg, select_audio_format, stream_pcm
+from .audio_transcription import create_transcriber
+from .cache import TTLCache
+from .caption_store import CaptionsUnavailable, create_caption_store
+
 logger = logging.getLogger(__name__)
 
 class YouTubeService:
@@ -23,8 +26,27 @@ class YouTubeService:
     NO LIVE STREAMING - Only completed videos.
     """
     
-    def __init__(self):
-        self.recognizer = sr.Recognizer()
+    def __init__(self, config=None, recognizer=None, caption_store=None):
+        self.transcriber = create_transcriber(config, recognizer)
+        self.max_audio_minutes = getattr(config, 'AUDIO_TRANSCRIPTION_MAX_MINUTES', 30)
+        
+        # Audio is decoded straight from the stream when ffmpeg is available,
+        # otherwise downloaded to a WAV file first
+        self.ffmpeg = None
+        if getattr(config, 'AUDIO_STREAMING', True):
+            self.ffmpeg = find_ffmpeg(getattr(config, 'FFMPEG_BINARY', 'ffmpeg'))
+            if not self.ffmpeg:
+                logger.warning("ffmpeg not found; audio will be downloaded before transcription")
+        
+        self.caption_store = caption_store or create_caption_store(config)
+        
+        # Video metadata keyed by video ID, so repeated submissions of the
+        # same video don't go back to YouTube
+        self.info_cache = TTLCache(
+            max_entries=getattr(config, 'YOUTUBE_INFO_CACHE_MAX_ENTRIES', 1000),
+            ttl=getattr(config, 'YOUTUBE_INFO_CACHE_TTL', 3600)
+        )
+        self.live_info_ttl = getattr(config, 'YOUTUBE_LIVE_INFO_CACHE_TTL', 60)
         logger.info("YouTube Service initialized - Video transcripts only (no live streaming)")
     
     def process_youtube_url(self, url: str) -> Dict:
@@ -45,8 +67,12 @@ class YouTubeService:
                     'suggestion': 'Please provide a standard YouTube video URL'
                 }
             
+            # One metadata probe serves the live check, the duration check and
+            # the audio download; raw_info is None when metadata came from cache
+            video_info, raw_info = self._get_video_info(url, video_id)
+            
             # Check if this is a live stream (and reject if so)
-            if self._is_live_stream(url):
+            if self._is_live_stream(video_info):
                 return {
                     'success': False,
                     'error': 'Live streams cannot be processed in real-time',
@@ -61,7 +87,6 @@ class YouTubeService:
                 return caption_result
             
             # Method 2: Check if we should attempt audio transcription
-            video_info = self._get_video_info(url)
             if not video_info:
                 return {
                     'success': False,
@@ -72,17 +97,17 @@ class YouTubeService:
             duration = video_info.get('duration', 0)
             
             # Check duration limits
-            if duration > 1800:  # 30 minutes
+            if duration > self.max_audio_minutes * 60:
                 return {
                     'success': False,
-                    'error': f'Video is {duration//60} minutes long. Maximum 30 minutes for audio transcription.',
+                    'error': f'Video is {duration//60} minutes long. Maximum {self.max_audio_minutes} minutes for audio transcription.',
                     'suggestion': 'For longer videos, try videos with captions enabled',
                     'caption_status': caption_result.get('error', 'No captions available')
                 }
             
             # Method 3: Download and transcribe audio (last resort)
             logger.info(f"Attempting audio transcription for {video_id}")
-            audio_result = self._transcribe_audio_method(url, video_info)
+            audio_result = self._transcribe_audio_method(url, video_info, raw_info)
             
             if audio_result['success']:
                 return audio_result
@@ -106,6 +131,10 @@ class YouTubeService:
                 'suggestion': 'Please check the URL and try again'
             }
     
+    def get_video_id(self, url: str) -> Optional[str]:
+        """Video ID of a YouTube URL, or None if it isn't one"""
+        return self._extract_video_id(url)
+    
     def _extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from various YouTube URL formats"""
         patterns = [
@@ -122,31 +151,27 @@ class YouTubeService:
                 return match.group(1)
         return None
     
-    def _is_live_stream(self, url: str) -> bool:
-        """Check if URL is a live stream"""
-        try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': True  # Don't download, just get info
-            }
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                is_live = info.get('is_live', False)
-                
-                # Also check if it's a premiere (scheduled stream)
-                if info.get('live_status') == 'is_upcoming':
-                    return True
-                    
-                return is_live
-                
-        except Exception as e:
-            logger.warning(f"Could not determine if video is live: {e}")
+    def _is_live_stream(self, video_info: Optional[Dict]) -> bool:
+        """Check if probed video metadata is a live stream or an upcoming premiere"""
+        if not video_info:
+            # Unknown; the caption and audio stages report their own errors
             return False
+        return bool(video_info.get('is_live')) or video_info.get('live_status') == 'is_upcoming'
     
-    def _get_video_info(self, url: str) -> Optional[Dict]:
-        """Get video metadata"""
+    def _get_video_info(self, url: str, video_id: str) -> tuple[Optional[Dict], Optional[Dict]]:
+        """
+        Get video metadata, probing YouTube at most once.
+        
+        Returns:
+            (metadata, raw yt-dlp info) - raw info is None on a cache hit or
+            failed probe, metadata is None if the probe failed
+        """
+        cache_key = f'info:{video_id}'
+        cached = self.info_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached metadata for video {video_id}")
+            return cached, None
+        
         try:
             ydl_opts = {
                 'quiet': True,
@@ -156,89 +181,129 @@ class YouTubeService:
             
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
-                return {
-                    'title': info.get('title', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'view_count': info.get('view_count', 0),
-                    'like_count': info.get('like_count', 0),
-                    'upload_date': info.get('upload_date', ''),
-                    'description': info.get('description', '')[:500],  # First 500 chars
-                    'is_live': info.get('is_live', False),
-                    'was_live': info.get('was_live', False),
-                    'video_id': info.get('id', '')
-                }
         except Exception as e:
             logger.error(f"Error getting video info: {e}")
-            return None
+            return None, None
+        
+        video_info = {
+            'title': info.get('title', 'Unknown'),
+            'duration': info.get('duration') or 0,
+            'uploader': info.get('uploader', 'Unknown'),
+            'view_count': info.get('view_count', 0),
+            'like_count': info.get('like_count', 0),
+            'upload_date': info.get('upload_date', ''),
+            'description': (info.get('description') or '')[:500],  # First 500 chars
+            'is_live': info.get('is_live', False),
+            'was_live': info.get('was_live', False),
+            'live_status': info.get('live_status'),
+            'video_id': info.get('id', '')
+        }
+        # Live and upcoming streams change state, so they aren't trusted for long
+        ttl = self.live_info_ttl if self._is_live_stream(video_info) else None
+        self.info_cache.set(cache_key, video_info, ttl=ttl)
+        return video_info, info
     
     def _get_existing_captions(self, video_id: str) -> Dict:
-        """Try to get existing captions from YouTube"""
+        """Try to get existing captions, from the caption store when they are fresh"""
         try:
-            # Try to get transcript list
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-            
-            # Prefer manually created captions over auto-generated
-            try:
-                # Try to find manual captions in English
-                transcript = transcript_list.find_manually_created_transcript(['en'])
-                caption_type = 'manual'
-            except:
-                try:
-                    # Fall back to auto-generated
-                    transcript = transcript_list.find_generated_transcript(['en'])
-                    caption_type = 'auto-generated'
-                except:
-                    # Try any available language
-                    for transcript in transcript_list:
-                        caption_type = 'auto-translated' if transcript.is_translatable else 'other-language'
-                        break
-                    else:
-                        raise NoTranscriptFound("No transcripts found in any language")
-            
-            # Fetch the actual transcript
-            transcript_data = transcript.fetch()
-            
-            # Combine all text
-            full_text = ' '.join([entry['text'] for entry in transcript_data])
-            
-            # Clean up the text
-            full_text = self._clean_transcript_text(full_text)
-            
-            return {
-                'success': True,
-                'transcript': full_text,
-                'source_type': 'youtube_captions',
-                'caption_type': caption_type,
-                'language': transcript.language if 'transcript' in locals() else 'unknown',
-                'duration': transcript_data[-1]['start'] + transcript_data[-1]['duration'] if transcript_data else 0
-            }
-            
-        except TranscriptsDisabled:
+            captions = self.caption_store.get_captions(video_id)
+        except CaptionsUnavailable as e:
             return {
                 'success': False,
-                'error': 'Captions are disabled for this video'
+                'error': str(e)
             }
-        except NoTranscriptFound:
+        except Exception as e:
             return {
                 'success': False,
-                'error': 'No captions found for this video'
+                'error': f'Caption extraction failed: {str(e)}'
             }
-        except Exception as e:
+        
+        segments = [
+            {'start': entry['start'], 'end': entry['start'] + entry['duration'], 'text': entry['text']}
+            for entry in captions['segments']
+        ]
+        
+        # Combine all text and clean it up
+        full_text = ' '.join(segment['text'] for segment in segments)
+        full_text = self._clean_transcript_text(full_text)
+        
+        return {
+            'success': True,
+            'transcript': full_text,
+            'segments': segments,
+            'source_type': 'youtube_captions',
+            'caption_type': captions['caption_type'],
+            'language': captions['language'],
+            'duration': segments[-1]['end']
+        }
+    
+    def _transcribe_audio_method(self, url: str, video_info: Dict, raw_info: Optional[Dict] = None) -> Dict:
+        """Transcribe audio from video, streaming it when possible, reusing the metadata probe's info if given"""
+        if self.ffmpeg:
+            try:
+                logger.info("Streaming and transcribing audio (this may take a few minutes)...")
+                transcription = self._stream_audio_transcription(url, raw_info)
+                return self._audio_result(transcription, video_info)
+            except AudioStreamError as e:
+                logger.warning(f"Audio streaming failed, downloading the audio instead: {e}")
+        
+        return self._transcribe_downloaded_audio(url, video_info, raw_info)
+    
+    def _stream_audio_transcription(self, url: str, raw_info: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Transcribe audio decoded straight from the video's audio stream.
+        
+        Segments go to the recognizers while the rest is still downloading,
+        and nothing is written to disk.
+        
+        Raises:
+            AudioStreamError: no streamable format, or ffmpeg failed
+        """
+        info = raw_info
+        if info is None:
+            try:
+                with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True}) as ydl:
+                    info = ydl.extract_info(url, download=False)
+            except Exception as e:
+                raise AudioStreamError(f'Could not get stream formats: {e}') from e
+        
+        audio_format = select_audio_format(info)
+        if audio_format is None:
+            raise AudioStreamError('No streamable audio format')
+        
+        blocks = stream_pcm(audio_format['url'], audio_format.get('http_headers'), self.ffmpeg)
+        try:
+            return self._clean_segments(self.transcriber.transcribe_stream(blocks))
+        finally:
+            blocks.close()
+    
+    def _audio_result(self, transcription: Optional[Dict], video_info: Dict) -> Dict:
+        """Result of an audio transcription"""
+        if not transcription:
             return {
                 'success': False,
-                'error': f'Caption extraction failed: {str(e)}'
+                'error': 'Audio transcription failed - speech may be unclear or in another language'
             }
+        
+        return {
+            'success': True,
+            'transcript': transcription['transcript'],
+            'segments': transcription['segments'],
+            'source_type': 'audio_transcription',
+            'title': video_info.get('title', 'Unknown'),
+            'duration': video_info.get('duration', 0),
+            'warning': 'Transcription from audio may be less accurate than captions'
+        }
     
-    def _transcribe_audio_method(self, url: str, video_info: Dict) -> Dict:
-        """Download and transcribe audio from video"""
+    def _transcribe_downloaded_audio(self, url: str, video_info: Dict, raw_info: Optional[Dict] = None) -> Dict:
+        """Download audio to a WAV file and transcribe it"""
         temp_dir = tempfile.mkdtemp()
         audio_file = None
         
         try:
             # Download audio
             logger.info("Downloading audio from YouTube...")
-            audio_file = self._download_audio(url, temp_dir)
+            audio_file = self._download_audio(url, temp_dir, raw_info)
             
             if not audio_file:
                 return {
@@ -248,22 +313,8 @@ class YouTubeService:
             
             # Transcribe audio
             logger.info("Transcribing audio (this may take a few minutes)...")
-            transcript = self._transcribe_audio_file(audio_file)
-            
-            if not transcript:
-                return {
-                    'success': False,
-                    'error': 'Audio transcription failed - speech may be unclear or in another language'
-                }
-            
-            return {
-                'success': True,
-                'transcript': transcript,
-                'source_type': 'audio_transcription',
-                'title': video_info.get('title', 'Unknown'),
-                'duration': video_info.get('duration', 0),
-                'warning': 'Transcription from audio may be less accurate than captions'
-            }
+            transcription = self._transcribe_audio_file(audio_file)
+            return self._audio_result(transcription, video_info)
             
         except Exception as e:
             logger.error(f"Audio transcription error: {e}")
@@ -284,8 +335,8 @@ class YouTubeService:
                 except:
                     pass
     
-    def _download_audio(self, url: str, output_dir: str) -> Optional[str]:
-        """Download audio from YouTube video"""
+    def _download_audio(self, url: str, output_dir: str, raw_info: Optional[Dict] = None) -> Optional[str]:
+        """Download audio from YouTube video, without re-extracting when raw_info is given"""
         try:
             output_path = os.path.join(output_dir, 'audio.%(ext)s')
             
@@ -306,7 +357,11 @@ class YouTubeService:
             }
             
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+                if raw_info is not None:
+                    # Select the audio format from the already probed info
+                    ydl.process_ie_result(dict(raw_info), download=True)
+                else:
+                    ydl.download([url])
                 
                 # Find the downloaded file
                 audio_file = os.path.join(output_dir, 'audio.wav')
@@ -330,64 +385,35 @@ class YouTubeService:
             logger.error(f"Audio download error: {e}")
             return None
     
-    def _transcribe_audio_file(self, audio_file: str) -> Optional[str]:
-        """Transcribe audio file using speech recognition"""
+    def _transcribe_audio_file(self, audio_file: str) -> Optional[Dict]:
+        """
+        Transcribe audio file using speech recognition, segments in parallel.
+        
+        Returns:
+            Dict with the transcript and its timed 'segments', or None if no speech was recognized
+        """
         try:
-            # Load and prepare audio
             audio = AudioSegment.from_wav(audio_file)
-            
-            # Convert to proper format (16kHz, mono)
-            audio = audio.set_frame_rate(16000).set_channels(1)
-            
-            # Split into chunks (1 minute each for Google's free tier)
-            chunk_length_ms = 60000
-            chunks = [audio[i:i+chunk_length_ms] for i in range(0, len(audio), chunk_length_ms)]
-            
-            logger.info(f"Processing {len(chunks)} audio chunks...")
-            
-            full_transcript = []
-            
-            for i, chunk in enumerate(chunks):
-                logger.info(f"Transcribing chunk {i+1}/{len(chunks)}...")
-                
-                # Export chunk
-                chunk_file = f"{audio_file}_chunk_{i}.wav"
-                chunk.export(chunk_file, format="wav")
-                
-                try:
-                    with sr.AudioFile(chunk_file) as source:
-                        audio_data = self.recognizer.record(source)
-                        
-                        try:
-                            # Use Google's free speech recognition
-                            text = self.recognizer.recognize_google(audio_data)
-                            full_transcript.append(text)
-                            logger.info(f"Chunk {i+1} transcribed successfully")
-                        except sr.UnknownValueError:
-                            logger.warning(f"Chunk {i+1}: No speech detected")
-                        except sr.RequestError as e:
-                            logger.error(f"Chunk {i+1}: API error: {e}")
-                            # Don't fail entirely, continue with other chunks
-                            
-                except Exception as e:
-                    logger.error(f"Error processing chunk {i+1}: {e}")
-                finally:
-                    # Clean up chunk file
-                    if os.path.exists(chunk_file):
-                        os.remove(chunk_file)
-            
-            # Join all chunks
-            final_transcript = ' '.join(full_transcript)
-            
-            if not final_transcript.strip():
-                return None
-                
-            return self._clean_transcript_text(final_transcript)
+            return self._clean_segments(self.transcriber.transcribe_segment_timed(audio))
             
         except Exception as e:
             logger.error(f"Transcription error: {e}")
             return None
     
+    def _clean_segments(self, segments: List[Dict]) -> Optional[Dict]:
+        """Cleaned timed segments and their joined transcript, or None if no text is left"""
+        cleaned = []
+        for segment in segments:
+            text = self._clean_transcript_text(segment['text'])
+            if text:
+                cleaned.append({**segment, 'text': text})
+        if not cleaned:
+            return None
+        return {
+            'transcript': ' '.join(segment['text'] for segment in cleaned),
+            'segments': cleaned
+        }
+    
     def _clean_transcript_text(self, text: str) -> str:
         """Clean up transcript text"""
         # Remove music/sound notations
@@ -403,18 +429,25 @@ class YouTubeService:
         
         return text
     
+    def get_cache_stats(self) -> Dict:
+        """Metadata cache and caption store statistics"""
+        return {
+            'video_info': self.info_cache.get_stats(),
+            'captions': self.caption_store.get_stats()
+        }
+    
     def get_capabilities(self) -> Dict:
         """Return current capabilities of the YouTube service"""
         return {
             'supported': {
                 'youtube_videos_with_captions': True,
-                'youtube_videos_without_captions': 'Limited to 30 minutes',
+                'youtube_videos_without_captions': f'Limited to {self.max_audio_minutes} minutes',
                 'youtube_shorts': True,
                 'youtube_live_streams': False,
                 'real_time_streaming': False
             },
             'limitations': {
-                'audio_transcription_limit': '30 minutes',
+                'audio_transcription_limit': f'{self.max_audio_minutes} minutes',
                 'live_stream_support': 'Not available - use recorded version after stream ends',
                 'accuracy': 'Captions > Audio transcription',
                 'api_rate_limits': 'Google Speech API has hourly limits'
@@ -422,6 +455,6 @@ class YouTubeService:
             'recommendations': {
                 'best_results': 'Use videos with manual captions',
                 'for_live_content': 'Use microphone feature to capture audio from speakers',
-                'for_long_videos': 'Only videos with captions can exceed 30 minutes'
+                'for_long_videos': f'Only videos with captions can exceed {self.max_audio_minutes} minutes'
             }
         }
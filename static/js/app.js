@@ -115,6 +115,7 @@ const VERDICT_MAPPINGS = {
 // Global variables
 let currentJobId = null;
 let pollInterval = null;
+let eventSource = null;
 let currentFile = null;
 
 // Initialize when DOM is loaded
@@ -314,8 +315,8 @@ async function startAnalysis() {
         const data = await response.json();
         currentJobId = data.job_id;
         
-        // Start polling for results
-        pollForResults();
+        // Follow progress over the event stream (falls back to polling)
+        watchJob();
         
     } catch (error) {
         hideProgress();
@@ -333,6 +334,93 @@ function readFileContent(file) {
     });
 }
 
+// Follow job progress over server-sent events, falling back to polling
+function watchJob() {
+    if (!window.EventSource) {
+        pollForResults();
+        return;
+    }
+    
+    const jobId = currentJobId;
+    clearLiveVerdicts();
+    eventSource = new EventSource(`/api/stream/${jobId}`);
+    
+    eventSource.addEventListener('progress', (e) => {
+        const data = JSON.parse(e.data);
+        updateProgress(data.progress || 0, data.message || 'Processing...');
+    });
+    
+    eventSource.addEventListener('claim', (e) => {
+        const data = JSON.parse(e.data);
+        addLiveVerdict(data.index, data.result);
+    });
+    
+    eventSource.addEventListener('complete', async () => {
+        closeEventSource();
+        try {
+            const resultsResponse = await fetch(`/api/results/${jobId}`);
+            if (!resultsResponse.ok) {
+                throw new Error('Failed to get results');
+            }
+            displayResults(await resultsResponse.json());
+            hideProgress();
+        } catch (error) {
+            hideProgress();
+            showError('Error loading results: ' + error.message);
+        }
+    });
+    
+    eventSource.addEventListener('failed', (e) => {
+        const data = JSON.parse(e.data);
+        closeEventSource();
+        hideProgress();
+        showError('Analysis failed: ' + (data.error || 'Unknown error'));
+    });
+    
+    eventSource.onerror = () => {
+        // The browser reconnects on its own while the stream is healthy;
+        // if it gives up, keep following the job by polling instead
+        if (eventSource && eventSource.readyState === EventSource.CLOSED) {
+            closeEventSource();
+            if (currentJobId === jobId) {
+                pollForResults();
+            }
+        }
+    };
+}
+
+function closeEventSource() {
+    if (eventSource) {
+        eventSource.close();
+        eventSource = null;
+    }
+}
+
+// Verdicts shown while the rest of the claims are still being checked
+function clearLiveVerdicts() {
+    const container = document.getElementById('live-verdicts');
+    if (container) {
+        container.innerHTML = '';
+    }
+}
+
+function addLiveVerdict(index, check) {
+    const container = document.getElementById('live-verdicts');
+    if (!container || !check || container.querySelector(`[data-index="${index}"]`)) return;
+    
+    const verdictInfo = VERDICT_MAPPINGS[check.verdict] || VERDICT_MAPPINGS['unverifiable'];
+    const item = document.createElement('div');
+    item.className = `live-verdict verdict-${verdictInfo.class}`;
+    item.dataset.index = index;
+    item.innerHTML = `
+        <span class="live-verdict-label" style="color: ${verdictInfo.color};">
+            <i class="fas ${verdictInfo.icon}"></i> ${verdictInfo.label}
+        </span>
+        <span class="live-verdict-claim">${escapeHtml(check.claim || check.text || '')}</span>
+    `;
+    container.appendChild(item);
+}
+
 // Poll for job results
 function pollForResults() {
     let attempts = 0;
@@ -689,11 +777,13 @@ function newAnalysis() {
     // Clear file
     removeFile();
     
-    // Clear any polling
+    // Clear any polling or open event stream
     if (pollInterval) {
         clearInterval(pollInterval);
         pollInterval = null;
     }
+    closeEventSource();
+    clearLiveVerdicts();
     
     // Scroll to top
     window.scrollTo(0, 0);
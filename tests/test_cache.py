@@ -0,0 +1,19 @@
+"""
+Tests for the caching service
+"""
+from services.cache import verdict_fingerprint
+
+
+def test_verdict_keys_differ_when_only_a_number_differs():
+    pairs = [
+        ('Unemployment is 4.5%', 'Unemployment is 45%'),
+        ('Growth was -3% last year', 'Growth was 3% last year'),
+        ('The bill cost $1.2 billion', 'The bill cost 12 billion'),
+        ('Inflation hit 9.1 percent', 'Inflation hit 91 percent'),
+    ]
+    for first, second in pairs:
+        assert verdict_fingerprint(first) != verdict_fingerprint(second), (first, second)
+
+
+def test_verdict_keys_fold_case_and_whitespace():
+    assert verdict_fingerprint('Unemployment is 4.5%') == verdict_fingerprint('  unemployment   IS 4.5%\n')
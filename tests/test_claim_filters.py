@@ -0,0 +1,151 @@
+"""
+Tests for the compiled claim filters
+Checks them against the original per-pattern loops on a fixed corpus; run
+`python -m tests.test_claim_filters` to also print timings of both paths
+"""
+import random
+import re
+import time
+from typing import List
+
+from services.claims import ClaimExtractor
+
+
+class _Config:
+    """No API keys, so the extractor only uses its pattern filters"""
+
+
+def legacy_is_valid_claim(extractor: ClaimExtractor, sentence: str) -> bool:
+    """_is_valid_claim as it was before the filters were compiled"""
+    if not sentence:
+        return False
+
+    sentence_clean = sentence.strip().lower()
+    if len(sentence.split()) < 4:
+        return False
+    if sentence.strip().endswith('?'):
+        return False
+    if sentence_clean in extractor.non_claim_phrases:
+        return False
+    for phrase in extractor.non_claim_phrases:
+        if sentence_clean.startswith(phrase + ' ') or sentence_clean == phrase:
+            return False
+    for pattern in extractor.conversational_patterns:
+        if re.match(pattern, sentence_clean):
+            return False
+    return True
+
+
+def legacy_is_verifiable_factual_claim(extractor: ClaimExtractor, sentence: str) -> bool:
+    """_is_verifiable_factual_claim as it was before the filters were compiled"""
+    if not sentence or len(sentence.strip()) < 10:
+        return False
+
+    sentence_clean = sentence.strip().lower()
+    if not legacy_is_valid_claim(extractor, sentence):
+        return False
+
+    for indicator in extractor.opinion_indicators:
+        if indicator in sentence_clean:
+            return False
+    for pattern in extractor.opinion_patterns:
+        if re.search(pattern, sentence_clean):
+            return False
+
+    if re.search(r'\b(has\s+shown|have\s+shown).*\b(how\s+to)\b', sentence_clean):
+        if re.search(r'\b(good|bad|great|terrible|perfect|awful|excellent|poor)\b', sentence_clean):
+            return False
+
+    for pattern in extractor.characterization_patterns:
+        if re.search(pattern, sentence_clean):
+            return False
+
+    has_factual_indicator = any(re.search(pattern, sentence_clean) for pattern in extractor.factual_indicators)
+    if not has_factual_indicator:
+        capitalized_words = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', sentence)
+        action_verbs = re.search(r'\b(said|announced|declared|signed|voted|passed|failed|won|lost|created|built|destroyed|implemented|launched|introduced|proposed)\b', sentence_clean)
+        if len(capitalized_words) >= 2 and action_verbs:
+            has_factual_indicator = True
+    if not has_factual_indicator:
+        return False
+
+    if len(sentence_clean.split()) < 6:
+        return False
+
+    if not any(verb in sentence_clean for verb in extractor.claim_verbs):
+        return False
+
+    if re.search(r'^[^.]*\b(is|are|was|were)\s+(just|simply|merely|only)\s+', sentence_clean):
+        return False
+
+    return True
+
+
+def build_corpus(extractor: ClaimExtractor, size: int = 20000, seed: int = 7) -> List[str]:
+    """Deterministic mix of claims, opinions, filler and edge cases built from the filter phrases"""
+    rng = random.Random(seed)
+    subjects = ['The Senate', 'Congress', 'Senator Smith', 'The Department of Labor', 'It', 'This', 'They',
+                'Harvard University', 'The unemployment rate', 'Our company', 'the governor', 'He']
+    verbs = ['passed', 'voted', 'rose by', 'fell', 'is', 'was', 'signed', 'has shown', 'cut', 'announced',
+             'spent', 'cannot manage', 'is completely', 'is just', 'will definitely be']
+    objects = ['the bill', '12 percent', '$40 billion', 'in 2019', 'since 2008', 'March 3', 'H.R. 1234',
+               'how to lead', 'a disaster', 'wrong', 'a great job', '3,000 jobs', 'the treaty', 'Section 8',
+               'the Supreme Court ruling', 'good', '218 votes', 'the economy']
+    tails = ['', '.', ' last year.', ' according to the report.', '?', ' and it was terrible.', ', you know.']
+    phrases = sorted(extractor.non_claim_phrases) + sorted(extractor.opinion_indicators)
+    filler = ['well', 'so,', 'um', 'you know', 'basically.', 'anyway', 'oh']
+
+    corpus = []
+    for _ in range(size):
+        kind = rng.random()
+        sentence = f"{rng.choice(subjects)} {rng.choice(verbs)} {rng.choice(objects)}{rng.choice(tails)}"
+        if kind < 0.15:
+            sentence = f"{rng.choice(phrases)} {sentence[0].lower()}{sentence[1:]}"
+        elif kind < 0.25:
+            sentence = f"{sentence} {rng.choice(phrases)}"
+        elif kind < 0.3:
+            sentence = rng.choice(phrases + filler)
+        elif kind < 0.35:
+            sentence = sentence.upper() if rng.random() < 0.5 else sentence.lower()
+        corpus.append(sentence)
+    return corpus
+
+
+def test_compiled_filters_match_legacy_loops():
+    extractor = ClaimExtractor(_Config())
+    corpus = build_corpus(extractor)
+
+    for sentence in corpus:
+        assert extractor._is_valid_claim(sentence) == legacy_is_valid_claim(extractor, sentence), sentence
+        assert extractor._is_verifiable_factual_claim(sentence) == \
+            legacy_is_verifiable_factual_claim(extractor, sentence), sentence
+
+    # The corpus has to exercise both outcomes to mean anything
+    accepted = sum(extractor._is_verifiable_factual_claim(sentence) for sentence in corpus)
+    assert 0 < accepted < len(corpus)
+
+
+def benchmark(repeat: int = 3) -> None:
+    """Print the best-of-repeat time of each filter path over the corpus"""
+    extractor = ClaimExtractor(_Config())
+    corpus = build_corpus(extractor)
+
+    def best(check):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for sentence in corpus:
+                check(sentence)
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+    legacy = best(lambda sentence: legacy_is_verifiable_factual_claim(extractor, sentence))
+    compiled = best(extractor._is_verifiable_factual_claim)
+    print(f"{len(corpus)} sentences: per-pattern loops {legacy * 1000:.0f} ms, "
+          f"compiled filters {compiled * 1000:.0f} ms ({legacy / compiled:.1f}x)")
+
+
+if __name__ == '__main__':
+    test_compiled_filters_match_legacy_loops()
+    print("Compiled filters match the per-pattern loops")
+    benchmark()
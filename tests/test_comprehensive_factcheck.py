@@ -0,0 +1,44 @@
+"""
+Tests for the comprehensive fact checker's API synthesis
+"""
+from services.comprehensive_factcheck import ComprehensiveFactChecker
+
+
+class _Config:
+    """No API keys, so nothing leaves the process"""
+
+
+NEWS_RESULT = {
+    'found': True,
+    'source': 'NewsAPI',
+    'verdict': 'needs_context',
+    'explanation': 'Found 5 related news articles',
+    'confidence': 50
+}
+
+
+def test_news_only_evidence_does_not_become_a_verdict():
+    checker = ComprehensiveFactChecker(_Config())
+    try:
+        result = checker._synthesize_api_results([NEWS_RESULT, dict(NEWS_RESULT, source='MediaStack')])
+        assert result['verdict'] == 'needs_context'
+
+        # _finish_claim then falls through to structure analysis
+        checker._check_with_all_apis = lambda claim, deadline: result
+        final = checker._finish_claim('The unemployment rate fell to 3.5 percent in 2019', None, None)
+        assert final['explanation'] != NEWS_RESULT['explanation']
+        assert final['verdict'] == 'needs_context'
+    finally:
+        checker.close()
+
+
+def test_known_verdict_wins_over_evidence():
+    checker = ComprehensiveFactChecker(_Config())
+    try:
+        rated = {'found': True, 'source': 'Google Fact Check', 'verdict': 'Mostly False',
+                 'explanation': 'Rated by PolitiFact', 'confidence': 40}
+        result = checker._synthesize_api_results([dict(NEWS_RESULT, confidence=90), rated])
+        assert result['verdict'] == 'mostly_false'
+        assert result['sources'][0] == 'Google Fact Check'
+    finally:
+        checker.close()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Analysis worker for the shared job queue
+Run with `python -m worker` alongside web processes started with JOB_EXECUTION_MODE=queue
+"""
+
+import logging
+import signal
+import sys
+import threading
+import time
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisWorker:
+    """
+    Feeds jobs from the shared queue to this process's worker pool.
+
+    A job is only taken when a pool worker is free, so jobs this process
+    can't start yet stay in the shared queue for other workers.
+    """
+
+    def __init__(self, queue, scheduler, storage, run_job, poll_timeout: float = 5):
+        self.queue = queue
+        self.scheduler = scheduler
+        self.storage = storage
+        self.run_job = run_job
+        self.poll_timeout = poll_timeout
+        self._stop = threading.Event()
+
+    def run(self) -> None:
+        """Take and start jobs until stop() is called"""
+        logger.info(f"Worker started with {self.scheduler.num_workers} job slots")
+        while not self._stop.is_set():
+            if self.scheduler.available_slots() == 0:
+                self._stop.wait(0.5)
+                continue
+
+            job_id = self.queue.get(timeout=self.poll_timeout)
+            if job_id is None:
+                continue
+
+            # Mark the job alive at once so recovery doesn't see it as orphaned
+            self.storage.update_job(job_id, {'heartbeat_at': time.time()})
+            self.scheduler.submit(job_id, self.run_job, job_id)
+            logger.info(f"Started job {job_id}")
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def main() -> int:
+    if Config.JOB_EXECUTION_MODE != 'queue':
+        logger.error("JOB_EXECUTION_MODE must be 'queue' for the web app to hand jobs to workers")
+        return 1
+
+    if Config.JOB_QUEUE_TYPE == 'memory' or (Config.JOB_QUEUE_TYPE == 'redis' and not Config.REDIS_URL) \
+            or (Config.JOB_QUEUE_TYPE == 'sqlite' and not Config.JOB_QUEUE_DB_PATH):
+        logger.error("Workers need a shared job queue: set JOB_QUEUE_TYPE=redis (with REDIS_URL) "
+                     "or sqlite (with JOB_QUEUE_DB_PATH)")
+        return 1
+
+    # The web app module owns the analysis pipeline and the shared services
+    import app as web
+
+    worker = AnalysisWorker(web.job_queue, web.job_scheduler, web.job_storage, web.run_queued_job)
+
+    def handle_signal(signum, frame):
+        logger.info(f"Received signal {signum}, finishing running jobs")
+        worker.stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    worker.run()
+    web.job_scheduler.shutdown(wait=True)
+    logger.info("Worker stopped")
+    return 0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format=Config.LOG_FORMAT)
+    sys.exit(main())